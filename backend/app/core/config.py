@@ -48,6 +48,10 @@ class Settings(BaseSettings):
     OPENAI_MODEL: str = "gpt-4"
     GROQ_MODEL: str = "llama-3.1-70b-versatile"
     ENABLE_SCORING: bool = True
+    LLM_MAX_CONCURRENCY: int = 0  # Resumes parse_batch_resumes sends to the LLM at once (0 = 20 with LLM_*_PER_MIN set, else 3)
+    LLM_REQUESTS_PER_MIN: int = 0  # Provider request quota the parser paces itself to (0 = unlimited)
+    LLM_TOKENS_PER_MIN: int = 0  # Provider token quota the parser paces itself to (0 = unlimited)
+    LLM_TIMEOUT: float = 60.0  # Seconds before a single chat completion is abandoned
 
     # Parser Configuration
     PARSER_USE_ORCHESTRATOR: bool = False  # Deprecated: Use rule-based orchestrator
@@ -57,12 +61,31 @@ class Settings(BaseSettings):
     PARSER_ENABLE_OCR: bool = True
     PARSER_ENABLE_NER: bool = True
     PARSER_MAX_OCR_PAGES: int = 2
+    PARSER_MAX_PDF_PAGES: int = 8  # Pages read from a PDF by the rule-based parsers (0 = no cap)
     PARSER_LOW_TEXT_THRESHOLD: float = 0.02
+    # Remote JSON sources for the rule-based parser's runtime config (unset = empty defaults)
+    PARSER_SKILLS_GAZETTEER_URL: Optional[str] = None
+    PARSER_ALIASES_URL: Optional[str] = None
+    PARSER_SECTION_RULES_URL: Optional[str] = None
+    PARSER_DOMAIN_PACK_URL: Optional[str] = None
     PARSER_MIN_SKILL_CONF: float = 0.6
     PARSER_LLM_FAST_MODE: bool = False  # Use comprehensive mode for better accuracy
     PARSER_ENHANCED_PROMPTS: bool = True  # Use enhanced NLP prompts for better extraction
     PARSER_TEXT_LIMIT: int = 6000  # Maximum text length to send to AI (configurable)
+    PARSER_MAX_INPUT_TOKENS: int = 0  # Token budget for resume text sent to AI, measured with tiktoken (0 = use PARSER_TEXT_LIMIT chars)
+    PARSER_ADAPTIVE_MAX_TOKENS: bool = False  # Scale the completion budget with the resume's size instead of reserving the full ceiling
     PARSER_MAX_SKILLS: int = 25  # Maximum number of skills to extract (configurable)
+    PARSER_PROCESS_WORKERS: int = 0  # Size of each process's parser pool (0 = 2, capped at os.cpu_count()); see gunicorn.conf.py
+    PARSER_EXTRACT_CONCURRENCY: int = 0  # Files extracted at once by extract_many (0 = twice the pool size)
+    PARSER_USE_PYMUPDF: bool = False  # Try PyMuPDF first when it is installed; opt-in because PyMuPDF is AGPL-licensed
+    PARSER_PDF_BACKEND: str = ""  # Restrict PDF extraction to one engine (pymupdf|pdfium|pdfplumber|pypdf2); empty = full cascade
+    PARSER_RESULT_CACHE_TTL: int = 86400  # Redis TTL for parse results keyed by extracted text (0 disables)
+    PARSER_STRICT_JSON_SCHEMA: bool = True  # OpenAI only: enforce the parse response shape with a strict json_schema
+    PARSER_CONTACT_FAST_PATH: bool = True  # Match name/email/phone locally and ask the LLM for sections (plus location) only; applies only when PARSER_LLM_FAST_MODE is on, or to PARSER_RULE_FAST_PATH
+    PARSER_CONTACT_FAST_PATH_MAX_TOKENS: int = 1500  # Completion budget when contact fields were matched locally
+    PARSER_RULE_FAST_PATH: bool = False  # Skip the LLM for resumes with local contact matches and clear section headings
+    KEEP_RAW_TEXT_IN_RESULT: bool = True  # Embed extracted text in parse results (scoring/indexing read it); False keeps only raw_text_sha256
+    RAW_TEXT_RESULT_LIMIT: int = 0  # Cap on the raw_text embedded in parse results (0 = all extracted text, itself cut at max(10000 chars, the PARSER_TEXT_LIMIT/PARSER_MAX_INPUT_TOKENS budget), not the whole document); the uncut extracted text stays in the side cache
     LOG_AI_RESPONSES: bool = True  # Log AI responses to terminal for debugging
     SCORING_TEMPERATURE: float = 0.2
     SCORING_MAX_TOKENS: int = 1200
@@ -7,6 +7,11 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 def json_log(message: str, **kwargs):
     """Simple JSON logging function that prints to stdout"""
@@ -15,7 +20,10 @@ def json_log(message: str, **kwargs):
         "message": message,
     }
     log_entry.update(kwargs)
-    print(json.dumps(log_entry, ensure_ascii=False, default=str))
+    if orjson is not None:
+        print(orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"))
+    else:
+        print(json.dumps(log_entry, ensure_ascii=False, default=str))
 
 
 def setup_json_logging(log_level: str = "INFO", enable_file_logging: bool = True):
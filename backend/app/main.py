@@ -2,6 +2,7 @@
 Resume Screener FastAPI Application
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
@@ -13,6 +14,8 @@ from app.api.api import api_router
 from app.core.config import settings
 from app.core.database import close_mongo_connection, init_database
 from app.core.json_logging import setup_json_logging
+from app.services.parser_config import get_parser_config_provider
+from app.services.parser_utils import close_llm_http_client, enable_shared_llm_http_client
 
 
 @asynccontextmanager
@@ -23,6 +26,10 @@ async def lifespan(app: FastAPI):
     # Startup
     try:
         await init_database()
+        # Parsers created per request share one keep-alive LLM pool on this loop
+        enable_shared_llm_http_client()
+        # Prefetch parser gazetteers/rules concurrently and keep them warm in the background
+        config_refresh = get_parser_config_provider().start_background_refresh()
         json_log("Application startup completed successfully",
                 level="INFO", event_type="application_lifecycle", event="startup_success")
     except Exception as e:
@@ -35,6 +42,13 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     try:
+        if config_refresh is not None:
+            config_refresh.cancel()
+            try:
+                await config_refresh
+            except asyncio.CancelledError:
+                pass
+        await close_llm_http_client()
         await close_mongo_connection()
         json_log("Application shutdown completed successfully",
                 level="INFO", event_type="application_lifecycle", event="shutdown_success")
@@ -4,7 +4,12 @@ from typing import Any, Dict, List
 import re
 from datetime import datetime
 
-# Very lightweight tech dictionary to augment parsed skills (no external deps)
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover
+    ahocorasick = None  # type: ignore
+
+# Very lightweight tech dictionary to augment parsed skills (scanned with pyahocorasick when installed)
 TECH_TERMS = {
     # languages
     "python", "java", "javascript", "typescript", "go", "ruby", "c#", "c++", "sql",
@@ -17,6 +22,21 @@ TECH_TERMS = {
 }
 
 LOCATION_WORDS = {"kerala", "india", "calicut", "kochi", "wayanad", "bangalore", "mumbai", "delhi"}
+
+
+def _build_tech_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in TECH_TERMS:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+# All TECH_TERMS found in one pass over the text instead of one substring scan per term
+_TECH_AUTOMATON = _build_tech_automaton()
+
 GENERIC_NON_SKILLS = {
     "experience", "applications", "tools", "concepts", "frontend", "backend",
     "languages", "frameworks", "databases", "projects", "summary",
@@ -58,9 +78,21 @@ def _augment_skills_from_raw(raw_text: str, existing: list[str]) -> list[str]:
         return existing
     found: list[str] = []
     low = raw_text.lower()
-    for term in TECH_TERMS:
-        if term in low:
-            found.append(term.title() if term.islower() else term)
+    # Both paths find the same substrings and order them by where each first starts in the text,
+    # so the result does not depend on whether pyahocorasick is installed
+    first_start: Dict[str, int] = {}
+    if _TECH_AUTOMATON is not None:
+        # Matches arrive by end index, so the first one seen per term is its earliest occurrence
+        for end, term in _TECH_AUTOMATON.iter(low):
+            first_start.setdefault(term, end - len(term) + 1)
+    else:
+        for term in TECH_TERMS:
+            start = low.find(term)
+            if start >= 0:
+                first_start[term] = start
+    # Terms starting together ("react", "react.js") go shortest first, as the automaton reports them
+    for term in sorted(first_start, key=lambda term: (first_start[term], len(term))):
+        found.append(term.title() if term.islower() else term)
     merged = list(dict.fromkeys((existing or []) + found))
     return merged
 
@@ -3,11 +3,34 @@ GROQ AI service for resume analysis and candidate matching
 """
 
 import json
+import re
 from typing import Any, Dict, List, Optional
 
 from groq import Groq
 
 from app.core.config import settings
+from app.services.parser_utils import json_loads
+
+# Outermost {...} span of a model reply, compiled once instead of on every response
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Skills recognised by the mock extractor, paired with their lowercase form
+_MOCK_SKILLS = tuple(
+    (skill, skill.lower())
+    for skill in (
+        "Python",
+        "JavaScript",
+        "React",
+        "Node.js",
+        "SQL",
+        "Git",
+        "AWS",
+        "Docker",
+        "MongoDB",
+        "PostgreSQL",
+        "REST API",
+    )
+)
 
 
 class GroqAIService:
@@ -164,7 +187,7 @@ class GroqAIService:
 
             skills_text = response.choices[0].message.content.strip()
             try:
-                skills = json.loads(skills_text)
+                skills = json_loads(skills_text)
                 return skills if isinstance(skills, list) else []
             except json.JSONDecodeError:
                 return self._mock_skill_extraction(text)
@@ -354,24 +377,8 @@ class GroqAIService:
 
     def _mock_skill_extraction(self, text: str) -> List[str]:
         """Mock skill extraction for development"""
-        common_skills = [
-            "Python",
-            "JavaScript",
-            "React",
-            "Node.js",
-            "SQL",
-            "Git",
-            "AWS",
-            "Docker",
-            "MongoDB",
-            "PostgreSQL",
-            "REST API",
-        ]
-        found_skills = []
         text_lower = text.lower()
-        for skill in common_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
+        found_skills = [skill for skill, skill_lower in _MOCK_SKILLS if skill_lower in text_lower]
 
         return found_skills[:10]  # Return top 10 skills
 
@@ -379,11 +386,9 @@ class GroqAIService:
         """Parse AI analysis response"""
         try:
             # Try to extract JSON from the response
-            import re
-
-            json_match = re.search(r"\{.*\}", analysis_text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(analysis_text)
             if json_match:
-                return json.loads(json_match.group())
+                return json_loads(json_match.group())
             else:
                 # Fallback to mock if parsing fails
                 return self._mock_resume_analysis({})
@@ -394,11 +399,9 @@ class GroqAIService:
         """Parse AI match score response"""
         try:
             # Try to extract JSON from the response
-            import re
-
-            json_match = re.search(r"\{.*\}", analysis_text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(analysis_text)
             if json_match:
-                return json.loads(json_match.group())
+                return json_loads(json_match.group())
             else:
                 # Fallback to mock if parsing fails
                 return self._mock_job_match_score({}, [])
@@ -3,59 +3,545 @@ LLM-based Universal Resume Parser
 Uses contextual analysis without hardcoded extraction rules
 """
 
+import asyncio
+import codecs
+import io
 import json
 import os
 import time
 import hashlib
+import importlib
+import zipfile
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate, chain, dropwhile, takewhile
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
-import aiofiles
-import pdfplumber
-import PyPDF2
-from docx import Document
 from loguru import logger
 
+try:
+    import ahocorasick  # pyahocorasick: one pass over the text for every fallback keyword
+except Exception:  # pragma: no cover
+    ahocorasick = None  # type: ignore
+
+try:
+    from lxml import etree  # installed with python-docx; used to stream document.xml without building the DOM
+except Exception:  # pragma: no cover
+    etree = None  # type: ignore
+
+try:
+    from cachetools import LRUCache, TTLCache
+except Exception:  # pragma: no cover
+    LRUCache = TTLCache = None  # type: ignore
+
+try:
+    import tiktoken  # exact token counts for PARSER_MAX_INPUT_TOKENS
+except Exception:  # pragma: no cover
+    tiktoken = None  # type: ignore
+
 from app.core.config import settings
+from app.core.json_logging import log_parsed_resume
+from app.services.parser_cache import get_cached_result, result_cache_key, set_cached_result
+from app.services.parser_config import get_parser_config_provider
+from app.services.parser_prompts import (
+    BASIC_STRUCTURED_PROMPT_PARTS,
+    ENHANCED_NLP_SECTIONS_SYSTEM_PROMPT,
+    ENHANCED_NLP_SYSTEM_PROMPT,
+    ENHANCED_NLP_USER_PROMPT,
+    ENHANCED_NLP_USER_PROMPT_PARTS,
+    FAST_PROMPT_PARTS,
+    MINIMAL_JSON_PROMPT_PARTS,
+    ULTRA_SIMPLE_PROMPT_PARTS,
+    UNIVERSAL_PROMPT_SEGMENTS,
+    render_prompt,
+)
+from app.services.parser_rate_limit import get_llm_rate_limiter
+from app.services.parser_schema import LLM_RESUME_RESPONSE_FORMAT, LLM_RESUME_SECTIONS_RESPONSE_FORMAT
+from app.services.parser_utils import (
+    compress_text,
+    decompress_text,
+    get_llm_http_client,
+    is_probable_location,
+    json_dumpb,
+    json_dumps,
+    json_loads,
+    parser_pool_size,
+    run_in_parser_pool,
+)
+
+# Prompts only use the first few thousand characters, so extractors stop reading
+# once this much text has been accumulated (avoids parsing long appendices).
+# A larger PARSER_TEXT_LIMIT / PARSER_MAX_INPUT_TOKENS raises the cap per parser
+_TEXT_BUDGET_CHARS = 10000
+
+_SUPPORTED_FORMATS = frozenset({".pdf", ".docx", ".doc", ".txt"})
+_MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".doc": "application/msword",
+    ".txt": "text/plain"
+}
+
+
+# Recently parsed texts keyed by raw_text_sha256, for results that omit raw_text (stored compressed)
+_RAW_TEXT_CACHE: Dict[str, bytes] = LRUCache(maxsize=256) if LRUCache is not None else {}
+
+
+def get_cached_raw_text(raw_text_sha256: str) -> Optional[str]:
+    """Look up the extracted text of a recent parse by its raw_text_sha256 handle"""
+    blob = _RAW_TEXT_CACHE.get(raw_text_sha256)
+    return decompress_text(blob) if blob is not None else None
+
+
+# Extracted text keyed by file content (or path + mtime + size), so re-submitted resumes skip
+# extraction (stored compressed)
+_EXTRACTED_TEXT_CACHE: Dict[Tuple, bytes] = LRUCache(maxsize=256) if LRUCache is not None else {}
+
+# Whole parse results keyed by upload bytes (plus prompt version, model and the settings that shape
+# the parse), so a re-uploaded file skips extraction, text hashing and the Redis round-trip (stored
+# compressed). Entries expire with PARSER_RESULT_CACHE_TTL like the Redis results
+_CONTENT_RESULT_CACHE: Optional[Dict[Tuple, bytes]] = (
+    TTLCache(maxsize=128, ttl=max(int(getattr(settings, "PARSER_RESULT_CACHE_TTL", 86400) or 0), 1))
+    if TTLCache is not None else None
+)
+
+
+# Chat request constants shared by every completion; the SDKs only read them
+_JSON_MODE = {"type": "json_object"}
+_SYS_FAST = "Extract resume data quickly and accurately. Return only JSON."
+_SYS_FULL = "You are an expert resume parser. Analyze the provided resume text using contextual understanding without relying on hardcoded patterns. Return ONLY valid JSON that matches the specified schema."
+# System messages keyed by (fast_mode, include_contact); the static schema precedes the resume text
+_ENHANCED_SYSTEM = {
+    (fast, include_contact): {
+        "role": "system",
+        "content": f"{_SYS_FAST if fast else _SYS_FULL}\n\n"
+                   f"{ENHANCED_NLP_SYSTEM_PROMPT if include_contact else ENHANCED_NLP_SECTIONS_SYSTEM_PROMPT}",
+    }
+    for fast in (True, False)
+    for include_contact in (True, False)
+}
+_SYS_RETRY = {"role": "system", "content": "You are a resume parser. Extract key information and return valid JSON only."}
+
+# Only full LLM parses are cached; nlp_retry_* and empty results are degraded output
+_CACHEABLE_PROCESSING_MODE = "llm_universal"
+
+# Timestamp shared by every helper within one parse; set by _parse_common and the offline batch
+_PARSE_NOW: ContextVar[Optional[str]] = ContextVar("_PARSE_NOW", default=None)
+
+
+def _now_iso() -> str:
+    return _PARSE_NOW.get() or datetime.now(timezone.utc).isoformat()
+
+
+# Deterministic contact matchers; when these find name/email/phone the LLM is only asked for sections
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+PHONE_RE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+LINKEDIN_RE = re.compile(r"(?:https?://)?(?:[\w]+\.)?linkedin\.com/in/[\w-]+/?", re.IGNORECASE)
+_NAME_LINE_RE = re.compile(r"^[A-Z][A-Za-z.'-]+(?: [A-Z][A-Za-z.'-]+){1,3}$")
+# Title-case words that top a resume (document titles, job titles) but are not part of a person's name
+_NOT_NAME_WORDS = frozenset({
+    "resume", "cv", "curriculum", "vitae", "biodata", "profile", "of", "for",
+    "software", "data", "senior", "engineer", "developer", "programmer", "manager", "analyst",
+    "designer", "consultant", "architect", "scientist", "specialist", "administrator", "director",
+    "officer", "executive", "assistant", "associate", "coordinator", "technician", "intern",
+})
+
+# Single-pass normalisation of extraction noise before whitespace collapsing in _clean_extracted_text
+_CLEAN_TABLE = str.maketrans({
+    "\x00": None, "\xa0": " ",
+    "\u2013": "-", "\u2014": "-",
+    "\u2018": "'", "\u2019": "'",
+    "\u201c": '"', "\u201d": '"',
+})
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Delimiters for the free-text skills block logged by _log_parsed_data
+_SKILL_SPLIT = re.compile(r"[,;\n]+")
+
+# Common PDF extraction artifacts. Single characters are a set lookup; only the
+# letter-shape patterns need the regex engine, fused into one alternation that
+# stops at the first hit. Stdlib re, not re2: \b must be Unicode-aware on accented text.
+_ARTIFACT_CHARS = frozenset(
+    "ÁµàáéíóúÀÈÌÒÙâêîôûäëïöüÿñç"  # Accented/special chars often from PDF
+    "¹²³⁴⁵⁶⁷⁸⁹⁰"  # Superscript numbers
+    "•◦▪▫■□●○"  # Various bullet point symbols
+)
+_ARTIFACT_SHAPE_RE = re.compile('|'.join((
+    r'\b[SN]\s+[A-Z]',  # Single letters followed by words (S Languages, N Tools)
+    r'\b[A-Z]\s*$',  # Single capital letters at end of lines
+)))
+
+
+def _has_artifacts(text: str) -> bool:
+    return not _ARTIFACT_CHARS.isdisjoint(text) or _ARTIFACT_SHAPE_RE.search(text) is not None
+
+
+def _clean_text(raw_text: str) -> Tuple[str, bool]:
+    # Minimal cleaning - only remove obvious noise, let NLP handle the rest
+    text = raw_text.translate(_CLEAN_TABLE)
+
+    # Collapse all whitespace, line breaks included, to single spaces
+    cleaned_text = _WHITESPACE_RE.sub(' ', text).strip()
+
+    # Skip single character artifacts - let NLP decide if anything longer is meaningful
+    if len(cleaned_text) <= 1:
+        return "", False
+
+    return cleaned_text, _has_artifacts(cleaned_text)
+
+
+def clean_batch(texts: List[str]) -> List[Tuple[str, bool]]:
+    """
+    Clean many extracted texts in one go, as _clean_text does for one.
+    Uses pandas vectorised string ops when available so the per-document work runs in bulk.
+    """
+    try:
+        import pandas as pd
+    except Exception:
+        return [_clean_text(text) for text in texts]
+
+    if not texts:
+        return []
+    series = pd.Series(texts, dtype=object)
+    cleaned = series.str.translate(_CLEAN_TABLE).str.replace(_WHITESPACE_RE, ' ', regex=True).str.strip()
+    cleaned = cleaned.where(cleaned.str.len() > 1, "")
+    return [(text, bool(text) and _has_artifacts(text)) for text in cleaned.tolist()]
+
+
+_ARTIFACT_INSTRUCTION = """
+[INSTRUCTION: This text may contain PDF extraction artifacts like special characters (Á, µ, à, ¹, ², ³),
+formatting symbols (S, N), or broken spacing. Please interpret the content contextually and extract
+meaningful information while ignoring obvious formatting artifacts.]
+
+"""
+
+# Changes whenever the enhanced prompts, response schema or the normalisation applied to the resume
+# text before it reaches the prompt change, so cached results from older prompt input are not reused
+_PROMPT_VERSION = hashlib.blake2b(
+    json.dumps([[m["content"] for m in _ENHANCED_SYSTEM.values()], ENHANCED_NLP_USER_PROMPT,
+                LLM_RESUME_RESPONSE_FORMAT, LLM_RESUME_SECTIONS_RESPONSE_FORMAT,
+                sorted(_CLEAN_TABLE.items()), _WHITESPACE_RE.pattern, _ARTIFACT_INSTRUCTION],
+               sort_keys=True).encode("utf-8"),
+    digest_size=6,
+).hexdigest()
+
+# Skill tokenisation and heuristics
+# (delimiters are mapped to a unit-separator pivot so a single C-level str.split does the work)
+_SKILL_DELIM = '\x1f'
+_SKILL_BLOCK_DELIM_TRANS = str.maketrans(dict.fromkeys(',;•\n\r\t', _SKILL_DELIM))
+_SKILL_PART_DELIM_TRANS = str.maketrans(dict.fromkeys(',;|•-\n\r\t', _SKILL_DELIM))
+_LEADING_BULLET_RE = re.compile(r'^[-•\s]+')
+_TRAILING_BULLET_RE = re.compile(r'[-•\s]+$')
+_SKILL_INDICATOR_RES = (
+    re.compile(r'(?:skills?|technologies?|tools?|languages?|frameworks?)[:\s]*(.+)', re.IGNORECASE),
+    re.compile(r'(?:proficient|experienced|familiar)\s+(?:in|with)[:\s]*(.+)', re.IGNORECASE),
+    re.compile(r'(?:•|-)[\s]*([A-Za-z][A-Za-z0-9\s\+\#\.\-]{1,30})', re.IGNORECASE),  # Bullet points
+    re.compile(r'([A-Za-z][A-Za-z0-9\+\#\.\-]{2,20})(?:\s*[,;|]|\s*$)', re.IGNORECASE),  # Comma/semicolon separated
+)
+# Skill-like token shapes, fused so each candidate costs one anchored match instead of five
+_SKILL_SHAPE_RE = re.compile('^(?:' + '|'.join((
+    r'[A-Z][a-z]+(?:\.[a-z]+)*',  # CamelCase or dotted (e.g., Node.js)
+    r'[A-Z]{2,}',  # Acronyms (e.g., SQL, AWS, API)
+    r'[A-Za-z]+[\+\#]',  # Languages with symbols (e.g., C++, C#)
+    r'[A-Za-z]+\s+[A-Za-z]+',  # Two words (e.g., Machine Learning)
+    r'[A-Za-z]+[-_][A-Za-z]+',  # Hyphenated/underscored (e.g., React-Native)
+)) + ')$')
+_YEAR_RE = re.compile(r'\d{4}')
+_BRACKET_TRANS = str.maketrans('', '', '()[]{}')
+_SKILL_STOPWORDS = frozenset({'the', 'and', 'or', 'with', 'for', 'in', 'at', 'on'})
+
+# Line classifiers for the fallback extractors
+_COMPANY_LINE_RE = re.compile(r'^[A-Z\s&]+$')
+_DATE_RE = re.compile(r'(?i)\d{4}|\d{2}/\d{4}|present|current')
+_GRAD_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_GRADE_RE = re.compile(r'(?i)\b(gpa|cgpa|percentage|%)\b')
+_CONTACT_LINE_RE = re.compile(r'@|phone|\+\d')
+
+# Whole-word keyword categories used by the fallback extractors' section state machines.
+# Matched in one Aho-Corasick pass when pyahocorasick is installed, else by looking up each
+# line's word tokens in _KEYWORD_CATEGORIES_BY_WORD.
+_KEYWORD_CATEGORY_WORDS = {
+    "experience_heading": ("experience", "work", "employment", "career"),
+    "after_experience": ("education", "projects", "skills", "certifications"),
+    "job_title": ("developer", "engineer", "manager", "analyst", "consultant", "intern", "trainee"),
+    "education_heading": ("education", "academic", "qualification", "degree"),
+    "after_education": ("experience", "projects", "skills", "certifications"),
+    "degree": ("bachelor", "master", "phd", "diploma", "certificate", "btech", "b.tech", "mtech", "m.tech",
+               "bcom", "b.com", "mcom", "m.com", "bca", "mca"),
+    "institution": ("college", "university", "institute", "school"),
+    "summary_heading": ("summary", "objective", "profile", "about"),
+    "after_summary": ("experience", "education", "skills", "projects"),
+    "summary_cue": ("developer", "engineer", "experienced", "passionate", "skilled"),
+}
+
+
+def _keyword_categories_by_word() -> Dict[str, FrozenSet[str]]:
+    categories_by_word: Dict[str, set] = {}
+    for category, words in _KEYWORD_CATEGORY_WORDS.items():
+        for word in words:
+            categories_by_word.setdefault(word, set()).add(category)
+    return {word: frozenset(categories) for word, categories in categories_by_word.items()}
+
+
+_KEYWORD_CATEGORIES_BY_WORD = _keyword_categories_by_word()
+# Plain words, plus dotted pairs for keywords such as "b.tech"
+_WORD_TOKEN_RE = re.compile(r"\w+")
+_DOTTED_TOKEN_RE = re.compile(r"\w+\.\w+")
+
+
+def _build_keyword_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word, categories in _KEYWORD_CATEGORIES_BY_WORD.items():
+        automaton.add_word(word, (len(word), categories))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _token_keyword_categories(lowered_line: str) -> FrozenSet[str]:
+    categories: set = set()
+    for token in {*_WORD_TOKEN_RE.findall(lowered_line), *_DOTTED_TOKEN_RE.findall(lowered_line)}:
+        hit = _KEYWORD_CATEGORIES_BY_WORD.get(token)
+        if hit:
+            categories |= hit
+    return frozenset(categories)
+
+
+def _line_keyword_categories(lines: List[str]) -> List[FrozenSet[str]]:
+    """Keyword categories found on each line, from a single scan over all lines"""
+    if _KEYWORD_AUTOMATON is None:
+        return [_token_keyword_categories(line.lower()) for line in lines]
+
+    lowered = [line.lower() for line in lines]
+    text = "\n".join(lowered)
+    line_starts = list(accumulate((len(line) + 1 for line in lowered[:-1]), initial=0))
+    hits: List[set] = [set() for _ in lines]
+    for end, (length, categories) in _KEYWORD_AUTOMATON.iter(text):
+        start = end - length + 1
+        # Whole words only, matching the token path
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        hits[bisect_right(line_starts, start) - 1].update(categories)
+    return [frozenset(h) for h in hits]
+
+
+@dataclass(frozen=True)
+class _ParsedLines:
+    """Stripped lines of one resume and their keyword categories, shared by every fallback extractor"""
+    lines: List[str]
+    hits: List[FrozenSet[str]]
+
+
+def _section_rows(parsed: _ParsedLines, heading: str, next_section: str) -> Iterator[Tuple[str, FrozenSet[str]]]:
+    """Lazily yield the non-empty (line, hits) rows after the first `heading` line, up to the next `next_section` line"""
+    rows = dropwhile(lambda row: heading not in row[1], zip(parsed.lines, parsed.hits))
+    rows = takewhile(lambda row: heading in row[1] or next_section not in row[1], rows)
+    return ((line, hits) for line, hits in rows if line and heading not in hits)
+
+
+@dataclass(slots=True)
+class _JobEntry:
+    """Experience entry being assembled by the fallback extractor; converted to a dict on return"""
+    title: str = ""
+    company: str = ""
+    duration: str = ""
+    description: str = ""
+    technologies: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _EducationEntry:
+    """Education entry being assembled by the fallback extractor; converted to a dict on return"""
+    degree: str = ""
+    institution: str = ""
+    year: str = ""
+    details: str = ""
+
+
+def _preprocess_lines(raw_text: str) -> _ParsedLines:
+    """Split, strip and keyword-scan the text once so the fallback extractors don't each re-scan it"""
+    lines = [line.strip() for line in raw_text.split('\n')]
+    return _ParsedLines(lines, _line_keyword_categories(lines))
+
+
+def _section_text(sections: Dict[str, Any], name: str) -> str:
+    """Text of an old-format section, given either as {"raw_block": ...} or as a plain string"""
+    section = sections.get(name)
+    if isinstance(section, dict):
+        return section.get("raw_block", "")
+    return str(section) if section else ""
+
+
+def _legacy_contact_from_info(contact_info: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": contact_info.get("name", ""),
+        "email": contact_info.get("email", ""),
+        "phone": contact_info.get("phone", ""),
+        "location": contact_info.get("location", ""),
+        "linkedin": contact_info.get("linkedin", "")
+    }
+
+
+def _legacy_contact_from_cluster(contact_cluster: Dict[str, Any]) -> Dict[str, Any]:
+    # Extract emails and phones as single values (not lists) for legacy compatibility
+    emails = contact_cluster.get("email_texts", {}).get("values", [])
+    phones = contact_cluster.get("phone_texts", {}).get("values", [])
+    return {
+        "name": contact_cluster.get("name_text", {}).get("value", ""),
+        "email": emails[0] if emails else "",  # Take first email as string
+        "phone": phones[0] if phones else "",  # Take first phone as string
+        "location": contact_cluster.get("location_text", {}).get("value", ""),
+        "links": contact_cluster.get("link_texts", {}).get("values", [])
+    }
+
+
+def _legacy_experience(entries: List[Any]) -> List[Dict[str, Any]]:
+    return [{
+        "title": exp.get("title", ""),
+        "company": exp.get("company", ""),
+        "duration": exp.get("duration", ""),
+        "description": exp.get("description", ""),
+        "technologies": exp.get("technologies", [])
+    } for exp in entries if isinstance(exp, dict)]
+
+
+def _legacy_education(entries: List[Any]) -> List[Dict[str, Any]]:
+    return [{
+        "degree": edu.get("degree", ""),
+        "institution": edu.get("institution", ""),
+        "year": edu.get("year", ""),
+        "details": edu.get("details", "")
+    } for edu in entries if isinstance(edu, dict)]
+
+
+# Whole-line headings the rule fast path counts; a resume needs _FAST_PATH_MIN_SECTIONS of them
+_FAST_PATH_HEADINGS = frozenset({
+    "summary", "professional summary", "profile", "objective", "about me",
+    "experience", "work experience", "professional experience", "employment history",
+    "education", "academic background", "skills", "technical skills", "key skills",
+    "projects", "certifications", "languages",
+})
+_FAST_PATH_MIN_SECTIONS = 3
+
+
+# (field, converter for the enhanced top-level value, old-format section holding a raw block)
+_LEGACY_ENTRY_FIELDS = (
+    ("experience", _legacy_experience, "experience_like"),
+    ("education", _legacy_education, "education_like"),
+    ("projects", lambda projects: projects, "projects_like"),
+)
+
+# Old-format other_blocks label substrings and the legacy list each routes to; first match wins
+_OTHER_BLOCK_LABEL_MAP = (("cert", "certifications"), ("license", "certifications"), ("lang", "languages"))
 
 
 class LLMResumeParser:
     """Universal resume parser using LLM contextual analysis"""
 
     def __init__(self):
-        self.supported_formats = [".pdf", ".docx", ".doc", ".txt"]
+        self.supported_formats = _SUPPORTED_FORMATS
+        # Extension -> extractor; entries can be swapped per instance to change a format's backend
+        self._path_extractors = {
+            ".pdf": self._extract_pdf_text,
+            ".docx": self._extract_docx_text,
+            ".doc": self._extract_docx_text,
+            ".txt": self._extract_txt_text,
+        }
+        self._memory_extractors = {
+            ".pdf": self._extract_pdf_text_from_memory,
+            ".docx": self._extract_docx_text_from_memory,
+            ".doc": self._extract_docx_text_from_memory,
+            ".txt": self._extract_txt_text_from_memory,
+        }
         
         # Initialize LLM client based on configuration
         self.llm_client = None
+        self._chat_fn = None
+        self.llm_timeout = float(getattr(settings, "LLM_TIMEOUT", 60.0) or 60.0)
         self._init_llm_client()
+        self._rate_limiter = get_llm_rate_limiter()
+
+        # Snapshot parser settings once; these are read on every parse
+        self.fast_mode = bool(getattr(settings, "PARSER_LLM_FAST_MODE", True))
+        self.log_responses = bool(getattr(settings, "LOG_AI_RESPONSES", True))
+        self.max_tokens_fast = 2000
+        self.max_tokens_full = 4000
+        self.contact_fast_path = bool(getattr(settings, "PARSER_CONTACT_FAST_PATH", True))
+        self.contact_fast_path_max_tokens = int(getattr(settings, "PARSER_CONTACT_FAST_PATH_MAX_TOKENS", 1500))
+        self.rule_fast_path = bool(getattr(settings, "PARSER_RULE_FAST_PATH", False))
+        self.enable_ner = bool(getattr(settings, "PARSER_ENABLE_NER", True))
+        self.text_limit = int(getattr(settings, "PARSER_TEXT_LIMIT", 6000))
+        self.max_input_tokens = int(getattr(settings, "PARSER_MAX_INPUT_TOKENS", 0) or 0)
+        # Extraction has to read at least as far as the prompt budget reaches, or raising it has no effect
+        self.extract_chars = max(_TEXT_BUDGET_CHARS, self._prompt_char_limit())
+        self.adaptive_max_tokens = bool(getattr(settings, "PARSER_ADAPTIVE_MAX_TOKENS", False))
+        self.max_skills = int(getattr(settings, "PARSER_MAX_SKILLS", 25))
+        self.strict_json_schema = bool(getattr(settings, "PARSER_STRICT_JSON_SCHEMA", True))
+        self.extract_concurrency = int(getattr(settings, "PARSER_EXTRACT_CONCURRENCY", 0) or 0) or 2 * parser_pool_size()
+        self.result_cache_ttl = int(getattr(settings, "PARSER_RESULT_CACHE_TTL", 86400) or 0)
+        # Running wide is only safe when the rate limiter paces calls; without quotas keep the old width of 3
+        self.llm_concurrency = (int(getattr(settings, "LLM_MAX_CONCURRENCY", 0) or 0)
+                                or (20 if self._rate_limiter.enabled else 3))
+        self.keep_raw_text = bool(getattr(settings, "KEEP_RAW_TEXT_IN_RESULT", True))
+        self.raw_text_limit = int(getattr(settings, "RAW_TEXT_RESULT_LIMIT", 0) or 0)
 
     def _init_llm_client(self):
         """Initialize the appropriate LLM client"""
         try:
             provider = getattr(settings, "PROVIDER", "openai").lower()
-            
+            # The per-loop pool is shared by every parser on the loop; only an SDK-created client is ours to close
+            http_client = get_llm_http_client(self.llm_timeout)
+            self._owns_http_client = http_client is None
+
             if provider == "openai":
-                from openai import OpenAI
+                from openai import AsyncOpenAI
                 api_key = getattr(settings, "OPENAI_API_KEY", "")
                 base_url = getattr(settings, "OPENAI_BASE_URL", None)
-                self.llm_client = OpenAI(api_key=api_key, base_url=base_url)
+                self.llm_client = AsyncOpenAI(api_key=api_key, base_url=base_url, timeout=self.llm_timeout,
+                                              http_client=http_client)
                 self.model = getattr(settings, "OPENAI_MODEL", "gpt-4o")
                 self.provider = "openai"
             elif provider == "groq":
-                from groq import Groq
+                from groq import AsyncGroq
                 api_key = getattr(settings, "GROQ_API_KEY", "")
-                self.llm_client = Groq(api_key=api_key)
+                self.llm_client = AsyncGroq(api_key=api_key, timeout=self.llm_timeout,
+                                            http_client=http_client)
                 self.model = getattr(settings, "GROQ_MODEL", "llama-3.1-70b-versatile")
                 self.provider = "groq"
             else:
                 logger.warning(f"Unsupported LLM provider: {provider}")
                 self.llm_client = None
+
+            # The async OpenAI and Groq SDKs expose the same chat.completions.create signature; the raw-response
+            # variant also returns the x-ratelimit-* headers the rate limiter follows
+            if self.llm_client is not None:
+                self._chat_fn = self.llm_client.chat.completions.with_raw_response.create
                 
         except Exception as e:
             logger.error(f"Failed to initialize LLM client: {e}")
             self.llm_client = None
 
+    async def aclose(self) -> None:
+        """Release the LLM connections this instance owns. The API's shared pool stays open for the
+        other parsers; close_llm_http_client() closes it at app shutdown"""
+        if self.llm_client is not None and getattr(self, "_owns_http_client", False):
+            await self.llm_client.close()
+
     async def parse_resume(self, file_path: str) -> Dict[str, Any]:
         """
         Parse resume using LLM contextual analysis
@@ -72,37 +558,13 @@ class LLMResumeParser:
         if file_extension not in self.supported_formats:
             raise ValueError(f"Unsupported file format: {file_extension}")
 
-        # Extract raw text
-        text_start = time.time()
-        raw_text = await self._extract_raw_text(file_path, file_extension)
-        text_time = int((time.time() - text_start) * 1000)
-        
-        if not raw_text or not raw_text.strip():
-            logger.warning(f"No text extracted from {filename}")
-            return self._create_empty_result(filename, file_extension, file_size)
-
-        logger.info(f"[llm_parser] Text extraction: {text_time}ms, {len(raw_text)} chars")
-
-        # Parse with LLM (check for fast mode setting)
-        fast_mode = getattr(settings, "PARSER_LLM_FAST_MODE", True)
-        llm_start = time.time()
-        parsed_result = await self._parse_with_llm(raw_text, filename, file_extension, file_size, fast_mode)
-        llm_time = int((time.time() - llm_start) * 1000)
-        
-        total_time = int((time.time() - start_time) * 1000)
-        logger.info(f"[llm_parser] LLM parsing: {llm_time}ms, Total: {total_time}ms")
-        
-        # Log parsed data for debugging
-        self._log_parsed_data(parsed_result, filename)
-        
-        return parsed_result
+        raw_text = await self._extract_raw_text(file_path, file_extension, self.extract_chars)
+        return await self._parse_common(raw_text, filename, file_extension, file_size, start_time)
 
     async def parse_batch_resumes(self, resume_files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Parse multiple resumes in parallel for better throughput
         """
-        import asyncio
-
         async def parse_single(file_data):
             try:
                 if 'file_path' in file_data:
@@ -121,15 +583,25 @@ class LLMResumeParser:
                     len(file_data.get('content', b''))
                 )
 
-        # Process up to 3 resumes in parallel to avoid API rate limits
-        semaphore = asyncio.Semaphore(3)
-
-        async def parse_with_semaphore(file_data):
-            async with semaphore:
-                return await parse_single(file_data)
+        # Provider rate limits are enforced per call by the token bucket in _chat, so the batch
+        # width only bounds how many resumes are in flight at once
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
 
-        tasks = [parse_with_semaphore(file_data) for file_data in resume_files]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # The slot is taken before each task is created, so a 10k-file batch holds only
+        # llm_concurrency pending parses instead of a coroutine per file up front
+        tasks = []
+        try:
+            for file_data in resume_files:
+                await semaphore.acquire()
+                task = asyncio.create_task(parse_single(file_data))
+                task.add_done_callback(lambda _task: semaphore.release())
+                tasks.append(task)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # If the caller is cancelled mid-batch, in-flight parses must not keep spending LLM quota
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
         # Handle any exceptions
         processed_results = []
@@ -142,6 +614,139 @@ class LLMResumeParser:
 
         return processed_results
 
+    async def extract_many(self, resume_files: List[Dict[str, Any]], concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract text for many resumes concurrently, in input order. Each item is a file_data dict as
+        accepted by parse_batch_resumes; each result has filename, extension, size and raw_text
+        ("" when extraction failed). Extraction is CPU-bound in the parser pool, so the default
+        concurrency keeps every pool worker busy without queueing the whole batch at once.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.extract_concurrency)
+
+        async def extract_with_semaphore(file_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._extract_entry(file_data)
+
+        return await asyncio.gather(*(extract_with_semaphore(file_data) for file_data in resume_files))
+
+    async def _extract_entry(self, file_data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            if 'file_path' in file_data:
+                file_path = file_data['file_path']
+                filename = os.path.basename(file_path)
+                file_extension = os.path.splitext(filename)[1].lower()
+                file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+                if file_extension not in self.supported_formats:
+                    raise ValueError(f"Unsupported file format: {file_extension}")
+                raw_text = await self._extract_raw_text(file_path, file_extension, self.extract_chars)
+            else:
+                filename = file_data['filename']
+                file_extension = file_data['extension']
+                file_size = len(file_data['content'])
+                if file_extension not in self.supported_formats:
+                    raise ValueError(f"Unsupported file format: {file_extension}")
+                raw_text = await self._extract_raw_text_from_memory(file_data['content'], file_extension, self.extract_chars)
+        except Exception as e:
+            logger.error(f"Failed to extract {file_data.get('filename', 'unknown')}: {e}")
+            filename = file_data.get('filename', 'unknown')
+            file_extension = file_data.get('extension', '.pdf')
+            file_size = len(file_data.get('content', b''))
+            raw_text = ""
+
+        return {"filename": filename, "extension": file_extension, "size": file_size, "raw_text": raw_text}
+
+    async def parse_batch_resumes_offline(self, resume_files: List[Dict[str, Any]], poll_s: int = 30) -> List[Dict[str, Any]]:
+        """
+        Parse many resumes through the OpenAI Batch API for offline bulk runs.
+        Batch jobs are billed at half price and bypass per-request rate limits, but may take
+        up to 24h to complete, so only use this when latency is not critical.
+        """
+        if not self.llm_client:
+            raise ValueError("LLM client is required for NLP-first parsing. No fallback available.")
+        if self.provider != "openai":
+            logger.warning(f"[llm_parser] Batch API not supported for provider {self.provider}, using online batch")
+            return await self.parse_batch_resumes(resume_files)
+
+        fast_mode = self.fast_mode
+        system_msg = _ENHANCED_SYSTEM[(fast_mode, True)]
+        max_tokens = self.max_tokens_fast if fast_mode else self.max_tokens_full
+
+        # Extract text for every resume up front; the batch request carries prompts only
+        entries = await self.extract_many(resume_files)
+        request_lines: List[bytes] = []
+
+        # Clean every extracted text in one vectorised pass, then build the requests
+        pending = [(index, entry) for index, entry in enumerate(entries) if entry["raw_text"] and entry["raw_text"].strip()]
+        cleaned = clean_batch([entry["raw_text"] for _, entry in pending])
+        for (index, entry), (cleaned_text, has_artifacts) in zip(pending, cleaned):
+            prompt = self._enhanced_user_prompt(cleaned_text, has_artifacts)
+            # custom_id must be unique within a batch; filenames are not, so key on position
+            request_lines.append(json_dumpb({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._completion_kwargs(system_msg, prompt, max_tokens, temperature=0.0,
+                                                response_format=self._response_format(include_contact=True))
+            }))
+
+        responses: Dict[str, str] = {}
+        if request_lines:
+            payload = b"\n".join(request_lines) + b"\n"
+            batch_file = await self.llm_client.files.create(file=("resume_batch.jsonl", payload), purpose="batch")
+            batch = await self.llm_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"[llm_parser] Submitted batch {batch.id} with {len(request_lines)} resumes")
+
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_s)
+                batch = await self.llm_client.batches.retrieve(batch.id)
+
+            logger.info(f"[llm_parser] Batch {batch.id} finished with status {batch.status}")
+            if batch.output_file_id:
+                # Raw bytes go straight to the decoder without an intermediate str
+                output = (await self.llm_client.files.content(batch.output_file_id)).content
+                for line in output.splitlines():
+                    if not line.strip():
+                        continue
+                    item = json_loads(line)
+                    body = (item.get("response") or {}).get("body") or {}
+                    choices = body.get("choices") or []
+                    if choices:
+                        responses[item["custom_id"]] = choices[0]["message"]["content"]
+
+        results = []
+        token = _PARSE_NOW.set(datetime.now(timezone.utc).isoformat())
+        try:
+            for index, entry in enumerate(entries):
+                filename, file_extension = entry["filename"], entry["extension"]
+                raw_text = entry["raw_text"]
+                if not raw_text or not raw_text.strip():
+                    results.append(self._create_empty_result(filename, file_extension, entry["size"]))
+                    continue
+                try:
+                    response_text = responses.get(str(index))
+                    if response_text is None:
+                        # Missing from the batch output (request error or expired batch): parse online
+                        raise ValueError("No batch response")
+                    parsed_json = json_loads(response_text)
+                    if not parsed_json or not isinstance(parsed_json, dict):
+                        raise ValueError("AI returned empty or invalid JSON response")
+                    results.append(self._finalize_parsed_result(parsed_json, raw_text, filename, file_extension, "llm_batch_api"))
+                except Exception as e:
+                    logger.warning(f"[llm_parser] Batch result unusable for {filename}, parsing online: {e}")
+                    try:
+                        results.append(await self._parse_with_llm(raw_text, filename, file_extension, entry["size"], fast_mode))
+                    except Exception as parse_error:
+                        logger.error(f"Failed to parse {filename}: {parse_error}")
+                        results.append(self._create_empty_result(filename, file_extension, entry["size"]))
+        finally:
+            _PARSE_NOW.reset(token)
+
+        return results
+
     async def parse_resume_from_memory(self, file_content: bytes, filename: str, file_extension: str) -> Dict[str, Any]:
         """
         Parse resume directly from memory using LLM contextual analysis
@@ -154,63 +759,157 @@ class LLMResumeParser:
         if file_extension not in self.supported_formats:
             raise ValueError(f"Unsupported file format: {file_extension}")
 
-        # Extract raw text from memory
-        text_start = time.time()
-        raw_text = await self._extract_raw_text_from_memory(file_content, file_extension)
-        text_time = int((time.time() - text_start) * 1000)
-        
-        if not raw_text or not raw_text.strip():
-            logger.warning(f"No text extracted from {filename}")
-            return self._create_empty_result(filename, file_extension, file_size)
+        # Byte-identical re-uploads are answered before the file is decoded at all
+        content_digest = hashlib.blake2b(file_content, digest_size=16).digest()
+        result_key = None
+        if self.result_cache_ttl > 0 and self.llm_client and _CONTENT_RESULT_CACHE is not None:
+            result_key = (content_digest, file_extension) + self._result_cache_params()
+            blob = _CONTENT_RESULT_CACHE.get(result_key)
+            if blob is not None:
+                parsed_result = json_loads(decompress_text(blob))
+                parsed_result["parsed_at"] = _now_iso()
+                total_ms = int((time.time() - start_time) * 1000)
+                logger.info(f"[llm_parser] Parsed {filename}",
+                            event_type="resume_parsing",
+                            event="timings",
+                            filename=filename,
+                            cache_hit=True,
+                            content_cache_hit=True,
+                            fast_path=False,
+                            text_chars=0,
+                            text_ms=0,
+                            llm_ms=0,
+                            total_ms=total_ms)
+                self._log_parsed_data(parsed_result, filename)
+                return parsed_result
+
+        raw_text = await self._extract_raw_text_from_memory(file_content, file_extension, self.extract_chars,
+                                                             content_digest=content_digest)
+        parsed_result = await self._parse_common(raw_text, filename, file_extension, file_size, start_time)
+        # Only full LLM parses are kept; retry/fallback and empty results are degraded output
+        if result_key is not None and parsed_result.get("processing_mode") == _CACHEABLE_PROCESSING_MODE:
+            _CONTENT_RESULT_CACHE[result_key] = compress_text(json_dumps(parsed_result))
+        return parsed_result
 
-        logger.info(f"[llm_parser] Memory text extraction: {text_time}ms, {len(raw_text)} chars")
+    def _result_cache_params(self) -> Tuple:
+        """Every setting that changes the parse of a given text; both result caches key on all of them"""
+        return (_PROMPT_VERSION, self.model, int(self.fast_mode), self.text_limit, self.max_input_tokens,
+                int(self.contact_fast_path), int(self.strict_json_schema), self.max_skills)
 
-        # Parse with LLM (check for fast mode setting)
-        fast_mode = getattr(settings, "PARSER_LLM_FAST_MODE", True)
-        llm_start = time.time()
-        parsed_result = await self._parse_with_llm(raw_text, filename, file_extension, file_size, fast_mode)
-        llm_time = int((time.time() - llm_start) * 1000)
+    async def _parse_common(self, raw_text: str, filename: str, file_extension: str, file_size: int, start_time: float) -> Dict[str, Any]:
+        """Shared tail of the file and memory entry points: LLM parse, timing log and debug log"""
+        token = _PARSE_NOW.set(datetime.now(timezone.utc).isoformat())
+        try:
+            text_end = time.time()
         
-        total_time = int((time.time() - start_time) * 1000)
-        logger.info(f"[llm_parser] LLM parsing: {llm_time}ms, Total: {total_time}ms")
+            if not raw_text or not raw_text.strip():
+                logger.warning(f"No text extracted from {filename}")
+                return self._create_empty_result(filename, file_extension, file_size)
+
+            # Clearly structured resumes can be parsed locally, without a cache lookup or LLM call
+            parsed_result = await self._try_fast_path(raw_text, filename, file_extension) if self.rule_fast_path else None
+            fast_path = parsed_result is not None
+
+            # Identical text under the same prompts/model/mode yields the same parse
+            cache_key = None
+            if not fast_path and self.result_cache_ttl > 0 and self.llm_client:
+                cache_key = result_cache_key(raw_text, ":".join(str(p) for p in self._result_cache_params()))
+            cached_result = await get_cached_result(cache_key) if cache_key else None
+            cache_hit = cached_result is not None
+            if cache_hit:
+                parsed_result = cached_result
+                self._attach_raw_text(parsed_result, raw_text)
+                parsed_result["file_type"] = file_extension
+                parsed_result["parsed_at"] = _now_iso()
+            elif not fast_path:
+                parsed_result = await self._parse_with_llm(raw_text, filename, file_extension, file_size, self.fast_mode)
+                # Retry/fallback output follows a transient 429 or timeout; caching it would pin the worse parse
+                if cache_key and parsed_result.get("processing_mode") == _CACHEABLE_PROCESSING_MODE:
+                    await set_cached_result(cache_key, parsed_result, self.result_cache_ttl)
+            end_time = time.time()
+
+            logger.info(f"[llm_parser] Parsed {filename}",
+                        event_type="resume_parsing",
+                        event="timings",
+                        filename=filename,
+                        cache_hit=cache_hit,
+                        fast_path=fast_path,
+                        text_chars=len(raw_text),
+                        text_ms=int((text_end - start_time) * 1000),
+                        llm_ms=int((end_time - text_end) * 1000),
+                        total_ms=int((end_time - start_time) * 1000))
         
-        # Log parsed data for debugging
-        self._log_parsed_data(parsed_result, filename)
+            # Log parsed data for debugging
+            self._log_parsed_data(parsed_result, filename)
         
-        return parsed_result
+            return parsed_result
+        finally:
+            _PARSE_NOW.reset(token)
 
-    async def _extract_raw_text(self, file_path: str, file_extension: str) -> str:
-        """Extract raw text from file"""
-        if file_extension == ".pdf":
-            return await self._extract_pdf_text(file_path)
-        elif file_extension in [".docx", ".doc"]:
-            return await self._extract_docx_text(file_path)
-        elif file_extension == ".txt":
-            return await self._extract_txt_text(file_path)
-        else:
+    async def _extract_raw_text(self, file_path: str, file_extension: str, max_chars: int = _TEXT_BUDGET_CHARS) -> str:
+        """Extract raw text from file, reading at most roughly max_chars characters"""
+        try:
+            stat = os.stat(file_path)
+            cache_key = ("path", file_path, stat.st_mtime_ns, stat.st_size, file_extension, max_chars)
+        except OSError:
+            cache_key = None
+        return await self._extract_cached(cache_key, self._extract_raw_text_uncached, file_path, file_extension, max_chars)
+
+    async def _extract_raw_text_from_memory(self, file_content: bytes, file_extension: str, max_chars: int = _TEXT_BUDGET_CHARS,
+                                            content_digest: Optional[bytes] = None) -> str:
+        """Extract raw text from file content in memory, reading at most roughly max_chars characters"""
+        # BLAKE2b is faster than SHA-256 and 16 bytes is plenty to address file content
+        if content_digest is None:
+            content_digest = hashlib.blake2b(file_content, digest_size=16).digest()
+        cache_key = ("content", content_digest, file_extension, max_chars)
+        return await self._extract_cached(cache_key, self._extract_raw_text_from_memory_uncached,
+                                          file_content, file_extension, max_chars)
+
+    async def _extract_cached(self, cache_key: Optional[Tuple], extract, *args) -> str:
+        """Serve repeat extractions of identical content from the in-process LRU"""
+        if cache_key is not None and LRUCache is not None:
+            cached = _EXTRACTED_TEXT_CACHE.get(cache_key)
+            if cached is not None:
+                return decompress_text(cached)
+        text = await extract(*args)
+        # Empty text may be a transient extraction failure, so only real text is kept
+        if text and cache_key is not None and LRUCache is not None:
+            _EXTRACTED_TEXT_CACHE[cache_key] = compress_text(text)
+        return text
+
+    async def _extract_raw_text_uncached(self, file_path: str, file_extension: str, max_chars: int) -> str:
+        extract = self._path_extractors.get(file_extension)
+        if extract is None:
             raise ValueError(f"Unsupported file format: {file_extension}")
+        return await extract(file_path, max_chars)
+
+    async def _extract_raw_text_from_memory_uncached(self, file_content: bytes, file_extension: str, max_chars: int) -> str:
+        # Route on the content's magic bytes: a misnamed upload goes to the right extractor, and a
+        # payload that cannot be a PDF/DOCX (HTML, legacy .doc, truncated) skips the failing cascade
+        sniffed = _sniff_format(file_content)
+        if sniffed is not None and sniffed != file_extension and not (sniffed == ".docx" and file_extension == ".doc"):
+            logger.info(f"[llm_parser] Content looks like {sniffed}, not {file_extension}; extracting as {sniffed}")
+            file_extension = sniffed
+        elif sniffed is None and file_extension in (".pdf", ".docx", ".doc"):
+            logger.warning(f"[llm_parser] Content is not a readable {file_extension} file; skipping extraction")
+            return ""
 
-    async def _extract_raw_text_from_memory(self, file_content: bytes, file_extension: str) -> str:
-        """Extract raw text from file content in memory"""
-        if file_extension == ".pdf":
-            return await self._extract_pdf_text_from_memory(file_content)
-        elif file_extension in [".docx", ".doc"]:
-            return await self._extract_docx_text_from_memory(file_content)
-        elif file_extension == ".txt":
-            return file_content.decode('utf-8', errors='ignore')
-        else:
+        extract = self._memory_extractors.get(file_extension)
+        if extract is None:
             raise ValueError(f"Unsupported file format: {file_extension}")
+        return await extract(file_content, max_chars)
 
     def _create_empty_result(self, filename: str, file_extension: str, file_size: int) -> Dict[str, Any]:
         """Create empty result when no text can be extracted"""
+        now = _now_iso()
         return {
             "prompt_passed": False,
             "prompt_metadata": {
                 "filename": filename,
-                "mime_type": self._get_mime_type(file_extension),
+                "mime_type": _MIME_TYPES.get(file_extension, "application/octet-stream"),
                 "file_size_bytes": file_size,
                 "source": "llm_parser",
-                "ingested_at_iso": datetime.now(timezone.utc).isoformat()
+                "ingested_at_iso": now
             },
             "document_overview": {
                 "detected_language": None,
@@ -232,7 +931,7 @@ class LLMResumeParser:
             # Legacy compatibility fields
             "raw_text": "",
             "file_type": file_extension,
-            "parsed_at": datetime.now(timezone.utc).isoformat(),
+            "parsed_at": now,
             "contact_info": {},
             "skills": [],
             "education": [],
@@ -246,27 +945,21 @@ class LLMResumeParser:
 
     def _get_mime_type(self, file_extension: str) -> str:
         """Get MIME type from file extension"""
-        mime_types = {
-            ".pdf": "application/pdf",
-            ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            ".doc": "application/msword",
-            ".txt": "text/plain"
-        }
-        return mime_types.get(file_extension, "application/octet-stream")
+        return _MIME_TYPES.get(file_extension, "application/octet-stream")
 
     def _log_parsed_data(self, parsed_result: Dict[str, Any], filename: str):
         """Log parsed data for debugging"""
         try:
-            # Log key extracted information
-            contact_info = parsed_result.get("contact_cluster", {})
-            name = contact_info.get("name_text", {}).get("value", "N/A")
-            emails = contact_info.get("email_texts", {}).get("values", [])
-            phones = contact_info.get("phone_texts", {}).get("values", [])
+            # Log key extracted information; each level is looked up once, and null levels read as empty
+            contact_info = parsed_result.get("contact_cluster") or {}
+            name = (contact_info.get("name_text") or {}).get("value") or "N/A"
+            emails = (contact_info.get("email_texts") or {}).get("values") or []
+            phones = (contact_info.get("phone_texts") or {}).get("values") or []
             
             logger.info(f"[llm_parser] Parsed {filename}: name='{name}', emails={len(emails)}, phones={len(phones)}")
             
             # Log sections found
-            sections = parsed_result.get("sections", {})
+            sections = parsed_result.get("sections") or {}
             section_names = []
             for k, v in sections.items():
                 if v:  # If section has content
@@ -277,19 +970,16 @@ class LLMResumeParser:
                     elif isinstance(v, list) and v:
                         section_names.append(k)
             logger.info(f"[llm_parser] Sections found: {section_names}")
-            
-            # Log using structured JSON format
-            from app.core.json_logging import log_parsed_resume
 
             # Extract skills from legacy format
             skills = []
             if "skills" in parsed_result:
                 skills = parsed_result["skills"]
             elif "skills_like" in sections:
-                skills_text = sections.get("skills_like", {}).get("text", "")
+                skills_text = (sections.get("skills_like") or {}).get("text", "")
                 if skills_text:
                     # Basic skill extraction from text
-                    skills = [s.strip() for s in skills_text.split(",") if s.strip()]
+                    skills = [s for s in (t.strip() for t in _SKILL_SPLIT.split(skills_text)) if s]
 
             # Extract experience years
             experience_years = parsed_result.get("total_experience_years", 0)
@@ -297,16 +987,16 @@ class LLMResumeParser:
             # Extract education
             education = []
             if "education" in sections:
-                edu_text = sections.get("education", {}).get("text", "")
+                edu_text = (sections.get("education") or {}).get("text", "")
                 if edu_text:
                     education = [{"text": edu_text}]
 
             # Extract quality score
-            quality = parsed_result.get("quality", {})
+            quality = parsed_result.get("quality") or {}
             quality_score = quality.get("coverage_ratio", 0)
 
             # Extract semantic highlights for additional context
-            highlights = parsed_result.get("semantic_highlights", [])
+            highlights = parsed_result.get("semantic_highlights") or []
             key_capabilities = [h.get("verbatim", "")[:60] for h in highlights[:3]]
 
             # Log using structured JSON format
@@ -335,6 +1025,9 @@ class LLMResumeParser:
             raise ValueError("LLM client is required for NLP-first parsing. No fallback available.")
 
         try:
+            # Obvious contact fields are matched locally; the LLM then only has to produce the sections
+            contact_info = await self._extract_contact_fast(raw_text) if fast_mode else None
+
             # Create the parsing prompt - use enhanced NLP approach
             prompt = self._create_enhanced_nlp_prompt(raw_text, filename, file_extension, file_size)
 
@@ -343,51 +1036,20 @@ class LLMResumeParser:
             logger.info(f"[llm_parser] Text preview: {raw_text[:200]}...")
 
             # Call LLM based on provider - optimized for speed
-            system_msg = "Extract resume data quickly and accurately. Return only JSON." if fast_mode else "You are an expert resume parser. Analyze the provided resume text using contextual understanding without relying on hardcoded patterns. Return ONLY valid JSON that matches the specified schema."
-            max_tokens = 2000 if fast_mode else 4000
-
-            if self.provider == "openai":
-                response = self.llm_client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": system_msg
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.0,  # Faster with 0 temperature
-                    max_tokens=max_tokens,
-                    response_format={"type": "json_object"}
-                )
-                response_text = response.choices[0].message.content
-            elif self.provider == "groq":
-                response = self.llm_client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": system_msg
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.0,  # Faster with 0 temperature
-                    max_tokens=max_tokens,
-                    response_format={"type": "json_object"}
-                )
-                response_text = response.choices[0].message.content
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
+            system_msg = _ENHANCED_SYSTEM[(fast_mode, contact_info is None)]
+            max_tokens = self.max_tokens_fast if fast_mode else self.max_tokens_full
+            if contact_info is not None:
+                max_tokens = self.contact_fast_path_max_tokens
+            if self.adaptive_max_tokens:
+                # The reply grows with the resume: short ones don't need (or reserve quota for) the full ceiling
+                max_tokens = min(max_tokens, max(_MIN_COMPLETION_TOKENS, len(prompt) // 4))
+
+            response_format = self._response_format(include_contact=contact_info is None)
+            response_text = await self._chat(system_msg, prompt, max_tokens, temperature=0.0,
+                                             response_format=response_format)
 
             # Log the AI response for debugging (if enabled)
-            log_responses = getattr(settings, "LOG_AI_RESPONSES", True)
-            if log_responses:
+            if self.log_responses:
                 logger.info("AI response received for resume parsing",
                            event_type="ai_parsing",
                            event="response_received",
@@ -401,7 +1063,7 @@ class LLMResumeParser:
             logger.info(f"[llm_parser] Raw AI response for {filename}: {response_text[:500]}...")
 
             # Parse JSON response
-            parsed_json = json.loads(response_text)
+            parsed_json = json_loads(response_text)
 
             # Validate response - NO FALLBACK, use intelligent retry instead
             if not parsed_json or not isinstance(parsed_json, dict):
@@ -412,17 +1074,12 @@ class LLMResumeParser:
             if not parsed_json:
                 raise ValueError("AI response is completely empty")
 
-            # Add legacy compatibility fields
-            legacy_data = self._convert_to_legacy_format(parsed_json, filename)
-            parsed_json.update(legacy_data)
-
-            # Add metadata
-            parsed_json["raw_text"] = raw_text
-            parsed_json["file_type"] = file_extension
-            parsed_json["parsed_at"] = datetime.now(timezone.utc).isoformat()
-            parsed_json["processing_mode"] = "llm_universal"
+            if contact_info is not None:
+                location = parsed_json.pop("location", "")
+                contact_info["location"] = location if isinstance(location, str) else ""
+                parsed_json["contact_info"] = contact_info
 
-            return parsed_json
+            return self._finalize_parsed_result(parsed_json, raw_text, filename, file_extension, "llm_universal")
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM JSON response for {filename}: {e}")
@@ -433,6 +1090,121 @@ class LLMResumeParser:
             # Try with a simpler prompt approach
             return await self._retry_with_simpler_prompt(raw_text, filename, file_extension, file_size, e)
 
+    async def _extract_contact_fast(self, raw_text: str) -> Optional[Dict[str, str]]:
+        """Match name/email/phone deterministically; returns None unless all three are found.
+        location is left empty for the caller: the LLM reports it alongside the sections."""
+        if not self.contact_fast_path:
+            return None
+
+        head = raw_text[:2000]
+        email = EMAIL_RE.search(head)
+        # Date ranges like "2019 - 2021" also match PHONE_RE, so require a phone-length digit count
+        phone = next((m for m in PHONE_RE.finditer(head) if 10 <= sum(c.isdigit() for c in m.group()) <= 15), None)
+        if not email or not phone:
+            return None
+
+        # spaCy load and inference block for seconds/ms, so NER runs off the event loop
+        name = await asyncio.to_thread(_guess_name, head, True) if self.enable_ner else _guess_name(head, False)
+        if not name:
+            return None
+
+        linkedin = LINKEDIN_RE.search(head)
+        return {
+            "name": name,
+            "email": email.group(),
+            "phone": phone.group().strip(),
+            "location": "",
+            "linkedin": linkedin.group() if linkedin else "",
+        }
+
+    async def _try_fast_path(self, raw_text: str, filename: str, file_extension: str) -> Optional[Dict[str, Any]]:
+        """Parse a clearly structured resume locally: name/email/phone matched and at least
+        _FAST_PATH_MIN_SECTIONS recognised section headings; None sends it to the LLM"""
+        parsed = _preprocess_lines(raw_text)
+        headings = {key for key in (line.lower().rstrip(":").strip() for line in parsed.lines) if key in _FAST_PATH_HEADINGS}
+        if len(headings) < _FAST_PATH_MIN_SECTIONS:
+            return None
+
+        contact_info = await self._extract_contact_fast(raw_text)
+        if contact_info is None:
+            return None
+        # No LLM on this path to report location: take a "City, Region"-style line from the header
+        contact_info["location"] = next(
+            (line.strip() for line in raw_text[:2000].splitlines()[:10] if is_probable_location(line)), "")
+
+        experience = self._extract_experience_fallback(parsed)
+        education = self._extract_education_fallback(parsed)
+        if not experience and not education:
+            return None
+
+        logger.info(f"[llm_parser] Rule fast path for {filename} ({len(headings)} sections)")
+        parsed_json = {
+            "contact_info": contact_info,
+            "professional_summary": self._extract_summary_fallback(parsed),
+            "skills": self._extract_skills_dynamically(parsed),
+            "experience": experience,
+            "education": education,
+            "projects": [],
+            "certifications": [],
+            "languages": [],
+        }
+        return self._finalize_parsed_result(parsed_json, raw_text, filename, file_extension, "fast_path")
+
+    def _response_format(self, include_contact: bool) -> Dict[str, Any]:
+        """Strict JSON schema for the enhanced prompt on OpenAI; Groq may not support json_schema"""
+        if self.provider == "openai" and self.strict_json_schema:
+            return LLM_RESUME_RESPONSE_FORMAT if include_contact else LLM_RESUME_SECTIONS_RESPONSE_FORMAT
+        return _JSON_MODE
+
+    def _completion_kwargs(self, system: Dict[str, str], user: str, max_tokens: int, temperature: float,
+                           response_format: Dict[str, Any] = _JSON_MODE) -> Dict[str, Any]:
+        """Build chat completion arguments shared by online calls and Batch API requests"""
+        return {
+            "model": self.model,
+            "messages": [system, {"role": "user", "content": user}],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": response_format
+        }
+
+    async def _chat(self, system: Dict[str, str], user: str, max_tokens: int, temperature: float,
+                    response_format: Dict[str, Any] = _JSON_MODE) -> str:
+        """Run a single chat completion and return the response text"""
+        # ~4 characters per token for the prompt; the completion budget counts against the quota too
+        await self._rate_limiter.acquire((len(system["content"]) + len(user)) // 4 + max_tokens)
+        # Awaited on the async client, so concurrent parses overlap their network round-trips
+        raw_response = await self._chat_fn(**self._completion_kwargs(system, user, max_tokens, temperature, response_format))
+        self._rate_limiter.update_from_headers(raw_response.headers)
+        response = raw_response.parse()
+        return response.choices[0].message.content
+
+    def _finalize_parsed_result(self, parsed_json: Dict[str, Any], raw_text: str, filename: str, file_extension: str, processing_mode: str) -> Dict[str, Any]:
+        """Attach legacy compatibility fields and metadata to a validated LLM response"""
+        # Add legacy compatibility fields
+        legacy_data = self._convert_to_legacy_format(parsed_json, filename)
+        parsed_json.update(legacy_data)
+
+        # Add metadata
+        self._attach_raw_text(parsed_json, raw_text)
+        parsed_json["file_type"] = file_extension
+        parsed_json["parsed_at"] = _now_iso()
+        parsed_json["processing_mode"] = processing_mode
+
+        return parsed_json
+
+    def _attach_raw_text(self, parsed_json: Dict[str, Any], raw_text: str) -> None:
+        """Add raw_text_sha256, and the text itself (up to raw_text_limit) only when configured; text that is
+        left out or cut short is kept whole in a side cache. raw_text is the extracted text, which stops at
+        extract_chars, so even an unlimited raw_text is not the whole document for long resumes"""
+        raw_text_sha256 = hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
+        parsed_json["raw_text_sha256"] = raw_text_sha256
+        truncated = bool(self.raw_text_limit) and len(raw_text) > self.raw_text_limit
+        if self.keep_raw_text:
+            parsed_json["raw_text"] = raw_text[:self.raw_text_limit] if truncated else raw_text
+            parsed_json["raw_text_truncated"] = truncated
+        if (truncated or not self.keep_raw_text) and LRUCache is not None:
+            _RAW_TEXT_CACHE[raw_text_sha256] = compress_text(raw_text)
+
     async def _retry_with_simpler_prompt(self, raw_text: str, filename: str, file_extension: str, file_size: int, original_error: Exception) -> Dict[str, Any]:
         """Retry with progressively simpler prompts to leverage full NLP capacity"""
         logger.info(f"[llm_parser] Retrying {filename} with simpler prompt due to: {original_error}")
@@ -452,54 +1224,18 @@ class LLMResumeParser:
                 prompt = prompt_creator(raw_text)
 
                 # Use more conservative settings
-                system_msg = "You are a resume parser. Extract key information and return valid JSON only."
+                system_msg = _SYS_RETRY
                 max_tokens = 1500
 
                 # Call LLM with simpler approach
-                if self.provider == "openai":
-                    response = self.llm_client.chat.completions.create(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": system_msg},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.1,
-                        max_tokens=max_tokens,
-                        response_format={"type": "json_object"}
-                    )
-                    response_text = response.choices[0].message.content
-                elif self.provider == "groq":
-                    response = self.llm_client.chat.completions.create(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": system_msg},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.1,
-                        max_tokens=max_tokens,
-                        response_format={"type": "json_object"}
-                    )
-                    response_text = response.choices[0].message.content
-                else:
-                    raise ValueError(f"Unsupported provider: {self.provider}")
+                response_text = await self._chat(system_msg, prompt, max_tokens, temperature=0.1)
 
                 # Parse and validate
-                parsed_json = json.loads(response_text)
+                parsed_json = json_loads(response_text)
 
                 if parsed_json and isinstance(parsed_json, dict):
                     logger.info(f"[llm_parser] SUCCESS with {strategy_name} strategy for {filename}")
-
-                    # Add legacy compatibility
-                    legacy_data = self._convert_to_legacy_format(parsed_json, filename)
-                    parsed_json.update(legacy_data)
-
-                    # Add metadata
-                    parsed_json["raw_text"] = raw_text
-                    parsed_json["file_type"] = file_extension
-                    parsed_json["parsed_at"] = datetime.now(timezone.utc).isoformat()
-                    parsed_json["processing_mode"] = f"nlp_retry_{strategy_name}"
-
-                    return parsed_json
+                    return self._finalize_parsed_result(parsed_json, raw_text, filename, file_extension, f"nlp_retry_{strategy_name}")
 
             except Exception as e:
                 logger.warning(f"[llm_parser] {strategy_name} strategy failed for {filename}: {e}")
@@ -514,469 +1250,92 @@ class LLMResumeParser:
         cleaned_text = self._clean_extracted_text(raw_text)
         limited_text = cleaned_text[:3000]
 
-        return f"""You are an intelligent resume parser focused on COMPREHENSIVE and GRANULAR extraction.
-
-CRITICAL EXTRACTION RULES:
-1. BE GRANULAR: "AWS(EC2, S3)" → extract AWS, EC2, S3 as separate skills
-2. BE COMPREHENSIVE: Extract ALL technologies, frameworks, tools, and methodologies mentioned
-3. INCLUDE SOFT SKILLS: Communication, collaboration, problem-solving, leadership skills
-4. FRAMEWORK SPECIFICITY: "Django REST Framework" ≠ "Django" - extract both if mentioned
-5. PARENTHETICAL DETAILS: Extract content in parentheses as additional skills
-6. IGNORE ARTIFACTS: Handle PDF formatting issues contextually
-
-EXTRACTION SOURCES: Skills sections, job descriptions, project tech stacks, certifications, tools mentioned
-
-Resume text to analyze:
-{limited_text}
-
-Return JSON with this structure:
-{{
-  "contact_info": {{
-    "name": "candidate name",
-    "email": "email address",
-    "phone": "phone number",
-    "location": "location"
-  }},
-  "skills": ["skill1", "skill2", "skill3"],
-  "experience": [
-    {{
-      "title": "job title",
-      "company": "company name",
-      "duration": "time period",
-      "description": "key responsibilities"
-    }}
-  ],
-  "education": [
-    {{
-      "degree": "degree name",
-      "institution": "school name",
-      "year": "graduation year"
-    }}
-  ],
-  "professional_summary": "brief summary"
-}}"""
+        head, tail = BASIC_STRUCTURED_PROMPT_PARTS
+        return head + limited_text + tail
 
     def _create_minimal_json_prompt(self, raw_text: str) -> str:
         """Create minimal prompt for maximum compatibility"""
         limited_text = raw_text[:2000]
 
-        return f"""Extract key info from this resume as JSON:
-
-{limited_text}
-
-JSON format:
-{{
-  "name": "",
-  "email": "",
-  "phone": "",
-  "skills": [],
-  "summary": ""
-}}"""
+        head, tail = MINIMAL_JSON_PROMPT_PARTS
+        return head + limited_text + tail
 
     def _create_ultra_simple_prompt(self, raw_text: str) -> str:
         """Ultra-simple prompt as last resort"""
         limited_text = raw_text[:1500]
 
-        return f"""Resume text: {limited_text}
-
-Return JSON with name, email, phone, and skills only."""
+        head, tail = ULTRA_SIMPLE_PROMPT_PARTS
+        return head + limited_text + tail
 
     def _create_universal_prompt(self, raw_text: str, filename: str, file_extension: str, file_size: int) -> str:
         """Create an enhanced NLP-focused resume parsing prompt for maximum accuracy"""
         # Limit text size but keep more content for better accuracy (first 6000 chars)
-        limited_text = raw_text[:6000] if len(raw_text) > 6000 else raw_text
-
-        prompt = f"""# Advanced NLP Resume Parser - Extract comprehensive information with high accuracy
-
-## Instructions:
-You are an expert resume parser with deep understanding of various resume formats, layouts, and styles.
-Use contextual understanding and natural language processing to extract information accurately.
-
-### Key Principles:
-1. **Context-Aware Extraction**: Don't rely on section headers - understand content contextually
-2. **Format Flexibility**: Handle diverse resume formats (chronological, functional, hybrid, creative)
-3. **Semantic Understanding**: Recognize skills, experience, and qualifications regardless of how they're presented
-4. **Accuracy Over Speed**: Prioritize correctness and completeness
-5. **Evidence-Based**: Always provide evidence spans for extracted information
-
-## Resume Text to Analyze:
-```
-{limited_text}
-```
-
-## File Metadata:
-- Filename: {filename}
-- File Type: {file_extension}
-- File Size: {file_size} bytes
-- Processing Time: {datetime.now(timezone.utc).isoformat()}
-
-## Enhanced Output Structure (JSON only):
-
-{{
-  "prompt_passed": true,
-  "prompt_metadata": {{
-    "filename": "{filename}",
-    "mime_type": "{self._get_mime_type(file_extension)}",
-    "file_size_bytes": {file_size},
-    "source": "enhanced_nlp_parser",
-    "processing_time": "{datetime.now(timezone.utc).isoformat()}",
-    "parser_version": "2.0"
-  }},
-
-  "document_analysis": {{
-    "detected_language": "<BCP-47 language code (e.g., 'en-US') or null>",
-    "estimated_pages": <integer or null>,
-    "resume_format": "<chronological|functional|hybrid|creative|academic|other>",
-    "content_quality": {{
-      "completeness_score": <0.0-1.0>,
-      "structure_clarity": <0.0-1.0>,
-      "information_density": <0.0-1.0>
-    }},
-    "layout_notes": [
-      "Observations about document structure, formatting, and organization"
-    ]
-  }},
-
-  "extracted_sections": {{
-    "professional_summary": {{
-      "content": "<extracted professional summary/objective text>",
-      "source_lines": ["<verbatim lines from resume>"],
-      "confidence": <0.0-1.0>,
-      "section_type": "<summary|objective|profile|about>"
-    }},
-    "core_skills": {{
-      "technical_skills": [
-        {{
-          "skill": "<skill name>",
-          "category": "<programming|framework|tool|database|cloud|etc>",
-          "evidence": "<where this skill was mentioned>",
-          "confidence": <0.0-1.0>
-        }}
-      ],
-      "soft_skills": [
-        {{
-          "skill": "<soft skill name>",
-          "evidence": "<context where mentioned>",
-          "confidence": <0.0-1.0>
-        }}
-      ],
-      "certifications": [
-        {{
-          "name": "<certification name>",
-          "issuer": "<issuing organization>",
-          "date": "<date if available>",
-          "status": "<active|expired|in_progress|null>"
-        }}
-      ]
-    }},
-    "work_experience": [
-      {{
-        "job_title": "<position title>",
-        "company": "<company name>",
-        "location": "<work location if mentioned>",
-        "duration": {{
-          "start_date": "<parsed start date or text>",
-          "end_date": "<parsed end date or 'Present'>",
-          "duration_text": "<original duration text>"
-        }},
-        "responsibilities": [
-          "<key responsibility or achievement>"
-        ],
-        "technologies_used": ["<technology>"],
-        "achievements": [
-          "<quantified achievement or impact>"
-        ],
-        "confidence": <0.0-1.0>
-      }}
-    ],
-    "education": [
-      {{
-        "degree": "<degree type and field>",
-        "institution": "<school/university name>",
-        "location": "<institution location if available>",
-        "graduation_date": "<date or year>",
-        "gpa": "<GPA if mentioned>",
-        "honors": ["<academic honors or distinctions>"],
-        "relevant_coursework": ["<relevant courses if listed>"],
-        "confidence": <0.0-1.0>
-      }}
-    ],
-    "projects": [
-      {{
-        "name": "<project name>",
-        "description": "<project description>",
-        "technologies": ["<technology used>"],
-        "duration": "<project timeline>",
-        "role": "<your role in project>",
-        "outcomes": ["<project results or impact>"],
-        "url": "<project URL if available>"
-      }}
-    ]
-  }},
-
-  "contact_information": {{
-    "full_name": {{
-      "value": "<candidate's full name as it appears>",
-      "parsed_components": {{
-        "first_name": "<first name>",
-        "last_name": "<last name>",
-        "middle_name": "<middle name or initial if present>"
-      }},
-      "evidence_lines": ["<lines where name appears>"],
-      "confidence": <0.0-1.0>
-    }},
-    "email_addresses": [
-      {{
-        "email": "<email address>",
-        "type": "<personal|work|academic|other>",
-        "evidence": "<where found in resume>",
-        "confidence": <0.0-1.0>
-      }}
-    ],
-    "phone_numbers": [
-      {{
-        "number": "<phone number as written>",
-        "type": "<mobile|home|work|other>",
-        "country_code": "<detected country code>",
-        "evidence": "<where found>",
-        "confidence": <0.0-1.0>
-      }}
-    ],
-    "online_profiles": [
-      {{
-        "platform": "<LinkedIn|GitHub|Portfolio|Twitter|etc>",
-        "url": "<full URL>",
-        "username": "<username if extractable>",
-        "evidence": "<where found>",
-        "confidence": <0.0-1.0>
-      }}
-    ],
-    "location": {{
-      "current_location": "<city, state/country as mentioned>",
-      "willing_to_relocate": <true|false|null>,
-      "remote_work": <true|false|null>,
-      "evidence": "<where location info was found>",
-      "confidence": <0.0-1.0>
-    }}
-  }},
-
-  "key_insights": [
-    {{
-      "category": "<technical_strength|leadership|achievement|domain_expertise|career_progression>",
-      "insight": "<specific insight about the candidate>",
-      "supporting_evidence": "<verbatim text that supports this insight>",
-      "relevance_score": <0.0-1.0>,
-      "confidence": <0.0-1.0>
-    }}
-  ],
-
-  "quality_assessment": {{
-    "overall_completeness": <0.0-1.0>,
-    "information_richness": <0.0-1.0>,
-    "structure_clarity": <0.0-1.0>,
-    "missing_elements": [
-      "<list of typical resume elements that appear to be missing>"
-    ],
-    "extraction_challenges": [
-      "<any formatting or parsing challenges encountered>"
-    ],
-    "confidence_factors": [
-      "<factors that increase or decrease confidence in the extraction>"
-    ]
-  }},
-
-  "parsing_metadata": {{
-    "extraction_method": "enhanced_nlp",
-    "text_length_processed": <number of characters>,
-    "sections_identified": <number of distinct sections found>,
-    "confidence_distribution": {{
-      "high_confidence": <percentage of extractions with >0.8 confidence>,
-      "medium_confidence": <percentage with 0.5-0.8 confidence>,
-      "low_confidence": <percentage with <0.5 confidence>
-    }},
-    "processing_notes": [
-      "Step 1: Analyzed document structure and identified key sections",
-      "Step 2: Extracted contact information using contextual cues",
-      "Step 3: Parsed work experience with attention to dates and achievements",
-      "Step 4: Identified skills through semantic analysis rather than keyword matching",
-      "Step 5: Validated extracted information against evidence in text"
-    ]
-  }}
-}}
-
-Return ONLY the JSON object, no additional text or formatting."""
+        limited_text = raw_text[:6000]
+
+        now = _now_iso()
+
+        prompt = render_prompt(UNIVERSAL_PROMPT_SEGMENTS, {
+            "limited_text": limited_text,
+            "filename": filename,
+            "file_extension": file_extension,
+            "file_size": file_size,
+            "mime_type": _MIME_TYPES.get(file_extension, "application/octet-stream"),
+            "now": now
+        })
 
         return prompt
 
     def _create_enhanced_nlp_prompt(self, raw_text: str, filename: str, file_extension: str, file_size: int) -> str:
-        """Create an enhanced NLP-focused prompt that actually works reliably"""
-        # Get configurable text limit
-        from app.core.config import settings
-        text_limit = getattr(settings, 'PARSER_TEXT_LIMIT', 6000)
-
+        """Create the user message for the enhanced system prompt; instructions and schema live in _ENHANCED_SYSTEM"""
         # Clean the text to remove PDF extraction artifacts
-        cleaned_text = self._clean_extracted_text(raw_text)
-
-        # Limit text for better processing
-        limited_text = cleaned_text[:text_limit] if len(cleaned_text) > text_limit else cleaned_text
-
-        prompt = f"""You are an expert resume parser with advanced contextual understanding.
-
-CRITICAL INSTRUCTIONS:
-1. COMPREHENSIVE EXTRACTION: Extract ALL skills, technologies, and tools mentioned - be granular, not general
-2. ARTIFACT HANDLING: This text may contain PDF artifacts (Á, µ, à, ¹, ², ³, S, N) - interpret contextually
-3. DETAILED PARSING: When you see "AWS(EC2, S3)" extract: AWS, EC2, S3 as separate skills
-4. FRAMEWORK SPECIFICITY: "Django REST Framework" is different from "Django" - extract both
-5. SOFT SKILLS: Include communication, collaboration, problem-solving skills explicitly mentioned
-6. PARENTHETICAL DETAILS: Extract details in parentheses as separate items (e.g., "CI/CD(Github Actions)" → CI/CD, Github Actions)
-
-PARSING STRATEGY:
-- Look for skills in: SKILLS sections, Tech Stack lists, job descriptions, project descriptions
-- Extract both general (AWS) and specific (EC2, S3) technologies
-- Include soft skills, methodologies (Agile), and processes
-- Be comprehensive - don't generalize or summarize
-
-Resume Text:
-{limited_text}
-
-Extract the following information and return as JSON:
-
-{{
-  "prompt_passed": true,
-  "contact_info": {{
-    "name": "Full name of candidate",
-    "email": "Email address",
-    "phone": "Phone number",
-    "location": "Current location",
-    "linkedin": "LinkedIn profile URL if present"
-  }},
-  "professional_summary": "Professional summary or objective",
-  "skills": ["List", "of", "technical", "skills"],
-  "experience": [
-    {{
-      "title": "Job title",
-      "company": "Company name",
-      "duration": "Employment duration",
-      "description": "Key responsibilities and achievements",
-      "technologies": ["Technologies", "used"]
-    }}
-  ],
-  "education": [
-    {{
-      "degree": "Degree type and field",
-      "institution": "School/University name",
-      "year": "Graduation year",
-      "details": "Additional details like GPA, honors"
-    }}
-  ],
-  "projects": [
-    {{
-      "name": "Project name",
-      "description": "Project description",
-      "technologies": ["Technologies", "used"]
-    }}
-  ],
-  "certifications": ["List of certifications"],
-  "languages": ["List of languages"],
-  "key_achievements": ["Notable achievements with quantified results"]
-}}
-
-IMPORTANT:
-- Return ONLY the JSON object, no explanations
-- Use actual data from the resume text
-- If information is not available, use empty string or empty array
-- Ensure all JSON is properly formatted and valid"""
+        return self._enhanced_user_prompt(*_clean_text(raw_text))
+
+    def _prompt_char_limit(self) -> int:
+        """Characters of resume text the prompt can use; with a token budget, a generous bound on it"""
+        return self.max_input_tokens * 8 if self.max_input_tokens else self.text_limit
+
+    def _enhanced_user_prompt(self, cleaned_text: str, has_artifacts: bool) -> str:
+        """Build the enhanced user message from text already passed through _clean_text/clean_batch"""
+        # Limit text for better processing; slicing before prepending the instruction gives the
+        # same result without first copying the whole text (a slice past the end is a no-op).
+        # With a token budget the character cut is only a generous pre-trim before exact counting.
+        text_limit = self._prompt_char_limit()
+        if has_artifacts:
+            limited_text = (_ARTIFACT_INSTRUCTION + cleaned_text[:max(text_limit - len(_ARTIFACT_INSTRUCTION), 0)])[:text_limit]
+        else:
+            limited_text = cleaned_text[:text_limit]
+        if self.max_input_tokens:
+            limited_text = _trim_to_tokens(limited_text, self.max_input_tokens, getattr(self, "model", ""))
 
-        return prompt
+        head, tail = ENHANCED_NLP_USER_PROMPT_PARTS
+        return head + limited_text + tail
 
     def _clean_extracted_text(self, raw_text: str) -> str:
         """Clean text using NLP-aware approach - let AI handle artifacts contextually"""
-        import re
+        cleaned_text, has_artifacts = self._clean_and_detect_artifacts(raw_text)
 
-        # Minimal cleaning - only remove obvious noise, let NLP handle the rest
-        text = raw_text
-
-        # Only remove clearly broken formatting that would confuse any parser
-        # Remove excessive whitespace and normalize line breaks
-        text = re.sub(r'\s+', ' ', text)  # Multiple spaces -> single space
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple line breaks -> double line break
-
-        # Remove lines that are clearly just formatting noise (very short, non-meaningful)
-        lines = text.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            line = line.strip()
-            # Only skip completely empty lines or single character artifacts
-            if len(line) > 1:  # Keep anything with 2+ characters - let NLP decide if it's meaningful
-                cleaned_lines.append(line)
-
-        cleaned_text = '\n'.join(cleaned_lines)
-
-        # Add instruction to AI about handling artifacts
-        if self._has_potential_artifacts(cleaned_text):
-            # Prepend instruction for AI to handle artifacts contextually
-            artifact_instruction = """
-[INSTRUCTION: This text may contain PDF extraction artifacts like special characters (Á, µ, à, ¹, ², ³),
-formatting symbols (S, N), or broken spacing. Please interpret the content contextually and extract
-meaningful information while ignoring obvious formatting artifacts.]
-
-"""
-            cleaned_text = artifact_instruction + cleaned_text
+        # Prepend instruction for AI to handle artifacts contextually
+        if has_artifacts:
+            cleaned_text = _ARTIFACT_INSTRUCTION + cleaned_text
 
         return cleaned_text
 
+    def _clean_and_detect_artifacts(self, raw_text: str) -> Tuple[str, bool]:
+        """Normalise and collapse the text, flagging likely PDF artifacts from the same cleaned buffer"""
+        return _clean_text(raw_text)
+
     def _has_potential_artifacts(self, text: str) -> bool:
         """Detect if text likely contains PDF extraction artifacts"""
         # Check for common PDF extraction artifacts without hardcoding specific fixes
-        artifact_patterns = [
-            r'[ÁµàáéíóúÀÈÌÒÙâêîôûäëïöüÿñç]',  # Accented/special chars often from PDF
-            r'\b[SN]\s+[A-Z]',  # Single letters followed by words (S Languages, N Tools)
-            r'[¹²³⁴⁵⁶⁷⁸⁹⁰]',  # Superscript numbers
-            r'[•◦▪▫■□●○]',  # Various bullet point symbols
-            r'\b[A-Z]\s*$',  # Single capital letters at end of lines
-        ]
-
-        import re
-        for pattern in artifact_patterns:
-            if re.search(pattern, text):
-                return True
-        return False
+        return _has_artifacts(text)
 
     def _create_fast_prompt(self, raw_text: str, filename: str, file_extension: str, file_size: int) -> str:
         """Create a fast, concise parsing prompt for speed"""
         # Limit text even more for speed (first 3000 chars)
-        limited_text = raw_text[:3000] if len(raw_text) > 3000 else raw_text
-
-        prompt = f"""You are a resume parser. Extract information from this resume text and return ONLY valid JSON.
-
-Resume Text:
-{limited_text}
-
-Return this exact JSON structure (fill with actual data from the resume):
-{{
-  "prompt_passed": true,
-  "contact_cluster": {{
-    "name_text": {{"value": "CANDIDATE_NAME_HERE", "confidence": 0.9}},
-    "email_texts": {{"values": ["email@example.com"], "confidence": 0.9}},
-    "phone_texts": {{"values": ["+1234567890"], "confidence": 0.9}},
-    "location_text": {{"value": "City, State", "confidence": 0.8}}
-  }},
-  "sections": {{
-    "summary": "Professional summary from resume",
-    "skills_like": "List of technical skills and technologies",
-    "experience_like": "Work experience details",
-    "education_like": "Education background"
-  }},
-  "semantic_highlights": [
-    {{"label": "key_skill", "verbatim": "Important skill or technology", "confidence": 0.8}}
-  ],
-  "quality": {{"coverage_ratio": 0.85}}
-}}
-
-IMPORTANT: Return ONLY the JSON object. No explanations, no markdown, no extra text."""
+        limited_text = raw_text[:3000]
 
-        return prompt
+        head, tail = FAST_PROMPT_PARTS
+        return head + limited_text + tail
 
     # FALLBACK REMOVED - 100% NLP APPROACH ONLY
     # All parsing now uses intelligent retry mechanisms with progressive prompt simplification
@@ -987,49 +1346,42 @@ IMPORTANT: Return ONLY the JSON object. No explanations, no markdown, no extra t
 
     def _convert_to_legacy_format(self, parsed_json: Dict[str, Any], filename: str = "unknown") -> Dict[str, Any]:
         """Convert enhanced NLP parser output to legacy format for compatibility"""
-        legacy_data = {}
-
-        # Handle both new enhanced format and old contact_cluster format
+        # Enhanced responses carry each field at the top level; old contact_cluster responses keep
+        # raw blocks under "sections". Fields are resolved independently since replies can mix both.
+        sections = parsed_json.get("sections") or {}
         if "contact_info" in parsed_json:
-            # New enhanced format
-            contact_info = parsed_json.get("contact_info", {})
-            legacy_data["contact_info"] = {
-                "name": contact_info.get("name", ""),
-                "email": contact_info.get("email", ""),
-                "phone": contact_info.get("phone", ""),
-                "location": contact_info.get("location", ""),
-                "linkedin": contact_info.get("linkedin", "")
-            }
+            contact_info = _legacy_contact_from_info(parsed_json["contact_info"] or {})
         else:
-            # Old contact_cluster format
-            contact_cluster = parsed_json.get("contact_cluster", {})
-
-            # Extract emails and phones as single values (not lists) for legacy compatibility
-            emails = contact_cluster.get("email_texts", {}).get("values", [])
-            phones = contact_cluster.get("phone_texts", {}).get("values", [])
-
-            legacy_data["contact_info"] = {
-                "name": contact_cluster.get("name_text", {}).get("value", ""),
-                "email": emails[0] if emails else "",  # Take first email as string
-                "phone": phones[0] if phones else "",  # Take first phone as string
-                "location": contact_cluster.get("location_text", {}).get("value", ""),
-                "links": contact_cluster.get("link_texts", {}).get("values", [])
-            }
-
-        # Handle skills - check for new format first
-        if "skills" in parsed_json:
-            # New enhanced format - skills are already a list
-            legacy_data["skills"] = parsed_json.get("skills", [])
-        else:
-            # Old format - extract from skills_like section
-            sections = parsed_json.get("sections", {})
-            skills_section = sections.get("skills_like", {})
-            # Handle both dict format {"raw_block": "..."} and string format
-            if isinstance(skills_section, dict):
-                skills_text = skills_section.get("raw_block", "")
+            contact_info = _legacy_contact_from_cluster(parsed_json.get("contact_cluster") or {})
+
+        legacy_data: Dict[str, Any] = {
+            "contact_info": contact_info,
+            "skills": (parsed_json.get("skills", []) if "skills" in parsed_json
+                       else self._extract_skills_from_text(_section_text(sections, "skills_like"))),
+            "summary": (parsed_json.get("professional_summary", "") if "professional_summary" in parsed_json
+                        else _section_text(sections, "summary")),
+        }
+        for key, convert_enhanced, old_section in _LEGACY_ENTRY_FIELDS:
+            if key in parsed_json:
+                legacy_data[key] = convert_enhanced(parsed_json.get(key, []))
             else:
-                skills_text = str(skills_section) if skills_section else ""
-            legacy_data["skills"] = self._extract_skills_from_text(skills_text)
+                text = _section_text(sections, old_section)
+                legacy_data[key] = [{"description": text}] if text else []
+        legacy_data["certifications"] = parsed_json.get("certifications", [])
+        legacy_data["languages"] = parsed_json.get("languages", [])
+
+        # Handle old format other_blocks if new format fields not present
+        if not legacy_data["certifications"] and not legacy_data["languages"]:
+            targets = {"certifications": [], "languages": []}
+            legacy_data.update(targets)
+            for block in sections.get("other_blocks", []):
+                if not isinstance(block, dict):
+                    continue
+                label = block.get("label", "").lower()
+                for needle, target in _OTHER_BLOCK_LABEL_MAP:
+                    if needle in label:
+                        targets[target].append({"name": block.get("raw_block", "")})
+                        break
 
         # Debug logging
         logger.info(f"[llm_parser] Legacy conversion for {filename}:")
@@ -1038,108 +1390,6 @@ IMPORTANT: Return ONLY the JSON object. No explanations, no markdown, no extra t
         logger.info(f"  - Skills: {len(legacy_data['skills'])} found")
         logger.info(f"  - Summary length: {len(legacy_data.get('summary', ''))}")
 
-        # Handle summary - check for new format first
-        if "professional_summary" in parsed_json:
-            # New enhanced format
-            legacy_data["summary"] = parsed_json.get("professional_summary", "")
-        else:
-            # Old format
-            sections = parsed_json.get("sections", {})
-            summary_section = sections.get("summary", {})
-            if isinstance(summary_section, dict):
-                legacy_data["summary"] = summary_section.get("raw_block", "")
-            else:
-                legacy_data["summary"] = str(summary_section) if summary_section else ""
-
-        # Handle experience - check for new format first
-        if "experience" in parsed_json:
-            # New enhanced format - convert to legacy format
-            experience_list = parsed_json.get("experience", [])
-            legacy_experience = []
-            for exp in experience_list:
-                if isinstance(exp, dict):
-                    legacy_experience.append({
-                        "title": exp.get("title", ""),
-                        "company": exp.get("company", ""),
-                        "duration": exp.get("duration", ""),
-                        "description": exp.get("description", ""),
-                        "technologies": exp.get("technologies", [])
-                    })
-            legacy_data["experience"] = legacy_experience
-        else:
-            # Old format
-            sections = parsed_json.get("sections", {})
-            experience_section = sections.get("experience_like", {})
-            if isinstance(experience_section, dict):
-                experience_text = experience_section.get("raw_block", "")
-            else:
-                experience_text = str(experience_section) if experience_section else ""
-            legacy_data["experience"] = [{"description": experience_text}] if experience_text else []
-
-        # Handle education - check for new format first
-        if "education" in parsed_json:
-            # New enhanced format
-            education_list = parsed_json.get("education", [])
-            legacy_education = []
-            for edu in education_list:
-                if isinstance(edu, dict):
-                    legacy_education.append({
-                        "degree": edu.get("degree", ""),
-                        "institution": edu.get("institution", ""),
-                        "year": edu.get("year", ""),
-                        "details": edu.get("details", "")
-                    })
-            legacy_data["education"] = legacy_education
-        else:
-            # Old format
-            sections = parsed_json.get("sections", {})
-            education_section = sections.get("education_like", {})
-            if isinstance(education_section, dict):
-                education_text = education_section.get("raw_block", "")
-            else:
-                education_text = str(education_section) if education_section else ""
-            legacy_data["education"] = [{"description": education_text}] if education_text else []
-
-        # Handle projects - check for new format first
-        if "projects" in parsed_json:
-            # New enhanced format
-            legacy_data["projects"] = parsed_json.get("projects", [])
-        else:
-            # Old format
-            sections = parsed_json.get("sections", {})
-            projects_section = sections.get("projects_like", {})
-            if isinstance(projects_section, dict):
-                projects_text = projects_section.get("raw_block", "")
-            else:
-                projects_text = str(projects_section) if projects_section else ""
-            legacy_data["projects"] = [{"description": projects_text}] if projects_text else []
-
-        # Handle certifications and languages - check for new format first
-        if "certifications" in parsed_json:
-            legacy_data["certifications"] = parsed_json.get("certifications", [])
-        else:
-            legacy_data["certifications"] = []
-
-        if "languages" in parsed_json:
-            legacy_data["languages"] = parsed_json.get("languages", [])
-        else:
-            legacy_data["languages"] = []
-
-        # Handle old format other_blocks if new format fields not present
-        if not legacy_data["certifications"] and not legacy_data["languages"]:
-            sections = parsed_json.get("sections", {})
-            other_blocks = sections.get("other_blocks", [])
-
-            for block in other_blocks:
-                if isinstance(block, dict):
-                    label = block.get("label", "").lower()
-                    raw_block = block.get("raw_block", "")
-
-                if "cert" in label or "license" in label:
-                    legacy_data["certifications"].append({"name": raw_block})
-                elif "lang" in label:
-                    legacy_data["languages"].append({"name": raw_block})
-
         return legacy_data
 
     def _extract_skills_from_text(self, skills_text: str) -> List[str]:
@@ -1148,220 +1398,152 @@ IMPORTANT: Return ONLY the JSON object. No explanations, no markdown, no extra t
             return []
 
         # Simple extraction - split by common delimiters
-        import re
         skills = []
 
         # Split by common delimiters
-        parts = re.split(r'[,;•\n\r\t]', skills_text)
+        parts = skills_text.translate(_SKILL_BLOCK_DELIM_TRANS).split(_SKILL_DELIM)
 
         for part in parts:
             skill = part.strip()
             if skill and len(skill) > 1 and len(skill) < 50:
                 # Remove common prefixes/suffixes
-                skill = re.sub(r'^[-•\s]+', '', skill)
-                skill = re.sub(r'[-•\s]+$', '', skill)
+                skill = _LEADING_BULLET_RE.sub('', skill)
+                skill = _TRAILING_BULLET_RE.sub('', skill)
                 if skill:
                     skills.append(skill)
 
         return skills[:20]  # Limit to 20 skills
 
-    def _extract_skills_dynamically(self, raw_text: str) -> List[str]:
+    def _extract_skills_dynamically(self, parsed: _ParsedLines) -> List[str]:
         """Extract skills dynamically without hardcoded lists using pattern recognition"""
-        import re
-        skills = []
+        # Keyed by lowercase: de-duplicates as it goes, keeping the first casing seen in document order
+        skills: Dict[str, str] = {}
 
         # Look for skill-like patterns in the text
-        lines = raw_text.split('\n')
-
-        for line in lines:
-            line = line.strip()
-
+        for line in parsed.lines:
             # Skip empty lines or lines that are too short/long
             if not line or len(line) < 3 or len(line) > 200:
                 continue
 
             # Look for lines that contain skill-like patterns
             # Skills are often in bullet points, comma-separated, or after keywords
-            skill_indicators = [
-                r'(?:skills?|technologies?|tools?|languages?|frameworks?)[:\s]*(.+)',
-                r'(?:proficient|experienced|familiar)\s+(?:in|with)[:\s]*(.+)',
-                r'(?:•|-)[\s]*([A-Za-z][A-Za-z0-9\s\+\#\.\-]{1,30})',  # Bullet points
-                r'([A-Za-z][A-Za-z0-9\+\#\.\-]{2,20})(?:\s*[,;|]|\s*$)',  # Comma/semicolon separated
-            ]
-
-            for pattern in skill_indicators:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
+            for pattern in _SKILL_INDICATOR_RES:
+                matches = pattern.finditer(line)
                 for match in matches:
                     potential_skills = match.group(1) if match.groups() else match.group(0)
 
                     # Split by common delimiters
-                    skill_parts = re.split(r'[,;|•\-\n\r\t]', potential_skills)
+                    skill_parts = potential_skills.translate(_SKILL_PART_DELIM_TRANS).split(_SKILL_DELIM)
 
                     for part in skill_parts:
                         skill = part.strip()
+                        skill_lower = skill.lower()
 
-                        # Filter out non-skill-like text
-                        if self._is_likely_skill(skill):
-                            skills.append(skill)
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in skills:
-            skill_lower = skill.lower()
-            if skill_lower not in seen:
-                seen.add(skill_lower)
-                unique_skills.append(skill)
+                        # Filter out non-skill-like text; repeats are already known skills
+                        if skill_lower not in skills and self._is_likely_skill(skill):
+                            skills[skill_lower] = skill
 
-        # Get configurable skills limit
-        from app.core.config import settings
-        max_skills = getattr(settings, 'PARSER_MAX_SKILLS', 25)
+        return list(skills.values())[:self.max_skills]
 
-        return unique_skills[:max_skills]
-
-    def _extract_experience_fallback(self, raw_text: str) -> List[Dict[str, str]]:
+    def _extract_experience_fallback(self, parsed: _ParsedLines) -> List[Dict[str, str]]:
         """Extract work experience using pattern recognition (fallback mode)"""
-        import re
-
-        experience_entries = []
-        lines = raw_text.split('\n')
-
-        # Look for experience section
-        in_experience_section = False
-        current_job = {}
+        experience_entries: List[_JobEntry] = []
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        current_job: Optional[_JobEntry] = None
 
-            # Detect experience section start
-            if re.search(r'\b(experience|work|employment|career)\b', line, re.IGNORECASE):
-                in_experience_section = True
-                continue
-
-            # Stop at next major section
-            if in_experience_section and re.search(r'\b(education|projects|skills|certifications)\b', line, re.IGNORECASE):
-                if current_job:
+        # Only the experience section is walked: from its heading to the next major section
+        for line, hits in _section_rows(parsed, "experience_heading", "after_experience"):
+            # Look for job title patterns
+            if "job_title" in hits:
+                if current_job is not None:
                     experience_entries.append(current_job)
-                break
-
-            if in_experience_section:
-                # Look for job title patterns
-                if re.search(r'\b(developer|engineer|manager|analyst|consultant|intern|trainee)\b', line, re.IGNORECASE):
-                    if current_job:
-                        experience_entries.append(current_job)
-                    current_job = {"title": line, "company": "", "duration": "", "description": "", "technologies": []}
-
-                # Look for company names (often in ALL CAPS or followed by location)
-                elif re.search(r'^[A-Z\s&]+$', line) and len(line.split()) <= 5:
-                    if current_job:
-                        current_job["company"] = line
-
-                # Look for dates
-                elif re.search(r'\d{4}|\d{2}/\d{4}|present|current', line, re.IGNORECASE):
-                    if current_job:
-                        current_job["duration"] = line
-
-                # Collect description lines
-                elif line.startswith('•') or line.startswith('-') or line.startswith('Á'):
-                    if current_job:
-                        if current_job["description"]:
-                            current_job["description"] += " " + line
-                        else:
-                            current_job["description"] = line
+                current_job = _JobEntry(title=line)
+
+            # Look for company names (often in ALL CAPS or followed by location)
+            elif _COMPANY_LINE_RE.search(line) and len(line.split()) <= 5:
+                if current_job is not None:
+                    current_job.company = line
+
+            # Look for dates
+            elif _DATE_RE.search(line):
+                if current_job is not None:
+                    current_job.duration = line
+
+            # Collect description lines
+            elif line.startswith('•') or line.startswith('-') or line.startswith('Á'):
+                if current_job is not None:
+                    if current_job.description:
+                        current_job.description += " " + line
+                    else:
+                        current_job.description = line
 
         # Add last job if exists
-        if current_job:
+        if current_job is not None:
             experience_entries.append(current_job)
 
-        return experience_entries[:5]  # Limit to 5 entries
+        return [asdict(entry) for entry in experience_entries[:5]]  # Limit to 5 entries
 
-    def _extract_education_fallback(self, raw_text: str) -> List[Dict[str, str]]:
+    def _extract_education_fallback(self, parsed: _ParsedLines) -> List[Dict[str, str]]:
         """Extract education using pattern recognition (fallback mode)"""
-        import re
-
-        education_entries = []
-        lines = raw_text.split('\n')
-
-        # Look for education section
-        in_education_section = False
-        current_edu = {}
+        education_entries: List[_EducationEntry] = []
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Detect education section
-            if re.search(r'\b(education|academic|qualification|degree)\b', line, re.IGNORECASE):
-                in_education_section = True
-                continue
+        current_edu: Optional[_EducationEntry] = None
 
-            # Stop at next major section
-            if in_education_section and re.search(r'\b(experience|projects|skills|certifications)\b', line, re.IGNORECASE):
-                if current_edu:
+        # Only the education section is walked: from its heading to the next major section
+        for line, hits in _section_rows(parsed, "education_heading", "after_education"):
+            # Look for degree patterns
+            if "degree" in hits:
+                if current_edu is not None:
                     education_entries.append(current_edu)
-                break
+                current_edu = _EducationEntry(degree=line)
 
-            if in_education_section:
-                # Look for degree patterns
-                if re.search(r'\b(bachelor|master|phd|diploma|certificate|b\.?tech|m\.?tech|b\.?com|m\.?com|bca|mca)\b', line, re.IGNORECASE):
-                    if current_edu:
-                        education_entries.append(current_edu)
-                    current_edu = {"degree": line, "institution": "", "year": "", "details": ""}
+            # Look for institution names (often in title case or ALL CAPS)
+            elif "institution" in hits:
+                if current_edu is not None:
+                    current_edu.institution = line
 
-                # Look for institution names (often in title case or ALL CAPS)
-                elif re.search(r'\b(college|university|institute|school)\b', line, re.IGNORECASE):
-                    if current_edu:
-                        current_edu["institution"] = line
+            # Look for years
+            elif _GRAD_YEAR_RE.search(line):
+                if current_edu is not None:
+                    current_edu.year = line
 
-                # Look for years
-                elif re.search(r'\b(19|20)\d{2}\b', line):
-                    if current_edu:
-                        current_edu["year"] = line
-
-                # Look for GPA/CGPA
-                elif re.search(r'\b(gpa|cgpa|percentage|%)\b', line, re.IGNORECASE):
-                    if current_edu:
-                        current_edu["details"] = line
+            # Look for GPA/CGPA
+            elif _GRADE_RE.search(line):
+                if current_edu is not None:
+                    current_edu.details = line
 
         # Add last education if exists
-        if current_edu:
+        if current_edu is not None:
             education_entries.append(current_edu)
 
-        return education_entries[:3]  # Limit to 3 entries
+        return [asdict(entry) for entry in education_entries[:3]]  # Limit to 3 entries
 
-    def _extract_summary_fallback(self, raw_text: str) -> str:
+    def _extract_summary_fallback(self, parsed: _ParsedLines) -> str:
         """Extract professional summary using pattern recognition (fallback mode)"""
-        import re
-
-        lines = raw_text.split('\n')
         summary_lines = []
 
         # Look for summary section
         in_summary_section = False
 
-        for line in lines:
-            line = line.strip()
+        for line, hits in zip(parsed.lines, parsed.hits):
             if not line:
                 continue
 
             # Detect summary section
-            if re.search(r'\b(summary|objective|profile|about)\b', line, re.IGNORECASE):
+            if "summary_heading" in hits:
                 in_summary_section = True
                 continue
 
             # Stop at next major section
-            if in_summary_section and re.search(r'\b(experience|education|skills|projects)\b', line, re.IGNORECASE):
+            if in_summary_section and "after_summary" in hits:
                 break
 
             if in_summary_section:
                 summary_lines.append(line)
 
             # If no explicit summary section, take first few descriptive lines
-            if not summary_lines and len(line) > 50 and not re.search(r'@|phone|\+\d', line):
-                if re.search(r'\b(developer|engineer|experienced|passionate|skilled)\b', line, re.IGNORECASE):
+            if not summary_lines and len(line) > 50 and not _CONTACT_LINE_RE.search(line):
+                if "summary_cue" in hits:
                     summary_lines.append(line)
                     if len(' '.join(summary_lines)) > 200:
                         break
@@ -1370,159 +1552,482 @@ IMPORTANT: Return ONLY the JSON object. No explanations, no markdown, no extra t
 
     def _is_likely_skill(self, text: str) -> bool:
         """Determine if text is likely a skill using heuristics (no hardcoded lists)"""
-        import re
-
         if not text or len(text) < 2 or len(text) > 40:
             return False
 
         # Remove common prefixes/suffixes
-        text = re.sub(r'^[-•\s]+', '', text)
-        text = re.sub(r'[-•\s]+$', '', text)
+        text = _LEADING_BULLET_RE.sub('', text)
+        text = _TRAILING_BULLET_RE.sub('', text)
 
         if not text:
             return False
 
         # Heuristics for skill-like text (no hardcoded skill names)
-        skill_patterns = [
-            r'^[A-Z][a-z]+(?:\.[a-z]+)*$',  # CamelCase or dotted (e.g., Node.js)
-            r'^[A-Z]{2,}$',  # Acronyms (e.g., SQL, AWS, API)
-            r'^[A-Za-z]+[\+\#]$',  # Languages with symbols (e.g., C++, C#)
-            r'^[A-Za-z]+\s+[A-Za-z]+$',  # Two words (e.g., Machine Learning)
-            r'^[A-Za-z]+[-_][A-Za-z]+$',  # Hyphenated/underscored (e.g., React-Native)
-        ]
-
-        for pattern in skill_patterns:
-            if re.match(pattern, text):
-                return True
+        if _SKILL_SHAPE_RE.match(text):
+            return True
 
         # Additional checks for common skill characteristics
+        words = text.lower().split()
         if (text[0].isupper() and  # Starts with capital
-            not any(word in text.lower() for word in ['the', 'and', 'or', 'with', 'for', 'in', 'at', 'on']) and  # Not common words
-            not re.search(r'\d{4}', text) and  # Not years
+            _SKILL_STOPWORDS.isdisjoint(words) and  # Not common words
+            not _YEAR_RE.search(text) and  # Not years
             not '@' in text and  # Not email
-            not any(char in text for char in '()[]{}') and  # No brackets
-            len(text.split()) <= 3):  # Not too many words
+            len(text.translate(_BRACKET_TRANS)) == len(text) and  # No brackets
+            len(words) <= 3):  # Not too many words
             return True
 
         return False
 
+    async def _run_extractor(self, extractor, *args) -> str:
+        """Run a synchronous extractor in the shared process pool so parsing never blocks the event loop"""
+        return await run_in_parser_pool(extractor, *args)
+
     # Text extraction methods (reuse from existing parser)
-    async def _extract_pdf_text(self, file_path: str) -> str:
+    async def _extract_pdf_text(self, file_path: str, max_chars: int = _TEXT_BUDGET_CHARS) -> str:
         """Extract text from PDF using multiple methods"""
-        text = ""
+        return await self._extract_pdf_pages(file_path, max_chars)
 
-        # Method 1: Try PDFPlumber first (best for complex layouts)
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            if text.strip():
-                return text.strip()
-        except Exception as e:
-            logger.warning(f"PDFPlumber failed for {file_path}: {str(e)}")
+    async def _extract_pdf_text_from_memory(self, file_content: bytes, max_chars: int = _TEXT_BUDGET_CHARS) -> str:
+        """Extract text from PDF file content in memory"""
+        return await self._extract_pdf_pages(file_content, max_chars)
+
+    async def _extract_pdf_pages(self, source: Union[str, bytes], max_chars: int) -> str:
+        """Extract the first pages in one pool task; long PDFs with text budget left fan the rest out in page ranges"""
+        return await extract_pdf_pages(source, max_chars)
+
+    async def _extract_docx_text(self, file_path: str, max_chars: int = _TEXT_BUDGET_CHARS) -> str:
+        """Extract text from DOCX file"""
+        return await self._run_extractor(_docx_extract_sync, file_path, max_chars, True)
 
-        # Method 2: Fallback to PyPDF2
+    async def _extract_docx_text_from_memory(self, file_content: bytes, max_chars: int = _TEXT_BUDGET_CHARS) -> str:
+        """Extract text from DOCX file content in memory"""
+        return await self._run_extractor(_docx_extract_sync, file_content, max_chars, False)
+
+    async def _extract_txt_text_from_memory(self, file_content: bytes, max_chars: int = _TEXT_BUDGET_CHARS) -> str:
+        """Decode TXT file content in memory"""
+        # UTF-8 needs at most 4 bytes per character, so never decode more than that; slicing
+        # a memoryview keeps the upload bytes uncopied, like the BytesIO wrappers in the extractors
+        limit = max_chars * 4
+        data = file_content if len(file_content) <= limit else memoryview(file_content)[:limit]
+        return _decode_text_bytes(data)[:max_chars]
+
+    async def _extract_txt_text(self, file_path: str, max_chars: int = _TEXT_BUDGET_CHARS) -> str:
+        """Extract text from TXT file"""
         try:
+            # A few dozen KB at most, which a plain read serves faster than aiofiles' per-call hop
+            # through a worker thread. Every character takes at least one byte, so the first
+            # max_chars bytes are the whole budget of an ASCII resume; only wider UTF-8 text reads on
             with open(file_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            if text.strip():
-                return text.strip()
+                data = file.read(max_chars)
+                if data.isascii():
+                    text = data.decode("ascii")
+                else:
+                    text = _read_utf8_within_budget(file, data, max_chars)
+            # Same universal-newline translation as text-mode reads
+            return text.replace("\r\n", "\n").replace("\r", "\n").strip()
         except Exception as e:
-            logger.warning(f"PyPDF2 failed for {file_path}: {str(e)}")
+            logger.error(f"Failed to extract TXT text: {str(e)}")
+            return ""
 
-        logger.warning(f"Could not extract text from PDF {file_path}")
-        return ""
 
-    async def _extract_pdf_text_from_memory(self, file_content: bytes) -> str:
-        """Extract text from PDF file content in memory"""
+def _decode_text_bytes(data: Union[bytes, memoryview]) -> str:
+    """Decode TXT bytes, taking CPython's ASCII fast path for the (common) pure-ASCII resume"""
+    if isinstance(data, bytes):
+        # isascii() is a single C scan and needs no exception on the miss
+        if data.isascii():
+            return data.decode("ascii")
+        return data.decode("utf-8", "ignore")
+    try:
+        return str(data, "ascii")
+    except UnicodeDecodeError:
+        return str(data, "utf-8", "ignore")
+
+
+# Read size for TXT files whose first block was not pure ASCII
+_TXT_READ_CHUNK = 16384
+
+
+def _read_utf8_within_budget(file, head: bytes, max_chars: int) -> str:
+    """Decode a binary file incrementally from head until max_chars characters (or max_chars * 4
+    bytes, UTF-8's widest character) have been read, so no more of the file is read than needed"""
+    decoder = codecs.getincrementaldecoder("utf-8")("ignore")
+    parts = [decoder.decode(head)]
+    chars = len(parts[0])
+    remaining_bytes = max_chars * 4 - len(head)
+    while chars < max_chars and remaining_bytes > 0:
+        chunk = file.read(min(_TXT_READ_CHUNK, remaining_bytes))
+        if not chunk:
+            break
+        remaining_bytes -= len(chunk)
+        part = decoder.decode(chunk)
+        parts.append(part)
+        chars += len(part)
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)[:max_chars]
+
+
+# Floor for PARSER_ADAPTIVE_MAX_TOKENS: room for the JSON skeleton of even a sparse resume
+_MIN_COMPLETION_TOKENS = 1000
+
+
+@lru_cache(maxsize=8)
+def _token_encoding(model: str):
+    """tiktoken encoding for the model (cl100k_base for models it does not know); None when unavailable"""
+    if tiktoken is None:
+        return None
+    try:
         try:
-            # Try PDFPlumber first
-            import io
-            with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-                text_parts = []
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-
-                if text_parts:
-                    return "\n".join(text_parts)
-        except Exception as e:
-            logger.warning(f"PDFPlumber failed for memory content: {e}")
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use, which fails on hosts without network access
+        logger.warning(f"[llm_parser] tiktoken encoding unavailable, estimating tokens: {e}")
+        return None
+
+
+def _trim_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """Cut text to at most max_tokens tokens; ~4 characters per token when tiktoken is unavailable"""
+    encoding = _token_encoding(model)
+    if encoding is None:
+        return text[:max_tokens * 4]
+    tokens = encoding.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+
+@lru_cache(maxsize=1)
+def _load_ner():
+    """Load the spaCy NER pipeline once; None when spaCy or its model is unavailable"""
+    try:
+        import spacy
+        return spacy.load("en_core_web_sm")
+    except Exception:
+        return None
+
+
+def _is_plausible_name(text: str) -> bool:
+    """Reject section headings ("Work Experience") and titles ("Curriculum Vitae", "Software Engineer")"""
+    lower = text.lower()
+    if lower.rstrip(":") in get_parser_config_provider().get_heading_index():
+        return False
+    return not any(word.strip(".,") in _NOT_NAME_WORDS for word in lower.split())
+
+
+def _guess_name(head: str, use_ner: bool) -> Optional[str]:
+    """Candidate name from the top of the resume: spaCy PERSON entity, else a capitalised first line"""
+    if use_ner:
+        nlp = _load_ner()
+        if nlp is not None:
+            for ent in nlp(head[:500]).ents:
+                if ent.label_ == "PERSON" and _is_plausible_name(ent.text.strip()):
+                    return ent.text.strip()
+
+    for line in head.splitlines()[:5]:
+        line = line.strip()
+        if line:
+            return line if _NAME_LINE_RE.match(line) and _is_plausible_name(line) else None
+    return None
+
+
+# Synchronous extractors. These are module-level so they can be pickled into the
+# shared parser process pool (see parser_utils.run_in_parser_pool).
+
+
+def _take_within_budget(texts: Iterable[str], max_chars: int) -> List[str]:
+    """Collect non-empty texts from a lazy source, stopping once the text budget is reached"""
+    parts = []
+    total_chars = 0
+    for text in texts:
+        if text:
+            parts.append(text)
+            total_chars += len(text)
+            if total_chars >= max_chars:
+                break
+    return parts
 
-        # Fallback to PyPDF2
-        try:
-            import io
-            from PyPDF2 import PdfReader
 
-            pdf_reader = PdfReader(io.BytesIO(file_content))
-            text_parts = []
+def _has_text(text: str) -> bool:
+    # Same test as text.strip() without building a stripped copy of every paragraph and cell
+    return bool(text) and not text.isspace()
 
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
 
-            if text_parts:
-                return "\n".join(text_parts)
-        except Exception as e:
-            logger.warning(f"PyPDF2 failed for memory content: {e}")
+def _collect_page_text(pages, max_chars: int) -> str:
+    """Join page text lazily, stopping once the text budget is reached"""
+    return "\n".join(_take_within_budget(_page_texts(pages), max_chars)).strip()
 
-        logger.warning("Could not extract text from PDF memory content")
-        return ""
 
-    async def _extract_docx_text(self, file_path: str) -> str:
-        """Extract text from DOCX file"""
+def _page_texts(pages) -> Iterator[str]:
+    # One malformed page (bad font, broken content stream) costs that page, not the whole document
+    for index, page in enumerate(pages):
         try:
-            doc = Document(file_path)
-            text_parts = []
+            yield page.extract_text()
+        except Exception as e:
+            logger.debug(f"Skipping unreadable PDF page {index}: {str(e)}")
 
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_parts.append(paragraph.text)
 
-            # Also extract text from tables if any
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text_parts.append(cell.text)
+def _collect_docx_text(doc, max_chars: int, include_tables: bool) -> str:
+    """Join non-empty paragraph (and table cell) text, stopping once the text budget is reached"""
+    # python-docx rebuilds .text from the runs on every access, so each one is read once
+    texts = (paragraph.text for paragraph in doc.paragraphs)
+    # doc.tables walks the whole body on each access, so it is read once, and table-less CVs skip the chain
+    tables = doc.tables if include_tables else None
+    if tables:
+        texts = chain(texts, (cell.text for table in tables for row in table.rows for cell in row.cells))
+    return "\n".join(_take_within_budget(filter(_has_text, texts), max_chars))
 
-            return "\n".join(text_parts) if text_parts else ""
 
-        except Exception as e:
-            logger.warning(f"DOCX extraction failed for {file_path}: {str(e)}")
-            return ""
+def _sniff_format(content: bytes) -> Optional[str]:
+    """Extension implied by the content's magic bytes, or None for anything else (plain text included)"""
+    # PDF readers accept the header anywhere in the first KB
+    if b"%PDF-" in content[:1024]:
+        return ".pdf"
+    # DOCX is a zip package; the extractor reports a zip without word/document.xml
+    if content[:4] == b"PK\x03\x04":
+        return ".docx"
+    return None
 
-    async def _extract_docx_text_from_memory(self, file_content: bytes) -> str:
-        """Extract text from DOCX file content in memory"""
-        try:
-            import io
-            doc = Document(io.BytesIO(file_content))
-            text_parts = []
 
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_parts.append(paragraph.text)
+# Pages read by the first extraction task; longer PDFs with budget left are split into page ranges across the pool
+_PDF_HEAD_PAGES = 2
 
-            return "\n".join(text_parts)
-        except Exception as e:
-            logger.warning(f"DOCX extraction failed for memory content: {e}")
-            return ""
+@lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """Import a document backend on first use (None when not installed), so processes that never
+    extract a PDF/DOCX, like the API process when the parser pool is up, never load them"""
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
 
-    async def _extract_txt_text(self, file_path: str) -> str:
-        """Extract text from TXT file"""
+
+# Below this much native (PyMuPDF/PDFium) text, fall back to pdfplumber's layout-aware extraction
+_NATIVE_PDF_MIN_CHARS = 100
+# Below this much, a native engine is looking at image-only (scanned) pages: the Python engines
+# would walk every page only to find the same nothing, so the cascade stops and OCR is needed
+_IMAGE_ONLY_MAX_CHARS = 20
+
+
+def _pymupdf_page_text(doc, max_chars: int, start_page: int = 0, stop_page: Optional[int] = None) -> str:
+    """Read MuPDF text page by page, stopping once the text budget is reached"""
+    pages = range(start_page, min(stop_page or len(doc), len(doc)))
+    return "\n".join(_take_within_budget((doc[index].get_text("text") for index in pages), max_chars)).strip()
+
+
+def _pdfium_page_text(pdf, max_chars: int, start_page: int = 0, stop_page: Optional[int] = None) -> str:
+    """Read PDFium text page by page, stopping once the text budget is reached"""
+    pages = range(start_page, min(stop_page or len(pdf), len(pdf)))
+    return "\n".join(_take_within_budget(_pdfium_texts(pdf, pages), max_chars)).strip()
+
+
+def _pdfium_texts(pdf, pages: range) -> Iterator[str]:
+    # A generator, so pages past the text budget are never loaded
+    for index in pages:
+        page = pdf[index]
+        textpage = page.get_textpage()
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as file:
-                text = await file.read()
-            return text.strip()
+            yield textpage.get_text_range().replace("\r\n", "\n")
+        finally:
+            textpage.close()
+            page.close()
+
+
+async def extract_pdf_pages(source: Union[str, bytes], max_chars: int, max_pages: int = 0) -> str:
+    """Extract PDF text in the shared parser pool: the first pages in one task, then, for long
+    documents with text budget left, the remaining pages split into ranges across the pool.
+    A positive max_pages stops reading after that many pages."""
+    head_pages = min(_PDF_HEAD_PAGES, max_pages) if max_pages > 0 else _PDF_HEAD_PAGES
+    text, page_count = await run_in_parser_pool(_pdf_extract_range_sync, source, max_chars, 0, head_pages)
+    if max_pages > 0:
+        page_count = min(page_count, max_pages)
+    remaining_budget = max_chars - len(text)
+    if page_count <= head_pages or remaining_budget <= 0:
+        return text
+    if not text:
+        # Image or blank cover pages hide the text behind them, so the rest is still read, but in one
+        # task: a document that turns out to be scanned throughout ties up one pool worker, not all of them
+        rest, _ = await run_in_parser_pool(_pdf_extract_range_sync, source, max_chars, head_pages, page_count)
+        return rest
+
+    workers = min(parser_pool_size(), page_count - head_pages)
+    step = -(-(page_count - head_pages) // workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(head_pages, page_count, step)]
+    results = await asyncio.gather(*(
+        run_in_parser_pool(_pdf_extract_range_sync, source, remaining_budget, start, stop) for start, stop in ranges
+    ))
+    return "\n".join(part for part in (text, *(range_text for range_text, _ in results)) if part)[:max_chars]
+
+
+def _pdf_extract_sync(source: Union[str, bytes], max_chars: int) -> str:
+    """Extract PDF text from a file path or in-memory bytes using multiple methods"""
+    return _pdf_extract_range_sync(source, max_chars)[0]
+
+
+def _pymupdf_range(fitz, source: Union[str, bytes], max_chars: int, start_page: int,
+                   stop_page: Optional[int]) -> Tuple[str, int]:
+    doc = fitz.open(stream=source, filetype="pdf") if isinstance(source, bytes) else fitz.open(source)
+    try:
+        return _pymupdf_page_text(doc, max_chars, start_page, stop_page), len(doc)
+    finally:
+        doc.close()
+
+
+def _pdfium_range(pdfium, source: Union[str, bytes], max_chars: int, start_page: int,
+                  stop_page: Optional[int]) -> Tuple[str, int]:
+    pdf = pdfium.PdfDocument(source)
+    try:
+        return _pdfium_page_text(pdf, max_chars, start_page, stop_page), len(pdf)
+    finally:
+        pdf.close()
+
+
+def _pdfplumber_range(pdfplumber, source: Union[str, bytes], max_chars: int, start_page: int,
+                      stop_page: Optional[int]) -> Tuple[str, int]:
+    with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        return _collect_page_text(pdf.pages[start_page:stop_page], max_chars), len(pdf.pages)
+
+
+def _pypdf2_range(PyPDF2, source: Union[str, bytes], max_chars: int, start_page: int,
+                  stop_page: Optional[int]) -> Tuple[str, int]:
+    if isinstance(source, bytes):
+        pages = PyPDF2.PdfReader(io.BytesIO(source), strict=False).pages
+        return _collect_page_text(pages[start_page:stop_page], max_chars), len(pages)
+    with open(source, "rb") as file:
+        pages = PyPDF2.PdfReader(file, strict=False).pages
+        return _collect_page_text(pages[start_page:stop_page], max_chars), len(pages)
+
+
+# PDF engines in cascade order: (PARSER_PDF_BACKEND name, module, range extractor, minimum chars to accept).
+# The native engines hand off to pdfplumber's layout-aware extraction when they find too little text.
+_PDF_ENGINES = (
+    ("pymupdf", "fitz", _pymupdf_range, _NATIVE_PDF_MIN_CHARS),  # MuPDF: fastest (AGPL, so opt-in via PARSER_USE_PYMUPDF)
+    ("pdfium", "pypdfium2", _pdfium_range, _NATIVE_PDF_MIN_CHARS),  # PDFium: native, much faster than pdfplumber
+    ("pdfplumber", "pdfplumber", _pdfplumber_range, 1),  # Best for complex layouts
+    ("pypdf2", "PyPDF2", _pypdf2_range, 1),  # Last resort
+)
+
+
+def _configured_pdf_engines() -> List[Tuple]:
+    """_PDF_ENGINES narrowed to what PARSER_PDF_BACKEND / PARSER_USE_PYMUPDF allow"""
+    backend = (getattr(settings, "PARSER_PDF_BACKEND", "") or "").lower()
+    engines = []
+    for engine in _PDF_ENGINES:
+        name = engine[0]
+        if backend and name != backend:
+            continue
+        # Naming it in PARSER_PDF_BACKEND opts in as well
+        if name == "pymupdf" and backend != "pymupdf" and not getattr(settings, "PARSER_USE_PYMUPDF", False):
+            continue
+        engines.append(engine)
+    return engines
+
+
+def pdf_engine_label() -> str:
+    """The configured PDF cascade, e.g. "pdfium+pdfplumber+pypdf2", for provenance and logs"""
+    return "+".join(engine[0] for engine in _configured_pdf_engines())
+
+
+def _pdf_extract_range_sync(source: Union[str, bytes], max_chars: int, start_page: int = 0,
+                            stop_page: Optional[int] = None) -> Tuple[str, int]:
+    """Extract the text of pages [start_page, stop_page) using multiple methods; also returns the page count"""
+    label = source if isinstance(source, str) else "memory content"
+    page_count = 0
+
+    for name, module_name, extract, min_chars in _configured_pdf_engines():
+        module = _optional_module(module_name)
+        if module is None:
+            continue
+        try:
+            text, page_count = extract(module, source, max_chars, start_page, stop_page)
+            if len(text) >= min_chars:
+                return text, page_count
+            if min_chars == _NATIVE_PDF_MIN_CHARS and page_count and len(text.strip()) < _IMAGE_ONLY_MAX_CHARS:
+                logger.info(f"No text layer in PDF {label} (image-only pages); OCR required")
+                return "", page_count
         except Exception as e:
-            logger.error(f"Failed to extract TXT text: {str(e)}")
-            return ""
+            logger.warning(f"{name} failed for {label}: {str(e)}")
+
+    logger.warning(f"Could not extract text from PDF {label}")
+    return "", page_count
+
+
+# WordprocessingML tags read by the streaming DOCX extractor
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY, _W_P, _W_R, _W_T = f"{_W_NS}body", f"{_W_NS}p", f"{_W_NS}r", f"{_W_NS}t"
+_W_TBL, _W_TR, _W_TC = f"{_W_NS}tbl", f"{_W_NS}tr", f"{_W_NS}tc"
+_W_TAB, _W_BR, _W_CR = f"{_W_NS}tab", f"{_W_NS}br", f"{_W_NS}cr"
+_W_PTAB, _W_NO_BREAK_HYPHEN = f"{_W_NS}ptab", f"{_W_NS}noBreakHyphen"
+_W_HYPERLINK, _W_TYPE = f"{_W_NS}hyperlink", f"{_W_NS}type"
+# Run elements python-docx renders as a fixed character (w:br depends on its break type)
+_DOCX_RUN_CHARS = {_W_TAB: "\t", _W_PTAB: "\t", _W_CR: "\n", _W_NO_BREAK_HYPHEN: "-"}
+
+
+def _docx_run_text(run) -> str:
+    # Same run content python-docx renders: text, tabs, line breaks and non-breaking hyphens
+    parts = []
+    for node in run:
+        if node.tag == _W_T:
+            parts.append(node.text or "")
+        elif node.tag in _DOCX_RUN_CHARS:
+            parts.append(_DOCX_RUN_CHARS[node.tag])
+        elif node.tag == _W_BR and node.get(_W_TYPE, "textWrapping") == "textWrapping":
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _docx_paragraph_text(paragraph) -> str:
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            parts.append(_docx_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_docx_run_text(run) for run in child if run.tag == _W_R)
+    return "".join(parts)
+
+
+def _docx_stream_text(source: Union[str, bytes], max_chars: int, include_tables: bool) -> str:
+    """Stream body paragraphs (then table cells) from word/document.xml, matching python-docx's text output"""
+    paragraphs: List[str] = []
+    cells: List[str] = []
+    total_chars = 0
+    with zipfile.ZipFile(io.BytesIO(source) if isinstance(source, bytes) else source) as archive:
+        with archive.open("word/document.xml") as xml:
+            for _, elem in etree.iterparse(xml, events=("end",), tag=(_W_P, _W_TBL)):
+                parent = elem.getparent()
+                # Only top-level blocks; cell and text-box paragraphs are read through their container
+                if parent is None or parent.tag != _W_BODY:
+                    continue
+                if elem.tag == _W_P:
+                    text = _docx_paragraph_text(elem)
+                    if _has_text(text):
+                        paragraphs.append(text)
+                        total_chars += len(text)
+                        if total_chars >= max_chars:
+                            return "\n".join(paragraphs)
+                elif include_tables:
+                    # Table cells follow all paragraphs, as with python-docx's doc.tables
+                    for row in elem.iterchildren(_W_TR):
+                        for cell in row.iterchildren(_W_TC):
+                            cells.append("\n".join(_docx_paragraph_text(p) for p in cell.iterchildren(_W_P)))
+                # Drop finished blocks so memory stays flat on long documents
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+    return "\n".join(_take_within_budget(filter(_has_text, chain(paragraphs, cells)), max_chars))
+
+
+def _docx_extract_sync(source: Union[str, bytes], max_chars: int, include_tables: bool) -> str:
+    """Extract DOCX text from a file path or in-memory bytes"""
+    if etree is not None:
+        try:
+            return _docx_stream_text(source, max_chars, include_tables)
+        except Exception as e:
+            # Malformed or legacy files get a second chance with the full python-docx loader
+            label = source if isinstance(source, str) else "memory content"
+            logger.debug(f"Streaming DOCX extraction failed for {label}, using python-docx: {str(e)}")
+    try:
+        doc = _optional_module("docx").Document(io.BytesIO(source) if isinstance(source, bytes) else source)
+        return _collect_docx_text(doc, max_chars, include_tables)
+    except Exception as e:
+        label = source if isinstance(source, str) else "memory content"
+        logger.warning(f"DOCX extraction failed for {label}: {str(e)}")
+        return ""
@@ -0,0 +1,66 @@
+"""
+Redis-backed cache of LLM parse results keyed by extracted text.
+Re-uploads, retries and pipeline restarts of the same resume skip the LLM call.
+Fails open: any Redis error is logged and treated as a miss.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from app.services.parser_utils import json_dumpb, json_loads
+
+try:
+    from redis import asyncio as aioredis  # type: ignore
+except Exception:  # pragma: no cover
+    aioredis = None  # type: ignore
+
+_KEY_PREFIX = "parser:result"
+
+
+def result_cache_key(raw_text: str, prompt_version: str) -> str:
+    # Whitespace is collapsed first so re-exports of the same resume that only differ in
+    # line breaks or padding (common across PDF engines and DOCX re-saves) share an entry
+    normalized = " ".join(raw_text.split())
+    # BLAKE2b is faster than SHA-256 and 16 bytes is plenty for a cache key
+    digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{_KEY_PREFIX}:{prompt_version}:{digest}"
+
+
+def _redis_client():
+    # Not shared at module level: Celery tasks each run their own event loop, and a redis.asyncio
+    # connection cannot outlive the loop it was opened on. Callers close it with "async with"
+    from app.core.config import settings  # local import to avoid hard dependency at import time
+    return aioredis.from_url(settings.REDIS_URL)
+
+
+async def get_cached_result(key: str) -> Optional[Dict[str, Any]]:
+    if aioredis is None:
+        return None
+    try:
+        async with _redis_client() as redis:
+            data = await redis.get(key)
+    except Exception as e:
+        logger.warning(f"[parser.cache] get failed; reason={type(e).__name__}")
+        return None
+    if not data:
+        return None
+    try:
+        value = json_loads(data)
+    except Exception:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+async def set_cached_result(key: str, result: Dict[str, Any], ttl_seconds: int) -> None:
+    if aioredis is None or ttl_seconds <= 0:
+        return
+    # raw_text is the bulk of a result and the caller already has it, so it is not stored
+    payload = {k: v for k, v in result.items() if k != "raw_text"}
+    try:
+        async with _redis_client() as redis:
+            await redis.setex(key, ttl_seconds, json_dumpb(payload))
+    except Exception as e:
+        logger.warning(f"[parser.cache] set failed; reason={type(e).__name__}")
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
+import asyncio
 import time
 from loguru import logger
 
@@ -15,12 +16,29 @@ try:
 except Exception:  # pragma: no cover
     TTLCache = None  # type: ignore
 
+try:
+    import ahocorasick  # type: ignore  # pyahocorasick: whole-text gazetteer scans
+except Exception:  # pragma: no cover
+    ahocorasick = None  # type: ignore
+
+try:
+    # httpx is optional; used to prefetch every source concurrently without blocking the event loop
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover
+    httpx = None  # type: ignore
+
 try:
     # requests is optional; if unavailable we skip remote fetch
     import requests  # type: ignore
 except Exception:  # pragma: no cover
     requests = None  # type: ignore
 
+_CONFIG_KEYS = ("skills_gazetteer", "aliases", "section_rules", "domain_pack")
+
+# Shorter gazetteer terms ("c", "r", "go") are left out of whole-text scans: prose like "C. Smith" or
+# "go to" would match them. The skills-section token pass still maps them
+_MIN_SCAN_TERM_LEN = 3
+
 
 @dataclass
 class CachedValue:
@@ -50,6 +68,8 @@ class ParserConfigProvider:
             self._cache = {}
 
         self._last_good: Dict[str, CachedValue] = {}
+        # Indexes derived from a loaded value, keyed by source key; rebuilt when that value refreshes
+        self._derived: Dict[str, Tuple[Any, Any]] = {}
 
         # Endpoints/keys are read from env via settings when used
         self._sources = {
@@ -73,6 +93,7 @@ class ParserConfigProvider:
             return None
 
     def _fetch_remote_json(self, url: str) -> Any:
+        # Blocking fallback for a cold miss; refresh_all normally keeps the caches warm
         if not url or requests is None:
             raise RuntimeError("remote fetch not configured or requests unavailable")
         try:
@@ -109,12 +130,56 @@ class ParserConfigProvider:
             else:
                 logger.warning(f"[parser.config] using empty default for {key}; reason={e}")
 
+        self._store(key, CachedValue(value=value, last_refresh_ts=ts, source=source))
+        return value, ts, source
+
+    def _store(self, key: str, cv: CachedValue) -> None:
         # Save in caches
-        cv = CachedValue(value=value, last_refresh_ts=ts, source=source)
         if hasattr(self._cache, "__setitem__"):
             self._cache[key] = cv  # type: ignore
         self._last_good[key] = cv
-        return value, ts, source
+
+    async def refresh_all(self) -> None:
+        """
+        Fetch every configured source concurrently and refresh the caches in one pass.
+        Unconfigured keys stay on the lazy default path; a failed fetch keeps the cached/last-good value.
+        """
+        urls = {key: url for key in _CONFIG_KEYS if (url := self._get_source(key))}
+        if not urls or httpx is None:
+            return
+        async with httpx.AsyncClient(timeout=3) as client:
+            responses = await asyncio.gather(*(client.get(url) for url in urls.values()), return_exceptions=True)
+        for key, resp in zip(urls, responses):
+            try:
+                if isinstance(resp, BaseException):
+                    raise resp
+                resp.raise_for_status()
+                data = resp.json()
+            except Exception as e:  # no PII
+                logger.warning(f"[parser.config] prefetch failed for {key}; reason={type(e).__name__}")
+                continue
+            if isinstance(data, (dict, list)):
+                self._store(key, CachedValue(value=data, last_refresh_ts=time.time(), source="remote"))
+
+    def start_background_refresh(self) -> Optional["asyncio.Task[None]"]:
+        """
+        Schedule refresh_all now and then shortly before each TTL expiry, so lookups never hit a cold cache.
+        Returns the task for the caller to cancel on shutdown; None when no source is configured.
+        Only this process's provider is refreshed: parser pool workers hold their own singletons, which
+        reload on demand through the blocking _get_or_load path when their TTL entries expire.
+        """
+        if httpx is None or not any(self._get_source(key) for key in _CONFIG_KEYS):
+            return None
+
+        async def _loop() -> None:
+            while True:
+                try:
+                    await self.refresh_all()
+                except Exception as e:
+                    logger.warning(f"[parser.config] background refresh failed; reason={type(e).__name__}")
+                await asyncio.sleep(max(self.ttl * 0.9, 1.0))
+
+        return asyncio.create_task(_loop())
 
     # Public getters
     def get_skills_gazetteer(self) -> Dict[str, Dict[str, Any]]:
@@ -125,10 +190,77 @@ class ParserConfigProvider:
         value, _, _ = self._get_or_load("aliases", default_value={})
         return value if isinstance(value, dict) else {}
 
+    def get_alias_index(self) -> Dict[str, str]:
+        """
+        Flat {alias_or_canonical_lower: canonical} lookup over the skills gazetteer.
+        Built once per gazetteer load so skill mining is a dict hit per token instead of a scan of every entry.
+        """
+        gaz = self.get_skills_gazetteer()
+        cached = self._derived.get("alias_index")
+        if cached is not None and cached[0] is gaz:
+            return cached[1]
+        index: Dict[str, str] = {}
+        for canonical, meta in gaz.items():
+            als = (meta.get("aliases") or []) if isinstance(meta, dict) else []
+            for a in als:
+                if isinstance(a, str):
+                    # First gazetteer entry listing an alias wins
+                    index.setdefault(a.lower(), canonical)
+        # A direct canonical match takes precedence over any alias
+        for canonical in gaz:
+            index[canonical] = canonical
+        self._derived["alias_index"] = (gaz, index)
+        return index
+
+    def get_skills_automaton(self) -> Any:
+        """
+        Aho-Corasick automaton over the gazetteer canonicals and aliases of at least _MIN_SCAN_TERM_LEN
+        characters, yielding (term_len, canonical, category).
+        Rebuilt with the gazetteer on TTL refresh; None when pyahocorasick is missing or the gazetteer is empty.
+        """
+        gaz = self.get_skills_gazetteer()
+        cached = self._derived.get("skills_automaton")
+        if cached is not None and cached[0] is gaz:
+            return cached[1]
+        automaton = None
+        if ahocorasick is not None and gaz:
+            automaton = ahocorasick.Automaton()
+            for term, canonical in self.get_alias_index().items():
+                if len(term.strip()) < _MIN_SCAN_TERM_LEN:
+                    continue
+                meta = gaz.get(canonical)
+                category = meta.get("category") if isinstance(meta, dict) else None
+                automaton.add_word(term, (len(term), canonical, category))
+            if len(automaton):
+                automaton.make_automaton()
+            else:
+                automaton = None
+        self._derived["skills_automaton"] = (gaz, automaton)
+        return automaton
+
     def get_section_rules(self) -> Dict[str, List[str]]:
         value, _, _ = self._get_or_load("section_rules", default_value={})
         return value if isinstance(value, dict) else {}
 
+    def get_heading_index(self) -> Dict[str, str]:
+        """
+        Flat {heading_or_synonym_lower: section_key_lower} lookup over the section rules.
+        Built once per rules load so segmentation is a dict hit per line; the first rule matching a heading wins.
+        """
+        rules = self.get_section_rules()
+        cached = self._derived.get("heading_index")
+        if cached is not None and cached[0] is rules:
+            return cached[1]
+        index: Dict[str, str] = {}
+        for key, syns in rules.items():
+            k = str(key).lower()
+            index.setdefault(k, k)
+            for syn in syns or []:
+                if isinstance(syn, str):
+                    index.setdefault(syn.lower(), k)
+        self._derived["heading_index"] = (rules, index)
+        return index
+
     def get_domain_pack(self) -> Dict[str, Any]:
         value, _, _ = self._get_or_load("domain_pack", default_value={})
         return value if isinstance(value, dict) else {}
@@ -136,7 +268,7 @@ class ParserConfigProvider:
     def get_status(self) -> Dict[str, Any]:
         # Exposes TTL and last refresh timestamps without PII
         status: Dict[str, Any] = {"ttl_seconds": self.ttl, "items": {}}
-        for key in ["skills_gazetteer", "aliases", "section_rules", "domain_pack"]:
+        for key in _CONFIG_KEYS:
             cv = self._last_good.get(key)
             status["items"][key] = {
                 "last_refresh_ts": cv.last_refresh_ts if cv else None,
@@ -7,12 +7,59 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from loguru import logger
+import asyncio
+import copy
+import hashlib
+import multiprocessing
+import os
 import time
 import re
 
+try:
+    from cachetools import TTLCache
+except Exception:  # pragma: no cover
+    TTLCache = None  # type: ignore
+
 from .parser_config import get_parser_config_provider
-from .parser_utils import parse_date_range, compute_overlap_safe_years, is_probable_location
+from .parser_utils import parse_date_range, compute_overlap_safe_years, is_probable_location, parser_pool_size, run_in_parser_pool
 from .parser_schema import validate_parsed_resume
+from .resume_parser import ResumeParser
+
+# Skill/language list delimiters are fixed single characters, so fold them onto "|" and str.split
+# instead of running a character-class regex split per line
+_SKILL_SPLIT_TRANS = str.maketrans(dict.fromkeys(",;/•-", "|"))
+
+# Compiled once at import; these run per line on every parse
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+# Country code only after "+", and parentheses only as a balanced pair: fewer optional pieces for
+# the engine to try at each digit run, and no capture group (only the full match is used)
+_PHONE_RE = re.compile(r"(?:\+\d{1,3}[-.\s]?)?(?:\(\d{2,4}\)|\d{2,4})[-.\s]?\d{3,4}[-.\s]?\d{3,4}")
+_LINK_PATTERNS = [
+    (re.compile(p, re.IGNORECASE), key)
+    for p, key in [(r"linkedin\.com/in/[\w-]+", "linkedin"), (r"github\.com/[\w.-]+", "github"), (r"https?://[^\s]+", "other")]
+]
+_YEAR_RE = re.compile(r"(19|20)\d{2}")
+_TITLE_RE = re.compile(r"\b(manager|engineer|developer|analyst|specialist|director|lead|architect)\b", re.I)
+_WS_RE = re.compile(r"\s+")
+
+# Section headings that leak into skill token lists
+_SKILL_STOPWORDS = frozenset({
+    "skills", "experience", "education", "contact", "summary", "projects", "awards", "certifications", "languages",
+})
+
+# Contact-region lines mentioning these are links or headings, never a location
+_NON_LOCATION_TOKENS = ("linkedin", "github", "email", "phone", "skills", "experience", "education")
+
+_HASH_CHUNK_BYTES = 64 * 1024
+
+
+def _file_digest(file_path: str) -> str:
+    # BLAKE2b is faster than SHA-256 and 16 bytes is plenty for a cache key
+    h = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
 
 @dataclass
@@ -47,23 +94,21 @@ class DocumentTypeDetector:
 
 
 class DigitalExtractors:
+    def __init__(self) -> None:
+        # Reuse existing extraction from ResumeParser; it keeps no per-call state, so one instance serves every call
+        self._rp = ResumeParser()
+
     async def extract_pdf(self, file_path: str) -> Dict[str, Any]:
-        # Reuse existing extraction for PDFs from ResumeParser
-        from app.services.resume_parser import ResumeParser
-        rp = ResumeParser()
-        text = await rp._extract_pdf_text(file_path)  # type: ignore[attr-defined]
-        return {"text": text, "backend": "pdfplumber+pypdf2"}
+        from .llm_resume_parser import pdf_engine_label  # same deferred import as ResumeParser's PDF path
+        text = await self._rp._extract_pdf_text(file_path)  # type: ignore[attr-defined]
+        return {"text": text, "backend": pdf_engine_label()}
 
     async def extract_doc(self, file_path: str) -> Dict[str, Any]:
-        from app.services.resume_parser import ResumeParser
-        rp = ResumeParser()
-        text = await rp._extract_docx_text(file_path)  # type: ignore[attr-defined]
+        text = await self._rp._extract_docx_text(file_path)  # type: ignore[attr-defined]
         return {"text": text, "backend": "python-docx"}
 
     async def extract_txt(self, file_path: str) -> Dict[str, Any]:
-        from app.services.resume_parser import ResumeParser
-        rp = ResumeParser()
-        text = await rp._extract_txt_text(file_path)  # type: ignore[attr-defined]
+        text = await self._rp._extract_txt_text(file_path)  # type: ignore[attr-defined]
         return {"text": text, "backend": "plain"}
 
 
@@ -73,6 +118,9 @@ class ParserOrchestrator:
         self.detector = DocumentTypeDetector()
         self.extractors = DigitalExtractors()
         self.provider = get_parser_config_provider()
+        # Parse results by file content, so re-uploads skip extraction entirely. Entries expire with the
+        # provider TTL so a refreshed gazetteer or section rules are picked up
+        self._result_cache = TTLCache(maxsize=1024, ttl=self.provider.ttl) if TTLCache is not None else None
 
     async def parse(self, file_path: str, filename: Optional[str] = None, size: Optional[int] = None) -> Dict[str, Any]:
         t0 = time.time()
@@ -81,6 +129,19 @@ class ParserOrchestrator:
         backend = ""
         text = ""
         logger.info("[parser] start file={} ext={} size={}", filename or "", (ext or "").lstrip("."), int(size or 0))
+        cache_key = None
+        if self._result_cache is not None:
+            try:
+                cache_key = (await asyncio.to_thread(_file_digest, file_path), ext)
+            except OSError:
+                cache_key = None  # extraction reports the unreadable file below
+            cached = self._result_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                obj = copy.deepcopy(cached)
+                obj["file"]["name"] = filename or ""
+                obj["file"]["size"] = int(size or 0)
+                logger.info("[parser] done cached=true duration_ms={} file={} ", int((time.time() - t0) * 1000), filename or "")
+                return obj
         try:
             if ext == ".pdf":
                 res = await self.extractors.extract_pdf(file_path)
@@ -104,11 +165,13 @@ class ParserOrchestrator:
 
         # Section segmentation (rule-based minimal viable; rules from provider)
         t1 = time.time()
-        sections = self._segment_sections(text)
+        # Split once; segmentation and the contact fallback both work on lines
+        lines = text.splitlines()
+        sections = self._segment_sections(lines)
         logger.info("[parser] segmented sections in {}ms", int((time.time() - t1) * 1000))
 
         # Contacts: from CONTACT section or top of doc
-        candidate = self._extract_contacts(sections, text)
+        candidate = self._extract_contacts(sections, lines)
         logger.info("[parser] contacts emails={} phones={} links={} ", len(candidate.get("emails") or []), len(candidate.get("phones") or []), len((candidate.get("links") or {})))
 
         # Experience/Education minimal extraction
@@ -118,12 +181,11 @@ class ParserOrchestrator:
         # Map education lines to objects to satisfy schema
         education_lines = sections.get("education", []) or []
         education = []
-        import re as _re
         for ln in education_lines:
             if not ln or len(ln) < 2:
                 continue
             year = None
-            m = _re.search(r"(19|20)\d{2}", ln)
+            m = _YEAR_RE.search(ln)
             if m:
                 try:
                     year = int(m.group(0))
@@ -133,13 +195,13 @@ class ParserOrchestrator:
 
         # Skills miner: from skills section + highlights
         t3 = time.time()
-        skills = self._mine_skills(sections)
+        skills = self._mine_skills(sections, text)
         logger.info("[parser] skills mined={} ", len(skills))
 
         # Languages/Certs/Projects minimal passthrough (map languages to objects)
         lang_tokens: list[str] = []
         for ln in sections.get("languages", []) or []:
-            for t in [t.strip() for t in _re.split(r"[,;|/•\-]", ln) if t.strip()]:
+            for t in [t.strip() for t in ln.translate(_SKILL_SPLIT_TRANS).split("|") if t.strip()]:
                 if len(t) >= 2:
                     lang_tokens.append(t)
         seen_lang = set()
@@ -181,9 +243,38 @@ class ParserOrchestrator:
         if not ok:
             logger.info("[parser] schema_warnings={} first={} ", len(warns), (warns[0] if warns else ""))
             obj["warnings"].extend(warns[:10])
+        if cache_key is not None:
+            self._result_cache[cache_key] = copy.deepcopy(obj)
         logger.info("[parser] done backend={} duration_ms={} file={} ", backend, int((time.time() - t0) * 1000), filename or "")
         return obj
 
+    async def parse_many(self, paths: List[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse many files across the shared parser process pool, at most `workers` at a time.
+        Returns one {filename, status, time_ms, result | error} record per path, in input order;
+        a failing file is reported in its record instead of failing the batch.
+        """
+        semaphore = asyncio.Semaphore(workers or parser_pool_size())
+        # Daemonic processes (e.g. Celery prefork workers) cannot start a pool: parse on this loop
+        in_process = multiprocessing.current_process().daemon
+
+        async def parse_one(path: str) -> Dict[str, Any]:
+            filename = os.path.basename(path)
+            async with semaphore:
+                t0 = time.time()
+                try:
+                    size = os.path.getsize(path)
+                    if in_process:
+                        result = await self.parse(path, filename, size)
+                    else:
+                        result = await run_in_parser_pool(_parse_file_sync, path, filename, size)
+                    return {"filename": filename, "status": "ok", "time_ms": int((time.time() - t0) * 1000), "result": result}
+                except Exception as e:
+                    logger.warning("[parser] parse_many failed file={} err={}", filename, type(e).__name__)
+                    return {"filename": filename, "status": "error", "time_ms": int((time.time() - t0) * 1000), "error": type(e).__name__}
+
+        return list(await asyncio.gather(*(parse_one(path) for path in paths)))
+
     def _empty_result(self, name: Optional[str], ext: Optional[str], size: Optional[int], warnings: List[str]) -> Dict[str, Any]:
         return {
             "file": {"name": name or "", "ext": (ext or "").lstrip("."), "size": int(size or 0), "pages": 0},
@@ -202,26 +293,18 @@ class ParserOrchestrator:
             "warnings": warnings,
         }
 
-    def _segment_sections(self, text: str) -> Dict[str, Any]:
-        rules = self.provider.get_section_rules() or {}
+    def _segment_sections(self, lines: List[str]) -> Dict[str, Any]:
         # Minimal: split by headings from rules; default fallbacks
         buckets: Dict[str, List[str]] = {
             "summary": [], "skills": [], "experience": [], "education": [], "certifications": [], "projects": [], "languages": [], "awards": [], "publications": [], "contact": []
         }
-        lines = [l.strip() for l in text.splitlines()]
+        headings = self.provider.get_heading_index()  # {heading or synonym: section key}, prebuilt per rules load
         current = None
-        synonyms = {k.lower(): [s.lower() for s in v] for k, v in rules.items()} if rules else {}
-        def match_heading(line: str) -> Optional[str]:
-            l = line.lower().strip(": ")
-            for key, syns in synonyms.items():
-                if l == key or l in syns:
-                    return key
-            # simple heuristics
-            if l in buckets:
-                return l
-            return None
-        for ln in lines:
-            head = match_heading(ln)
+        for raw in lines:
+            ln = raw.strip()
+            l = ln.lower().strip(": ")
+            # rule headings first, then bare bucket names as a simple heuristic
+            head = headings.get(l) or (l if l in buckets else None)
             if head:
                 current = head
                 continue
@@ -242,19 +325,21 @@ class ParserOrchestrator:
             "contact": buckets["contact"],
         }
 
-    def _extract_contacts(self, sections: Dict[str, Any], full_text: str) -> Dict[str, Any]:
-        import re
-        region = "\n".join((sections.get("contact") or [])[:20]) or "\n".join(full_text.splitlines()[:25])
-        emails = list({m.group(0) for m in re.finditer(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", region)})[:3]
-        phones = list({m.group(0) for m in re.finditer(r"(\+?\d{1,3}[-.\s]?)?\(?\d{2,4}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}", region)})[:3]
+    def _extract_contacts(self, sections: Dict[str, Any], lines: List[str]) -> Dict[str, Any]:
+        region = "\n".join((sections.get("contact") or [])[:20]) or "\n".join(lines[:25])
+        emails = list({m.group(0) for m in _EMAIL_RE.finditer(region)})[:3]
+        phones = list({m.group(0) for m in _PHONE_RE.finditer(region)})[:3]
         links = {}
-        for pat, key in [(r"linkedin\.com/in/[\w-]+", "linkedin"), (r"github\.com/[\w.-]+", "github"), (r"https?://[^\s]+", "other")]:
-            m = re.search(pat, region, flags=re.IGNORECASE)
+        for pat, key in _LINK_PATTERNS:
+            m = pat.search(region)
             if m:
                 links[key] = m.group(0)
         loc_line = None
         for ln in region.splitlines():
-            if "," in ln and not any(tok in ln.lower() for tok in ["linkedin", "github", "email", "phone", "skills", "experience", "education"]):
+            if "," not in ln:
+                continue
+            lc = ln.lower()
+            if not any(tok in lc for tok in _NON_LOCATION_TOKENS):
                 loc_line = ln.strip()
                 break
         location = {}
@@ -285,7 +370,7 @@ class ParserOrchestrator:
                 cur = {"organization": "", "title": "", "location": "", "from": f"{start[0]:04d}-{start[1]:02d}", "to": f"{end[0]:04d}-{end[1]:02d}", "current": False, "duration_years": 0.0, "highlights": [], "tech_or_tools": [], "page_spans": []}
             else:
                 # heuristics for title/org/location
-                if not cur.get("title") and re.search(r"\b(manager|engineer|developer|analyst|specialist|director|lead|architect)\b", ln, flags=re.I):
+                if not cur.get("title") and _TITLE_RE.search(ln):
                     cur["title"] = ln
                 elif not cur.get("organization") and len(ln) > 3 and not any(ch.isdigit() for ch in ln):
                     cur["organization"] = ln
@@ -308,46 +393,65 @@ class ParserOrchestrator:
                 pass
         return jobs, years
 
-    def _mine_skills(self, sections: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _mine_skills(self, sections: Dict[str, Any], full_text: str = "") -> List[Dict[str, Any]]:
         provider = self.provider
         gaz = provider.get_skills_gazetteer()  # {canonical: {"aliases": [...], "category": str}}
         aliases = provider.get_aliases()  # {alias: canonical}
+        alias_index = provider.get_alias_index()  # {alias or canonical: canonical}, prebuilt per gazetteer load
         # Candidate tokens from skills section and highlights only
         cand: List[str] = []
         for s in sections.get("skills", []):
-            cand.extend([t.strip() for t in re.split(r"[,;|/•\-]", s) if t.strip()])
+            cand.extend([t.strip() for t in s.translate(_SKILL_SPLIT_TRANS).split("|") if t.strip()])
         for ln in sections.get("experience", []):
-            if ln.startswith("•") or ln.startswith("-"):
-                cand.extend([t.strip() for t in re.split(r"[,;|/•\-]", ln) if t.strip()])
+            if ln.startswith(("•", "-")):
+                cand.extend([t.strip() for t in ln.translate(_SKILL_SPLIT_TRANS).split("|") if t.strip()])
         # Canonicalize
         out: List[Dict[str, Any]] = []
         seen = set()
         for tok in cand:
-            t = re.sub(r"\s+", " ", tok).strip()
+            t = _WS_RE.sub(" ", tok).strip()
             if not t or len(t) < 2:
                 continue
+            key = t.lower()
             # drop location/header-like tokens
-            if is_probable_location(t) or t.lower() in {"skills", "experience", "education", "contact"}:
+            if key in _SKILL_STOPWORDS or is_probable_location(t):
                 continue
-            key = t.lower()
             can = aliases.get(key) if isinstance(aliases, dict) else None
-            if not can and isinstance(gaz, dict):
-                # direct canonical match
-                if key in gaz:
-                    can = key
-                else:
-                    # alias lookup within gaz values
-                    for c, meta in gaz.items():
-                        als = [a.lower() for a in (meta.get("aliases") or [])]
-                        if key in als:
-                            can = c
-                            break
+            if not can:
+                # direct canonical match, else alias lookup within gaz values
+                can = alias_index.get(key)
             canonical = can or t
             cat = None
-            if isinstance(gaz, dict) and canonical.lower() in gaz:
-                cat = gaz[canonical.lower()].get("category")
+            canonical_key = key if canonical is t else canonical.lower()
+            if isinstance(gaz, dict) and canonical_key in gaz:
+                cat = gaz[canonical_key].get("category")
             if canonical not in seen:
                 seen.add(canonical)
                 out.append({"name": canonical, "category": cat})
+        # Gazetteer terms mentioned anywhere else in the resume, found in one pass over the text
+        automaton = provider.get_skills_automaton()
+        if automaton is not None and full_text:
+            lowered = full_text.lower()
+            for end, (length, canonical, cat) in automaton.iter(lowered):
+                if canonical in seen:
+                    continue
+                # Whole-term hits only, so "go" does not match inside "google"
+                start = end - length + 1
+                if (start > 0 and lowered[start - 1].isalnum()) or (end + 1 < len(lowered) and lowered[end + 1].isalnum()):
+                    continue
+                seen.add(canonical)
+                out.append({"name": canonical, "category": cat})
         return out[:50]
 
+
+# One orchestrator per pool worker, so its config provider (gazetteers, aliases, section rules) is
+# loaded once per process rather than once per file
+_worker_orchestrator: Optional[ParserOrchestrator] = None
+
+
+def _parse_file_sync(file_path: str, filename: str, size: int) -> Dict[str, Any]:
+    """Pool worker entry point for ParserOrchestrator.parse_many"""
+    global _worker_orchestrator
+    if _worker_orchestrator is None:
+        _worker_orchestrator = ParserOrchestrator()
+    return asyncio.run(_worker_orchestrator.parse(file_path, filename, size))
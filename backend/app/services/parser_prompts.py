@@ -0,0 +1,434 @@
+"""
+Prompt templates for the LLM resume parser.
+Templates are plain format strings built once at import. The single-placeholder
+ones are also pre-split into (head, tail) pairs so a prompt is two concatenations
+rather than a brace-scanning format of the whole multi-KB body on every parse;
+multi-placeholder ones are pre-parsed into (literal, field) segments for render_prompt.
+"""
+from string import Formatter
+from typing import Any, Mapping, Optional, Tuple
+
+
+def _split_on_text(template: str) -> Tuple[str, str]:
+    """Split a template around its one {limited_text} placeholder, unescaping doubled braces"""
+    head, tail = template.split("{limited_text}")
+    return (
+        head.replace("{{", "{").replace("}}", "}"),
+        tail.replace("{{", "{").replace("}}", "}"),
+    )
+
+
+def _parse_segments(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Parse a template once into (literal, field name) segments, with doubled braces already unescaped"""
+    return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+
+def render_prompt(segments: Tuple[Tuple[str, Optional[str]], ...], values: Mapping[str, Any]) -> str:
+    """Same result as template.format_map(values) for plain {name} fields, without re-scanning the template"""
+    return "".join(literal + str(values[field]) if field is not None else literal for literal, field in segments)
+
+
+# Retry strategy 1: core fields with granular skill extraction
+BASIC_STRUCTURED_PROMPT = """You are an intelligent resume parser focused on COMPREHENSIVE and GRANULAR extraction.
+
+CRITICAL EXTRACTION RULES:
+1. BE GRANULAR: "AWS(EC2, S3)" → extract AWS, EC2, S3 as separate skills
+2. BE COMPREHENSIVE: Extract ALL technologies, frameworks, tools, and methodologies mentioned
+3. INCLUDE SOFT SKILLS: Communication, collaboration, problem-solving, leadership skills
+4. FRAMEWORK SPECIFICITY: "Django REST Framework" ≠ "Django" - extract both if mentioned
+5. PARENTHETICAL DETAILS: Extract content in parentheses as additional skills
+6. IGNORE ARTIFACTS: Handle PDF formatting issues contextually
+
+EXTRACTION SOURCES: Skills sections, job descriptions, project tech stacks, certifications, tools mentioned
+
+Resume text to analyze:
+{limited_text}
+
+Return JSON with this structure:
+{{
+  "contact_info": {{
+    "name": "candidate name",
+    "email": "email address",
+    "phone": "phone number",
+    "location": "location"
+  }},
+  "skills": ["skill1", "skill2", "skill3"],
+  "experience": [
+    {{
+      "title": "job title",
+      "company": "company name",
+      "duration": "time period",
+      "description": "key responsibilities"
+    }}
+  ],
+  "education": [
+    {{
+      "degree": "degree name",
+      "institution": "school name",
+      "year": "graduation year"
+    }}
+  ],
+  "professional_summary": "brief summary"
+}}"""
+
+# Retry strategy 2: flat fields for maximum compatibility
+MINIMAL_JSON_PROMPT = """Extract key info from this resume as JSON:
+
+{limited_text}
+
+JSON format:
+{{
+  "name": "",
+  "email": "",
+  "phone": "",
+  "skills": [],
+  "summary": ""
+}}"""
+
+# Retry strategy 3: last resort
+ULTRA_SIMPLE_PROMPT = """Resume text: {limited_text}
+
+Return JSON with name, email, phone, and skills only."""
+
+# Full evidence-annotated schema
+UNIVERSAL_PROMPT = """# Advanced NLP Resume Parser - Extract comprehensive information with high accuracy
+
+## Instructions:
+You are an expert resume parser with deep understanding of various resume formats, layouts, and styles.
+Use contextual understanding and natural language processing to extract information accurately.
+
+### Key Principles:
+1. **Context-Aware Extraction**: Don't rely on section headers - understand content contextually
+2. **Format Flexibility**: Handle diverse resume formats (chronological, functional, hybrid, creative)
+3. **Semantic Understanding**: Recognize skills, experience, and qualifications regardless of how they're presented
+4. **Accuracy Over Speed**: Prioritize correctness and completeness
+5. **Evidence-Based**: Always provide evidence spans for extracted information
+
+## Resume Text to Analyze:
+```
+{limited_text}
+```
+
+## File Metadata:
+- Filename: {filename}
+- File Type: {file_extension}
+- File Size: {file_size} bytes
+- Processing Time: {now}
+
+## Enhanced Output Structure (JSON only):
+
+{{
+  "prompt_passed": true,
+  "prompt_metadata": {{
+    "filename": "{filename}",
+    "mime_type": "{mime_type}",
+    "file_size_bytes": {file_size},
+    "source": "enhanced_nlp_parser",
+    "processing_time": "{now}",
+    "parser_version": "2.0"
+  }},
+
+  "document_analysis": {{
+    "detected_language": "<BCP-47 language code (e.g., 'en-US') or null>",
+    "estimated_pages": <integer or null>,
+    "resume_format": "<chronological|functional|hybrid|creative|academic|other>",
+    "content_quality": {{
+      "completeness_score": <0.0-1.0>,
+      "structure_clarity": <0.0-1.0>,
+      "information_density": <0.0-1.0>
+    }},
+    "layout_notes": [
+      "Observations about document structure, formatting, and organization"
+    ]
+  }},
+
+  "extracted_sections": {{
+    "professional_summary": {{
+      "content": "<extracted professional summary/objective text>",
+      "source_lines": ["<verbatim lines from resume>"],
+      "confidence": <0.0-1.0>,
+      "section_type": "<summary|objective|profile|about>"
+    }},
+    "core_skills": {{
+      "technical_skills": [
+        {{
+          "skill": "<skill name>",
+          "category": "<programming|framework|tool|database|cloud|etc>",
+          "evidence": "<where this skill was mentioned>",
+          "confidence": <0.0-1.0>
+        }}
+      ],
+      "soft_skills": [
+        {{
+          "skill": "<soft skill name>",
+          "evidence": "<context where mentioned>",
+          "confidence": <0.0-1.0>
+        }}
+      ],
+      "certifications": [
+        {{
+          "name": "<certification name>",
+          "issuer": "<issuing organization>",
+          "date": "<date if available>",
+          "status": "<active|expired|in_progress|null>"
+        }}
+      ]
+    }},
+    "work_experience": [
+      {{
+        "job_title": "<position title>",
+        "company": "<company name>",
+        "location": "<work location if mentioned>",
+        "duration": {{
+          "start_date": "<parsed start date or text>",
+          "end_date": "<parsed end date or 'Present'>",
+          "duration_text": "<original duration text>"
+        }},
+        "responsibilities": [
+          "<key responsibility or achievement>"
+        ],
+        "technologies_used": ["<technology>"],
+        "achievements": [
+          "<quantified achievement or impact>"
+        ],
+        "confidence": <0.0-1.0>
+      }}
+    ],
+    "education": [
+      {{
+        "degree": "<degree type and field>",
+        "institution": "<school/university name>",
+        "location": "<institution location if available>",
+        "graduation_date": "<date or year>",
+        "gpa": "<GPA if mentioned>",
+        "honors": ["<academic honors or distinctions>"],
+        "relevant_coursework": ["<relevant courses if listed>"],
+        "confidence": <0.0-1.0>
+      }}
+    ],
+    "projects": [
+      {{
+        "name": "<project name>",
+        "description": "<project description>",
+        "technologies": ["<technology used>"],
+        "duration": "<project timeline>",
+        "role": "<your role in project>",
+        "outcomes": ["<project results or impact>"],
+        "url": "<project URL if available>"
+      }}
+    ]
+  }},
+
+  "contact_information": {{
+    "full_name": {{
+      "value": "<candidate's full name as it appears>",
+      "parsed_components": {{
+        "first_name": "<first name>",
+        "last_name": "<last name>",
+        "middle_name": "<middle name or initial if present>"
+      }},
+      "evidence_lines": ["<lines where name appears>"],
+      "confidence": <0.0-1.0>
+    }},
+    "email_addresses": [
+      {{
+        "email": "<email address>",
+        "type": "<personal|work|academic|other>",
+        "evidence": "<where found in resume>",
+        "confidence": <0.0-1.0>
+      }}
+    ],
+    "phone_numbers": [
+      {{
+        "number": "<phone number as written>",
+        "type": "<mobile|home|work|other>",
+        "country_code": "<detected country code>",
+        "evidence": "<where found>",
+        "confidence": <0.0-1.0>
+      }}
+    ],
+    "online_profiles": [
+      {{
+        "platform": "<LinkedIn|GitHub|Portfolio|Twitter|etc>",
+        "url": "<full URL>",
+        "username": "<username if extractable>",
+        "evidence": "<where found>",
+        "confidence": <0.0-1.0>
+      }}
+    ],
+    "location": {{
+      "current_location": "<city, state/country as mentioned>",
+      "willing_to_relocate": <true|false|null>,
+      "remote_work": <true|false|null>,
+      "evidence": "<where location info was found>",
+      "confidence": <0.0-1.0>
+    }}
+  }},
+
+  "key_insights": [
+    {{
+      "category": "<technical_strength|leadership|achievement|domain_expertise|career_progression>",
+      "insight": "<specific insight about the candidate>",
+      "supporting_evidence": "<verbatim text that supports this insight>",
+      "relevance_score": <0.0-1.0>,
+      "confidence": <0.0-1.0>
+    }}
+  ],
+
+  "quality_assessment": {{
+    "overall_completeness": <0.0-1.0>,
+    "information_richness": <0.0-1.0>,
+    "structure_clarity": <0.0-1.0>,
+    "missing_elements": [
+      "<list of typical resume elements that appear to be missing>"
+    ],
+    "extraction_challenges": [
+      "<any formatting or parsing challenges encountered>"
+    ],
+    "confidence_factors": [
+      "<factors that increase or decrease confidence in the extraction>"
+    ]
+  }},
+
+  "parsing_metadata": {{
+    "extraction_method": "enhanced_nlp",
+    "text_length_processed": <number of characters>,
+    "sections_identified": <number of distinct sections found>,
+    "confidence_distribution": {{
+      "high_confidence": <percentage of extractions with >0.8 confidence>,
+      "medium_confidence": <percentage with 0.5-0.8 confidence>,
+      "low_confidence": <percentage with <0.5 confidence>
+    }},
+    "processing_notes": [
+      "Step 1: Analyzed document structure and identified key sections",
+      "Step 2: Extracted contact information using contextual cues",
+      "Step 3: Parsed work experience with attention to dates and achievements",
+      "Step 4: Identified skills through semantic analysis rather than keyword matching",
+      "Step 5: Validated extracted information against evidence in text"
+    ]
+  }}
+}}
+
+Return ONLY the JSON object, no additional text or formatting."""
+
+# Primary instructions and schema used by _parse_with_llm. These are static and sent
+# as the system message ahead of the resume text, so provider prompt-prefix caching can reuse them.
+ENHANCED_NLP_SYSTEM_PROMPT = """You are an expert resume parser with advanced contextual understanding.
+
+CRITICAL INSTRUCTIONS:
+1. COMPREHENSIVE EXTRACTION: Extract ALL skills, technologies, and tools mentioned - be granular, not general
+2. ARTIFACT HANDLING: This text may contain PDF artifacts (Á, µ, à, ¹, ², ³, S, N) - interpret contextually
+3. DETAILED PARSING: When you see "AWS(EC2, S3)" extract: AWS, EC2, S3 as separate skills
+4. FRAMEWORK SPECIFICITY: "Django REST Framework" is different from "Django" - extract both
+5. SOFT SKILLS: Include communication, collaboration, problem-solving skills explicitly mentioned
+6. PARENTHETICAL DETAILS: Extract details in parentheses as separate items (e.g., "CI/CD(Github Actions)" → CI/CD, Github Actions)
+
+PARSING STRATEGY:
+- Look for skills in: SKILLS sections, Tech Stack lists, job descriptions, project descriptions
+- Extract both general (AWS) and specific (EC2, S3) technologies
+- Include soft skills, methodologies (Agile), and processes
+- Be comprehensive - don't generalize or summarize
+
+The resume text is in the user message. Extract the following information and return as JSON:
+
+{
+  "prompt_passed": true,
+  "contact_info": {
+    "name": "Full name of candidate",
+    "email": "Email address",
+    "phone": "Phone number",
+    "location": "Current location",
+    "linkedin": "LinkedIn profile URL if present"
+  },
+  "professional_summary": "Professional summary or objective",
+  "skills": ["List", "of", "technical", "skills"],
+  "experience": [
+    {
+      "title": "Job title",
+      "company": "Company name",
+      "duration": "Employment duration",
+      "description": "Key responsibilities and achievements",
+      "technologies": ["Technologies", "used"]
+    }
+  ],
+  "education": [
+    {
+      "degree": "Degree type and field",
+      "institution": "School/University name",
+      "year": "Graduation year",
+      "details": "Additional details like GPA, honors"
+    }
+  ],
+  "projects": [
+    {
+      "name": "Project name",
+      "description": "Project description",
+      "technologies": ["Technologies", "used"]
+    }
+  ],
+  "certifications": ["List of certifications"],
+  "languages": ["List of languages"],
+  "key_achievements": ["Notable achievements with quantified results"]
+}
+
+IMPORTANT:
+- Return ONLY the JSON object, no explanations
+- Use actual data from the resume text
+- If information is not available, use empty string or empty array
+- Ensure all JSON is properly formatted and valid"""
+
+# ENHANCED_NLP_SYSTEM_PROMPT with contact_info reduced to location, used when name/email/phone were
+# matched locally (location is not reliably matchable without the model)
+ENHANCED_NLP_SECTIONS_SYSTEM_PROMPT = ENHANCED_NLP_SYSTEM_PROMPT.replace("""  "contact_info": {
+    "name": "Full name of candidate",
+    "email": "Email address",
+    "phone": "Phone number",
+    "location": "Current location",
+    "linkedin": "LinkedIn profile URL if present"
+  },
+""", """  "location": "Current location",
+""")
+
+# User message paired with the enhanced system prompts
+ENHANCED_NLP_USER_PROMPT = """Resume Text:
+{limited_text}"""
+
+# Concise contact_cluster/sections schema
+FAST_PROMPT = """You are a resume parser. Extract information from this resume text and return ONLY valid JSON.
+
+Resume Text:
+{limited_text}
+
+Return this exact JSON structure (fill with actual data from the resume):
+{{
+  "prompt_passed": true,
+  "contact_cluster": {{
+    "name_text": {{"value": "CANDIDATE_NAME_HERE", "confidence": 0.9}},
+    "email_texts": {{"values": ["email@example.com"], "confidence": 0.9}},
+    "phone_texts": {{"values": ["+1234567890"], "confidence": 0.9}},
+    "location_text": {{"value": "City, State", "confidence": 0.8}}
+  }},
+  "sections": {{
+    "summary": "Professional summary from resume",
+    "skills_like": "List of technical skills and technologies",
+    "experience_like": "Work experience details",
+    "education_like": "Education background"
+  }},
+  "semantic_highlights": [
+    {{"label": "key_skill", "verbatim": "Important skill or technology", "confidence": 0.8}}
+  ],
+  "quality": {{"coverage_ratio": 0.85}}
+}}
+
+IMPORTANT: Return ONLY the JSON object. No explanations, no markdown, no extra text."""
+
+
+# Pre-split (head, tail) forms of the single-placeholder templates
+BASIC_STRUCTURED_PROMPT_PARTS = _split_on_text(BASIC_STRUCTURED_PROMPT)
+MINIMAL_JSON_PROMPT_PARTS = _split_on_text(MINIMAL_JSON_PROMPT)
+ULTRA_SIMPLE_PROMPT_PARTS = _split_on_text(ULTRA_SIMPLE_PROMPT)
+ENHANCED_NLP_USER_PROMPT_PARTS = _split_on_text(ENHANCED_NLP_USER_PROMPT)
+FAST_PROMPT_PARTS = _split_on_text(FAST_PROMPT)
+
+# Pre-parsed segments of the multi-placeholder templates
+UNIVERSAL_PROMPT_SEGMENTS = _parse_segments(UNIVERSAL_PROMPT)
@@ -0,0 +1,100 @@
+"""
+Token-bucket rate limiting for parser LLM calls.
+Paces requests and tokens against the provider's per-minute limits so batches can run
+wide without tripping 429s, and follows the provider's x-ratelimit-remaining-* headers.
+Limits of 0 disable the corresponding bucket.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from typing import Any, Mapping, Optional
+
+
+class TokenBucketRateLimiter:
+    """Two refilling buckets (requests and tokens per minute); acquire() waits until both have room"""
+
+    def __init__(self, requests_per_min: int = 0, tokens_per_min: int = 0) -> None:
+        self.requests_per_min = max(int(requests_per_min or 0), 0)
+        self.tokens_per_min = max(int(tokens_per_min or 0), 0)
+        self._requests = float(self.requests_per_min)
+        self._tokens = float(self.tokens_per_min)
+        self._updated = time.monotonic()
+        # asyncio.Lock binds to one loop and Celery runs a loop per task, so each loop gets its own
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.requests_per_min or self.tokens_per_min)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed, self._updated = now - self._updated, now
+        if self.requests_per_min:
+            self._requests = min(self.requests_per_min, self._requests + elapsed * self.requests_per_min / 60)
+        if self.tokens_per_min:
+            self._tokens = min(self.tokens_per_min, self._tokens + elapsed * self.tokens_per_min / 60)
+
+    def _wait_seconds(self, est_tokens: int) -> float:
+        """Seconds until both buckets can cover one request of est_tokens (0 when they already can)"""
+        wait = 0.0
+        if self.requests_per_min and self._requests < 1:
+            wait = (1 - self._requests) * 60 / self.requests_per_min
+        if self.tokens_per_min and self._tokens < est_tokens:
+            wait = max(wait, (est_tokens - self._tokens) * 60 / self.tokens_per_min)
+        return wait
+
+    async def acquire(self, est_tokens: int = 0) -> None:
+        if not self.enabled:
+            return
+        # A request larger than the whole bucket would otherwise wait forever
+        est_tokens = min(max(int(est_tokens), 0), self.tokens_per_min) if self.tokens_per_min else 0
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        # Waiters queue on the lock, so capacity is handed out in arrival order
+        async with lock:
+            self._refill()
+            wait = self._wait_seconds(est_tokens)
+            while wait > 0:
+                await asyncio.sleep(wait)
+                self._refill()
+                wait = self._wait_seconds(est_tokens)
+            if self.requests_per_min:
+                self._requests -= 1
+            if self.tokens_per_min:
+                self._tokens -= est_tokens
+
+    def update_from_headers(self, headers: Optional[Mapping[str, Any]]) -> None:
+        """Never assume more capacity than the provider reports as remaining"""
+        if not self.enabled or not headers:
+            return
+        self._refill()
+        for header, attr, limit in (
+            ("x-ratelimit-remaining-requests", "_requests", self.requests_per_min),
+            ("x-ratelimit-remaining-tokens", "_tokens", self.tokens_per_min),
+        ):
+            if not limit:
+                continue
+            try:
+                remaining = float(headers.get(header))
+            except (TypeError, ValueError):
+                continue
+            setattr(self, attr, min(getattr(self, attr), remaining))
+
+
+# Shared per process: every parser instance draws on the same provider quota
+_limiter_singleton: Optional[TokenBucketRateLimiter] = None
+
+
+def get_llm_rate_limiter() -> TokenBucketRateLimiter:
+    global _limiter_singleton
+    if _limiter_singleton is None:
+        from app.core.config import settings  # local import to avoid hard dependency at import time
+        _limiter_singleton = TokenBucketRateLimiter(
+            requests_per_min=int(getattr(settings, "LLM_REQUESTS_PER_MIN", 0) or 0),
+            tokens_per_min=int(getattr(settings, "LLM_TOKENS_PER_MIN", 0) or 0),
+        )
+    return _limiter_singleton
@@ -70,6 +70,72 @@ PARSED_RESUME_SCHEMA: Dict[str, Any] = {
 }
 
 
+
+def _strict_object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    # Strict structured outputs require every property to be listed as required
+    return {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": properties,
+        "required": list(properties),
+    }
+
+
+_STRING_LIST: Dict[str, Any] = {"type": "array", "items": {"type": "string"}}
+
+# Shape of the ENHANCED_NLP_SYSTEM_PROMPT answer, enforced server-side via response_format
+LLM_RESUME_SECTIONS: Dict[str, Any] = {
+    "prompt_passed": {"type": "boolean"},
+    "professional_summary": {"type": "string"},
+    "skills": _STRING_LIST,
+    "experience": {"type": "array", "items": _strict_object({
+        "title": {"type": "string"},
+        "company": {"type": "string"},
+        "duration": {"type": "string"},
+        "description": {"type": "string"},
+        "technologies": _STRING_LIST,
+    })},
+    "education": {"type": "array", "items": _strict_object({
+        "degree": {"type": "string"},
+        "institution": {"type": "string"},
+        "year": {"type": "string"},
+        "details": {"type": "string"},
+    })},
+    "projects": {"type": "array", "items": _strict_object({
+        "name": {"type": "string"},
+        "description": {"type": "string"},
+        "technologies": _STRING_LIST,
+    })},
+    "certifications": _STRING_LIST,
+    "languages": _STRING_LIST,
+    "key_achievements": _STRING_LIST,
+}
+
+LLM_RESUME_CONTACT: Dict[str, Any] = _strict_object({
+    "name": {"type": "string"},
+    "email": {"type": "string"},
+    "phone": {"type": "string"},
+    "location": {"type": "string"},
+    "linkedin": {"type": "string"},
+})
+
+LLM_RESUME_JSON_SCHEMA: Dict[str, Any] = _strict_object({"contact_info": LLM_RESUME_CONTACT, **LLM_RESUME_SECTIONS})
+
+# Used when contact fields were matched locally and the prompt omits contact_info; location still comes from the model
+LLM_RESUME_SECTIONS_JSON_SCHEMA: Dict[str, Any] = _strict_object({"location": {"type": "string"}, **LLM_RESUME_SECTIONS})
+
+# For OpenAI response_format usage
+LLM_RESUME_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {"name": "ParsedResume", "schema": LLM_RESUME_JSON_SCHEMA, "strict": True},
+}
+
+LLM_RESUME_SECTIONS_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {"name": "ParsedResumeSections", "schema": LLM_RESUME_SECTIONS_JSON_SCHEMA, "strict": True},
+}
+
+
 def validate_parsed_resume(obj: Dict[str, Any]) -> tuple[bool, list[str]]:
     """Validate parsed resume; return (ok, warnings). Avoid raising; return error messages as warnings."""
     try:
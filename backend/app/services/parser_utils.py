@@ -1,12 +1,38 @@
 """
-Utilities for domain-agnostic resume parsing: PII masking, date parsing, tenure.
+Utilities for domain-agnostic resume parsing: PII masking, date parsing, tenure,
+JSON encoding, the process pool shared by the parsers for CPU-bound work, and the
+keep-alive HTTP pool shared by their LLM clients.
 """
 from __future__ import annotations
 
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import re
+import zlib
+
+from loguru import logger
+
+try:
+    import orjson  # native encoder/decoder, several times faster than the stdlib on parse payloads
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+try:
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover
+    httpx = None  # type: ignore
 
 _MONTHS = {
     "jan": 1,
@@ -115,3 +141,155 @@ def is_probable_location(token: str) -> bool:
         return True
     return False
 
+
+def json_loads(data: Any) -> Any:
+    """Decode JSON from str or bytes; orjson's JSONDecodeError subclasses json.JSONDecodeError"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumpb(obj: Any) -> bytes:
+    """Encode to UTF-8 JSON bytes; non-JSON values (datetimes, ObjectIds) fall back to str()"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def json_dumps(obj: Any) -> str:
+    return json_dumpb(obj).decode("utf-8")
+
+
+# In-process text caches hold compressed blobs: resume text is repetitive and compresses several-fold.
+# zstd when installed, else zlib; a process only ever reads its own blobs, so the codec never mixes.
+_zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard is not None else None
+_zstd_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+
+def compress_text(text: str) -> bytes:
+    data = text.encode("utf-8")
+    if _zstd_compressor is not None:
+        return _zstd_compressor.compress(data)
+    return zlib.compress(data, 3)
+
+
+def decompress_text(blob: bytes) -> str:
+    if _zstd_decompressor is not None:
+        return _zstd_decompressor.decompress(blob).decode("utf-8")
+    return zlib.decompress(blob).decode("utf-8")
+
+
+# Shared process pool. pdfplumber/PyPDF2/python-docx and the rule-based extractors are
+# pure Python and hold the GIL, so asyncio alone gives no parallelism for them.
+_process_pool: Optional[ProcessPoolExecutor] = None
+# Dedicated threads for when no process pool is usable, so blocking parses cannot
+# exhaust the loop's default executor that file and DB helpers also rely on
+_thread_pool: Optional[ThreadPoolExecutor] = None
+# Set inside pool workers: work they hand to run_in_parser_pool stays in-process instead of
+# starting a nested pool per worker
+_in_pool_worker = False
+
+
+def _mark_pool_worker() -> None:
+    global _in_pool_worker
+    _in_pool_worker = True
+
+
+_DEFAULT_POOL_WORKERS = 2
+
+
+def parser_pool_size() -> int:
+    try:
+        from app.core.config import settings  # local import to avoid hard dependency at import time
+        workers = int(getattr(settings, "PARSER_PROCESS_WORKERS", 0) or 0)
+    except Exception:
+        workers = 0
+    # Every API/Celery process owns a pool, and gunicorn alone runs cpu_count * 2 + 1 of them, so the
+    # default stays small; give dedicated parsing hosts more via PARSER_PROCESS_WORKERS
+    return workers or min(_DEFAULT_POOL_WORKERS, os.cpu_count() or 1)
+
+
+def get_parser_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        # Never fork: the API and Celery processes already run Motor/Redis threads and event loops, and a
+        # forked child can inherit their locks held. forkserver children start from a clean process
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _process_pool = ProcessPoolExecutor(max_workers=parser_pool_size(), initializer=_mark_pool_worker,
+                                            mp_context=multiprocessing.get_context(start_method))
+    return _process_pool
+
+
+def get_parser_thread_pool() -> ThreadPoolExecutor:
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(max_workers=parser_pool_size(), thread_name_prefix="parser")
+    return _thread_pool
+
+
+def reset_parser_pool() -> None:
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+    _process_pool = None
+
+
+async def run_in_parser_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a module-level (picklable) function in the shared pool; falls back to a thread when no pool is usable"""
+    loop = asyncio.get_running_loop()
+    # Daemonic processes (e.g. Celery prefork workers) are not allowed to start children
+    if _in_pool_worker or multiprocessing.current_process().daemon:
+        return await loop.run_in_executor(get_parser_thread_pool(), fn, *args)
+
+    try:
+        future = loop.run_in_executor(get_parser_pool(), fn, *args)
+    except Exception as e:
+        logger.warning(f"[parser.pool] process pool could not start, running in-process: {e}")
+        return await loop.run_in_executor(get_parser_thread_pool(), fn, *args)
+    try:
+        return await future
+    except BrokenProcessPool as e:
+        logger.warning(f"[parser.pool] process pool unavailable, running in-process: {e}")
+        reset_parser_pool()
+        return await loop.run_in_executor(get_parser_thread_pool(), fn, *args)
+
+
+# One keep-alive pool for the parsers' LLM clients on the API's event loop, so parser instances created
+# per request reuse TCP/TLS connections. Only a loop that lives as long as the process opts in (the
+# FastAPI lifespan): Celery tasks run a fresh loop per task, and a pool parked on each of those would
+# keep the loop and its sockets alive after the task. Parsers elsewhere get None and the SDK's own client.
+_shared_http_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_http_client: Optional[Any] = None
+
+
+def enable_shared_llm_http_client() -> None:
+    """Share one LLM connection pool on the running loop; call from a long-lived loop's startup"""
+    global _shared_http_loop
+    _shared_http_loop = asyncio.get_running_loop()
+
+
+def get_llm_http_client(timeout: float) -> Optional["httpx.AsyncClient"]:
+    """Shared AsyncClient on the opted-in loop; None elsewhere (or without httpx) leaves the SDK its own"""
+    global _shared_http_client
+    if httpx is None or _shared_http_loop is None:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    if loop is not _shared_http_loop:
+        return None
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=httpx.Timeout(timeout, connect=5.0),
+        )
+    return _shared_http_client
+
+
+async def close_llm_http_client() -> None:
+    """Close the shared pool at app shutdown, once no parser will call the LLM again"""
+    global _shared_http_loop, _shared_http_client
+    client, _shared_http_client, _shared_http_loop = _shared_http_client, None, None
+    if client is not None:
+        await client.aclose()
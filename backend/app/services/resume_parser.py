@@ -2,16 +2,17 @@
 Resume parsing service using PDFPlumber and other libraries
 """
 
+import asyncio
+import io
 import os
 import re
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import aiofiles
-import pdfplumber
-import PyPDF2
-from docx import Document
-
+# Text past this point (publications, references) rarely carries resume signal, and the
+# rule-based segmentation and mining passes scale with text length
+_PDF_TEXT_LIMIT_CHARS = 20_000
 
 
 class ResumeParser:
@@ -19,6 +20,11 @@ class ResumeParser:
 
     def __init__(self):
         self.supported_formats = [".pdf", ".docx", ".doc", ".txt"]
+        try:
+            from app.core.config import settings  # local import to avoid hard dependency at import time
+            self.max_pdf_pages = int(getattr(settings, "PARSER_MAX_PDF_PAGES", 8) or 0)
+        except Exception:
+            self.max_pdf_pages = 8
 
         # Common patterns for extracting information
         self.email_pattern = re.compile(
@@ -317,7 +323,8 @@ class ResumeParser:
 
                 # Ensure compatibility with existing format
                 if result and isinstance(result, dict):
-                    result["parsed_at"] = datetime.now(timezone.utc).isoformat()
+                    # The LLM parser already stamps parsed_at once per parse; keep its timestamp
+                    result.setdefault("parsed_at", datetime.now(timezone.utc).isoformat())
                     result["processing_mode"] = "nlp_first"
                     return result
                 else:
@@ -375,48 +382,19 @@ class ResumeParser:
         """
         Extract text from PDF file content in memory (faster)
         """
-        try:
-            # Try PDFPlumber first (most reliable)
-            import io
-            with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-                text_parts = []
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-
-                if text_parts:
-                    return "\n".join(text_parts)
-        except Exception as e:
-            print(f"PDFPlumber failed for memory content: {e}")
-
-        # Fallback to PyPDF2
-        try:
-            import io
-            from PyPDF2 import PdfReader
-
-            pdf_reader = PdfReader(io.BytesIO(file_content))
-            text_parts = []
-
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-
-            if text_parts:
-                return "\n".join(text_parts)
-        except Exception as e:
-            print(f"PyPDF2 failed for memory content: {e}")
-
-        print("Warning: Could not extract text from PDF memory content, returning empty string")
-        return ""
+        text = await self._run_pdf_extraction(file_content)
+        if not text:
+            print("Warning: Could not extract text from PDF memory content, returning empty string")
+        return text
 
     async def _extract_docx_text_from_memory(self, file_content: bytes) -> str:
         """
         Extract text from DOCX file content in memory (faster)
         """
+        return await asyncio.to_thread(self._extract_docx_text_from_memory_sync, file_content)
+
+    def _extract_docx_text_from_memory_sync(self, file_content: bytes) -> str:
         try:
-            import io
             from docx import Document
 
             doc = Document(io.BytesIO(file_content))
@@ -433,56 +411,34 @@ class ResumeParser:
 
     async def _extract_pdf_text(self, file_path: str) -> str:
         """Extract text from PDF using multiple methods"""
-        text = ""
+        text = await self._run_pdf_extraction(file_path)
+        if not text:
+            print(f"Warning: Could not extract text from PDF {file_path}, returning empty string")
+        return text
 
-        # Method 1: Try PDFPlumber first (best for complex layouts)
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            if text.strip():
-                return text.strip()
-        except Exception as e:
-            print(f"PDFPlumber failed for {file_path}: {str(e)}")
+    async def _run_pdf_extraction(self, source) -> str:
+        """Run the LLM parser's PDF engine cascade (PyMuPDF when enabled, then PDFium, with pdfplumber and
+        PyPDF2 only as fallbacks) in the shared parser pool, off the event loop; multi-page
+        documents are read as page ranges in parallel"""
+        from app.services.llm_resume_parser import extract_pdf_pages
 
-        # Method 2: Fallback to PyPDF2
         try:
-            with open(file_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            if text.strip():
-                return text.strip()
+            return await extract_pdf_pages(source, _PDF_TEXT_LIMIT_CHARS, self.max_pdf_pages)
         except Exception as e:
-            print(f"PyPDF2 failed for {file_path}: {str(e)}")
-
-        # Method 3: Try with different PyPDF2 settings
-        try:
-            with open(file_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file, strict=False)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            if text.strip():
-                return text.strip()
-        except Exception as e:
-            print(f"PyPDF2 (non-strict) failed for {file_path}: {str(e)}")
-
-        # If all methods fail, return empty string instead of raising exception
-        print(f"Warning: Could not extract text from PDF {file_path}, returning empty string")
-        return ""
+            print(f"PDF extraction failed: {e}")
+            return ""
 
     async def _extract_docx_text(self, file_path: str) -> str:
         """Extract text from DOCX file with improved error handling"""
+        # Open, read and parse cross to a worker thread once, keeping python-docx off the event loop
+        return await asyncio.to_thread(self._extract_docx_text_sync, file_path)
+
+    def _extract_docx_text_sync(self, file_path: str) -> str:
         text = ""
 
         try:
+            from docx import Document  # imported on first DOCX so PDF/TXT-only workers never load python-docx/lxml
+
             doc = Document(file_path)
 
             # Extract text from paragraphs
@@ -512,13 +468,19 @@ class ResumeParser:
     async def _extract_txt_text(self, file_path: str) -> str:
         """Extract text from TXT file"""
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as file:
-                text = await file.read()
+            # One thread hop for the whole read; aiofiles dispatched open and read separately
+            # errors="replace": one stray byte (e.g. a Latin-1 export) should not lose the whole resume
+            text = await asyncio.to_thread(Path(file_path).read_text, encoding="utf-8", errors="replace")
             return text.strip()
         except Exception as e:  # noqa: E722
             raise Exception(f"Failed to extract TXT text: {str(e)}")
 
     async def _parse_text_content(self, text: str, fast_mode: bool = False) -> Dict[str, Any]:
+        """Parse structured data from resume text in the shared process pool (CPU-bound regex/spaCy work)"""
+        from app.services.parser_utils import run_in_parser_pool
+        return await run_in_parser_pool(_parse_text_content_sync, text, fast_mode)
+
+    def _parse_text_content_sync(self, text: str, fast_mode: bool = False) -> Dict[str, Any]:
         """Parse structured data from resume text"""
         import time
 
@@ -978,3 +940,14 @@ class ResumeParser:
             projects.append(current_project)
 
         return projects
+
+
+# Parser reused by pool workers for the rule-based text pass
+_worker_parser: Optional[ResumeParser] = None
+
+
+def _parse_text_content_sync(text: str, fast_mode: bool) -> Dict[str, Any]:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ResumeParser()
+    return _worker_parser._parse_text_content_sync(text, fast_mode)
@@ -6,6 +6,8 @@ bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
 backlog = 2048
 
 # Worker processes
+# Each worker also starts its own parser process pool on first parse (PARSER_PROCESS_WORKERS, default 2),
+# so a host runs up to workers * (1 + PARSER_PROCESS_WORKERS) processes; keep the product within the host's cores
 workers = multiprocessing.cpu_count() * 2 + 1
 worker_class = "uvicorn.workers.UvicornWorker"
 worker_connections = 1000
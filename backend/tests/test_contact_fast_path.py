@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from app.services import llm_resume_parser
+from app.services.llm_resume_parser import LLMResumeParser, _guess_name
+
+CONTACT = "jane.doe@example.com | +1 (555) 123-4567 | linkedin.com/in/janedoe\n"
+
+
+@pytest.fixture
+def parser():
+    p = LLMResumeParser()
+    p.contact_fast_path = True
+    p.enable_ner = False
+    return p
+
+
+@pytest.mark.parametrize("first_line", ["Curriculum Vitae", "Software Engineer", "Resume Of John", "Senior Data Analyst"])
+def test_titles_are_not_names(first_line):
+    assert _guess_name(f"{first_line}\n{CONTACT}", use_ner=False) is None
+
+
+def test_section_headings_are_not_names():
+    provider = mock.Mock()
+    provider.get_heading_index.return_value = {"work experience": "experience"}
+    with mock.patch.object(llm_resume_parser, "get_parser_config_provider", return_value=provider):
+        assert _guess_name(f"Work Experience\n{CONTACT}", use_ner=False) is None
+        assert _guess_name(f"Jane Doe\n{CONTACT}", use_ner=False) == "Jane Doe"
+
+
+def test_fast_path_matches_contact_details(parser):
+    contact = asyncio.run(parser._extract_contact_fast(f"Jane Doe\n{CONTACT}Experience\n2019 - 2021 Acme"))
+    assert contact == {
+        "name": "Jane Doe",
+        "email": "jane.doe@example.com",
+        "phone": "+1 (555) 123-4567",
+        "location": "",
+        "linkedin": "linkedin.com/in/janedoe",
+    }
+
+
+def test_fast_path_declines_without_a_name(parser):
+    assert asyncio.run(parser._extract_contact_fast(f"Curriculum Vitae\n{CONTACT}")) is None
+
+
+def test_fast_path_ignores_date_ranges_as_phones(parser):
+    assert asyncio.run(parser._extract_contact_fast("Jane Doe\njane.doe@example.com\n2019 - 2021")) is None
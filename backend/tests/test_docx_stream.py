@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+docx = pytest.importorskip("docx")
+pytest.importorskip("lxml")
+
+from docx.enum.text import WD_BREAK
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from app.services.llm_resume_parser import _collect_docx_text, _docx_stream_text
+
+
+def _append(run, tag):
+    run._r.append(OxmlElement(tag))
+
+
+def build_resume() -> bytes:
+    doc = docx.Document()
+    doc.add_paragraph("Jane Doe")
+    doc.add_paragraph("")
+    contact = doc.add_paragraph("jane@example.com")
+    run = contact.add_run()
+    _append(run, "w:tab")
+    run.add_text("+1 555 123 4567")
+    _append(run, "w:ptab")
+    run.add_text("Pune")
+
+    dates = doc.add_paragraph().add_run("2019")
+    _append(dates, "w:noBreakHyphen")
+    dates.add_text("2021")
+    _append(dates, "w:cr")
+    dates.add_text("Acme")
+    dates.add_break()
+    dates.add_text("Backend engineer")
+    dates.add_break(WD_BREAK.PAGE)
+    dates.add_text("Python")
+
+    # A hyperlink's runs count towards the paragraph text
+    link_par = doc.add_paragraph("Profile: ")
+    hyperlink = OxmlElement("w:hyperlink")
+    hyperlink.set(qn("r:id"), "rId99")
+    link_run = OxmlElement("w:r")
+    link_text = OxmlElement("w:t")
+    link_text.text = "linkedin.com/in/janedoe"
+    link_run.append(link_text)
+    hyperlink.append(link_run)
+    link_par._p.append(hyperlink)
+
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Skill"
+    table.cell(0, 1).text = "Years"
+    table.cell(1, 0).text = "Python"
+    table.cell(1, 1).paragraphs[0].add_run("5").add_break()
+    doc.add_paragraph("Education")
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("include_tables", [True, False])
+def test_stream_text_matches_python_docx(include_tables):
+    content = build_resume()
+    expected = _collect_docx_text(docx.Document(io.BytesIO(content)), 10_000, include_tables)
+    assert _docx_stream_text(content, 10_000, include_tables) == expected
+    assert "2019-2021" in expected and "+1 555 123 4567\tPune" in expected
+
+
+def test_stream_text_stops_at_budget():
+    content = build_resume()
+    assert _docx_stream_text(content, 5, True) == "Jane Doe"
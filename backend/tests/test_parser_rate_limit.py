@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services import parser_rate_limit
+from app.services.parser_rate_limit import TokenBucketRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; asyncio.sleep advances it instead of waiting"""
+    now = [1000.0]
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(parser_rate_limit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(parser_rate_limit.asyncio, "sleep", fake_sleep)
+    return sleeps
+
+
+def test_disabled_limiter_never_waits(clock):
+    limiter = TokenBucketRateLimiter()
+    assert not limiter.enabled
+    asyncio.run(limiter.acquire(10_000))
+    assert clock == []
+
+
+def test_requests_are_paced_once_bucket_is_empty(clock):
+    limiter = TokenBucketRateLimiter(requests_per_min=2)
+
+    async def run():
+        for _ in range(3):
+            await limiter.acquire()
+
+    asyncio.run(run())
+    # Two requests fit in the full bucket; the third waits for one request's refill (60s / 2)
+    assert clock == [pytest.approx(30.0)]
+
+
+def test_tokens_are_paced_and_oversized_requests_are_capped(clock):
+    limiter = TokenBucketRateLimiter(tokens_per_min=600)
+
+    async def run():
+        await limiter.acquire(600)
+        await limiter.acquire(5_000)
+
+    asyncio.run(run())
+    # The second request is capped at the bucket size, so it waits one full minute rather than forever
+    assert clock == [pytest.approx(60.0)]
+
+
+def test_headers_clamp_remaining_capacity(clock):
+    limiter = TokenBucketRateLimiter(requests_per_min=100, tokens_per_min=1000)
+    limiter.update_from_headers({"x-ratelimit-remaining-requests": "3", "x-ratelimit-remaining-tokens": "250"})
+    assert limiter._requests == pytest.approx(3)
+    assert limiter._tokens == pytest.approx(250)
+
+
+def test_headers_never_raise_capacity(clock):
+    limiter = TokenBucketRateLimiter(requests_per_min=100, tokens_per_min=1000)
+    limiter.update_from_headers({"x-ratelimit-remaining-requests": "500", "x-ratelimit-remaining-tokens": "bogus"})
+    assert limiter._requests == pytest.approx(100)
+    assert limiter._tokens == pytest.approx(1000)
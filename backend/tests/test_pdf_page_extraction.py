@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from app.services import llm_resume_parser
+from app.services.llm_resume_parser import extract_pdf_pages
+
+
+def fake_pool(pages):
+    """Stand-in for run_in_parser_pool over a document whose page texts are given; records each range read"""
+    calls = []
+
+    async def run(fn, source, max_chars, start, stop):
+        calls.append((start, stop))
+        text = "\n".join(page for page in pages[start:stop] if page)
+        return text[:max_chars], len(pages)
+
+    return run, calls
+
+
+@pytest.fixture
+def pool_size():
+    with mock.patch.object(llm_resume_parser, "parser_pool_size", return_value=2):
+        yield
+
+
+def extract(pages, max_chars=10_000, max_pages=0):
+    run, calls = fake_pool(pages)
+    with mock.patch.object(llm_resume_parser, "run_in_parser_pool", run):
+        text = asyncio.run(extract_pdf_pages(b"%PDF-", max_chars, max_pages))
+    return text, calls
+
+
+def test_text_documents_fan_out_after_the_head_pages(pool_size):
+    text, calls = extract(["Jane Doe", "Skills", "Acme", "Globex", "Initech", "Hooli"])
+    assert text == "Jane Doe\nSkills\nAcme\nGlobex\nInitech\nHooli"
+    assert calls == [(0, 2), (2, 4), (4, 6)]
+
+
+def test_empty_head_pages_do_not_end_extraction(pool_size):
+    text, calls = extract(["", "", "Jane Doe", "Python"])
+    assert text == "Jane Doe\nPython"
+    # The rest is read in a single task rather than across the pool
+    assert calls == [(0, 2), (2, 4)]
+
+
+def test_scanned_documents_read_the_rest_in_one_task(pool_size):
+    text, calls = extract([""] * 10)
+    assert text == ""
+    assert calls == [(0, 2), (2, 10)]
+
+
+def test_max_pages_limits_the_scan(pool_size):
+    text, calls = extract(["", "", "Jane Doe", "Python"], max_pages=3)
+    assert text == "Jane Doe"
+    assert calls == [(0, 2), (2, 3)]
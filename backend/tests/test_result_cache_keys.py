@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from app.services import llm_resume_parser
+from app.services.llm_resume_parser import LLMResumeParser
+from app.services.parser_cache import result_cache_key
+
+RESUME = b"Jane Doe\nBackend engineer\nPython, FastAPI, PostgreSQL\n"
+
+
+@pytest.fixture
+def parser():
+    p = LLMResumeParser()
+    # Stand in for an initialised client so the result caches are consulted
+    p.llm_client = object()
+    p.model = "gpt-4o-mini"
+    p.result_cache_ttl = 3600
+    p.fast_mode = True
+    p.strict_json_schema = True
+    p.contact_fast_path = False
+    p.rule_fast_path = False
+    return p
+
+
+@pytest.fixture
+def llm():
+    """Empty content cache, a Redis miss, and a stubbed LLM parse; yields the mocks"""
+    if llm_resume_parser._CONTENT_RESULT_CACHE is None:
+        pytest.skip("cachetools not installed")
+    llm_resume_parser._CONTENT_RESULT_CACHE.clear()
+    parsed = {"name": "Jane Doe", "processing_mode": "llm_universal"}
+    with mock.patch.object(llm_resume_parser, "get_cached_result", mock.AsyncMock(return_value=None)) as get, \
+            mock.patch.object(llm_resume_parser, "set_cached_result", mock.AsyncMock()) as put, \
+            mock.patch.object(LLMResumeParser, "_parse_with_llm", mock.AsyncMock(side_effect=lambda *a: dict(parsed))) as parse:
+        yield get, put, parse
+    llm_resume_parser._CONTENT_RESULT_CACHE.clear()
+
+
+def test_redis_key_ignores_whitespace_layout():
+    assert result_cache_key("Jane  Doe\n\nPython ", "v1") == result_cache_key("Jane Doe Python", "v1")
+    assert result_cache_key("Jane Doe Python", "v1") != result_cache_key("Jane Doe Python", "v2")
+
+
+@pytest.mark.parametrize("attr, value", [
+    ("model", "another-model"),
+    ("fast_mode", False),
+    ("text_limit", 12_000),
+    ("max_input_tokens", 3_000),
+    ("contact_fast_path", True),
+    ("strict_json_schema", False),
+    ("max_skills", 40),
+])
+def test_every_parse_setting_is_part_of_the_key(parser, attr, value):
+    before = parser._result_cache_params()
+    setattr(parser, attr, value)
+    assert parser._result_cache_params() != before
+
+
+def test_redis_and_content_caches_share_the_key_inputs(parser, llm):
+    get, put, parse = llm
+    asyncio.run(parser.parse_resume_from_memory(RESUME, "cv.txt", ".txt"))
+    params = ":".join(str(p) for p in parser._result_cache_params())
+    redis_key = get.await_args.args[0]
+    assert redis_key.startswith(f"parser:result:{params}:")
+    assert put.await_args.args[0] == redis_key
+    assert parse.await_count == 1
+
+
+def test_content_cache_serves_repeat_uploads_only_under_the_same_settings(parser, llm):
+    _, _, parse = llm
+    asyncio.run(parser.parse_resume_from_memory(RESUME, "cv.txt", ".txt"))
+    asyncio.run(parser.parse_resume_from_memory(RESUME, "cv-copy.txt", ".txt"))
+    assert parse.await_count == 1
+
+    parser.strict_json_schema = not parser.strict_json_schema
+    asyncio.run(parser.parse_resume_from_memory(RESUME, "cv.txt", ".txt"))
+    assert parse.await_count == 2
+
+
+def test_degraded_parses_are_not_cached(parser, llm):
+    _, put, parse = llm
+    parse.side_effect = lambda *a: {"name": "Jane Doe", "processing_mode": "nlp_retry_basic"}
+    asyncio.run(parser.parse_resume_from_memory(RESUME, "cv.txt", ".txt"))
+    asyncio.run(parser.parse_resume_from_memory(RESUME, "cv.txt", ".txt"))
+    assert parse.await_count == 2
+    put.assert_not_awaited()